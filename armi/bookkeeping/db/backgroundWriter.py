@@ -0,0 +1,100 @@
+# Copyright 2026 TerraPower, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Write database time nodes on a background thread.
+
+Writing a time node has two parts: collecting the reactor state into arrays
+(:py:meth:`Database.snapshot <armi.bookkeeping.db.database.Database.snapshot>`), which must happen before the reactor
+changes, and the HDF5 I/O and compression
+(:py:meth:`Database.writeSnapshot <armi.bookkeeping.db.database.Database.writeSnapshot>`), which does not need the
+reactor at all. The :py:class:`BackgroundWriter` does the second part on its own thread so the operator can move on to
+the next interface.
+
+The queue of snapshots is bounded, so a run that produces snapshots faster than they can be written waits rather than
+piling up copies of the reactor state in memory. Anything that reads or copies the database file must call
+:py:meth:`BackgroundWriter.flush` first.
+"""
+
+import queue
+import threading
+
+from armi import runLog
+from armi.bookkeeping.db.database import Database, TimeNodeSnapshot
+
+
+class BackgroundWriter:
+    """
+    Writes database snapshots on a dedicated thread.
+
+    Parameters
+    ----------
+    db : Database
+        An open database to write to. While the writer is running, nothing else should write to it.
+    maxQueued : int
+        The maximum number of snapshots waiting to be written. :py:meth:`submit` blocks while the queue is full.
+    """
+
+    def __init__(self, db: Database, maxQueued: int = 1):
+        self._db = db
+        self._queue = queue.Queue(maxsize=maxQueued)
+        self._error = None
+        self._thread = threading.Thread(target=self._run, name="armiDatabaseWriter", daemon=True)
+        self._thread.start()
+
+    def __repr__(self):
+        return "<{} {} queued>".format(self.__class__.__name__, self._queue.qsize())
+
+    @property
+    def isAlive(self) -> bool:
+        return self._thread.is_alive()
+
+    def _run(self):
+        while True:
+            snapshot = self._queue.get()
+            try:
+                if snapshot is None:
+                    return
+                if self._error is None:
+                    # after a failure, pending snapshots are dropped; the error is raised on the main thread
+                    self._db.writeSnapshot(snapshot)
+            except Exception as ee:
+                runLog.error(f"Background database write failed: {ee}")
+                self._error = ee
+            finally:
+                self._queue.task_done()
+
+    def _raiseError(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise RuntimeError("A background database write failed.") from error
+
+    def submit(self, snapshot: TimeNodeSnapshot):
+        """Queue a snapshot to be written, waiting for room in the queue if needed."""
+        self._raiseError()
+        if not self.isAlive:
+            raise RuntimeError("Cannot submit a snapshot to a database writer that has been stopped.")
+        self._queue.put(snapshot)
+
+    def flush(self):
+        """Wait until every submitted snapshot has been written, raising any error from the writes."""
+        self._queue.join()
+        self._raiseError()
+
+    def stop(self):
+        """Write any remaining snapshots, then stop the writer thread."""
+        if self.isAlive:
+            self._queue.put(None)
+            self._thread.join()
+        self._raiseError()
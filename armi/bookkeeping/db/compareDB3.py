@@ -47,8 +47,9 @@ the parameters are expected to be different. Specifically the following:
 import collections
 import os
 import re
+import time
 import traceback
-from typing import Optional, Pattern, Sequence, Tuple
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional, Pattern, Sequence, Tuple, Union
 
 import h5py
 import numpy as np
@@ -61,6 +62,9 @@ from armi.bookkeeping.db.permissions import Permissions
 from armi.reactor.composites import ArmiObject
 from armi.utils.tabulate import tabulate
 
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
 
 class OutputWriter:
     """Basically a tee to writeln to runLog and the output file."""
@@ -160,8 +164,37 @@ def compareDatabases(
     exclusions: Optional[Sequence[str]] = None,
     tolerance: float = 0.0,
     timestepCompare: Optional[Sequence[Tuple[int, int]]] = None,
+    processes: int = 1,
+    chunkRows: Optional[int] = None,
+    stopAtFirstDiff: bool = False,
+    reportTiming: bool = False,
 ) -> Optional[DiffResults]:
-    """High-level method to compare two ARMI H5 files, given file paths."""
+    """
+    High-level method to compare two ARMI H5 files, given file paths.
+
+    Parameters
+    ----------
+    refFileName : str
+        Path to the reference database.
+    srcFileName : str
+        Path to the database being compared against the reference.
+    exclusions : list of str, optional
+        Regular expressions matching the full names of parameters (e.g. ``/c00n00/HexBlock/flux``) not to compare.
+    tolerance : float, optional
+        Relative differences at or below this value are not reported.
+    timestepCompare : list of (cycle, node) tuples, optional
+        Only compare these time steps. By default, all time steps are compared.
+    processes : int, optional
+        The number of local processes that the comparison of individual parameters is spread over. With 1 (the
+        default), everything is compared in this process.
+    chunkRows : int, optional
+        If given, plain numeric datasets are read and compared this many rows at a time, so that large datasets are
+        never held in memory all at once.
+    stopAtFirstDiff : bool, optional
+        Stop comparing as soon as any difference is found. The differences found so far are still reported.
+    reportTiming : bool, optional
+        Write a table of the time spent comparing, and the stored size of, each parameter.
+    """
     compiledExclusions = None
     if exclusions is not None:
         compiledExclusions = [re.compile(ex) for ex in exclusions]
@@ -191,22 +224,56 @@ def compareDatabases(
                     )
                     return None
 
-            for refGroup, srcGroup in zip(
-                ref.genTimeStepGroups(timeSteps=timestepCompare),
-                src.genTimeStepGroups(timeSteps=timestepCompare),
-            ):
-                runLog.info(
-                    f"Comparing ref time step {refGroup.name.split('/')[1]} to src time "
-                    f"step {srcGroup.name.split('/')[1]}"
-                )
-                diffResults.addTimeStep(refGroup.name)
-                _compareTimeStep(out, refGroup, srcGroup, diffResults, exclusions=compiledExclusions)
+            timings = collections.defaultdict(lambda: [0, 0.0, 0])
+            with _ParamComparer(ref.h5db, src.h5db, processes, chunkRows) as comparer:
+                # plan every time step first, so that a process pool has all of the work queued up
+                plans = [
+                    (refGroup, srcGroup, _planTimeStep(refGroup, srcGroup, comparer, exclusions=compiledExclusions))
+                    for refGroup, srcGroup in zip(
+                        ref.genTimeStepGroups(timeSteps=timestepCompare),
+                        src.genTimeStepGroups(timeSteps=timestepCompare),
+                    )
+                ]
+
+                for refGroup, srcGroup, plan in plans:
+                    runLog.info(
+                        f"Comparing ref time step {refGroup.name.split('/')[1]} to src time "
+                        f"step {srcGroup.name.split('/')[1]}"
+                    )
+                    diffResults.addTimeStep(refGroup.name)
+                    for task in plan:
+                        result = comparer.result(task)
+                        result.recorder.replay(out, diffResults)
+                        if result.name is not None:
+                            timing = timings[result.name]
+                            timing[0] += 1
+                            timing[1] += result.seconds
+                            timing[2] += result.nBytes
+
+                        if stopAtFirstDiff and diffResults.nDiffs() > 0:
+                            out.writeln("Stopping the comparison at the first difference, in {}".format(refGroup.name))
+                            comparer.cancel()
+                            break
+                    else:
+                        continue
+                    break
 
         diffResults.reportDiffs(out)
+        if reportTiming:
+            _reportTimings(out, timings)
 
     return diffResults
 
 
+def _reportTimings(out: OutputWriter, timings: Dict[str, List]):
+    """Write a table of the time spent comparing each parameter, slowest first."""
+    rows = [
+        [name, count, "{:.3f}".format(seconds), "{:.3f}".format(nBytes / 1.0e6)]
+        for name, (count, seconds, nBytes) in sorted(timings.items(), key=lambda item: -item[1][1])
+    ]
+    out.writeln(tabulate(rows, headers=["Parameter", "Comparisons", "Time (s)", "Size (MB)"]))
+
+
 def _compareH5Groups(out: OutputWriter, ref: h5py.Group, src: h5py.Group, name: str) -> Tuple[Sequence[str], int]:
     refGroups = set(ref.keys())
     srcGroups = set(src.keys())
@@ -216,28 +283,215 @@ def _compareH5Groups(out: OutputWriter, ref: h5py.Group, src: h5py.Group, name:
     return sorted(refGroups & srcGroups), n
 
 
-def _compareTimeStep(
-    out: OutputWriter,
+class _Recorder:
+    """
+    Stands in for both the OutputWriter and the DiffResults while comparing one piece of a database.
+
+    The calls are recorded so they can be replayed, in order, into the real ones. This lets the pieces be compared
+    out of order, or in another process, while producing the same report as comparing them in sequence.
+    """
+
+    def __init__(self):
+        self.calls = []
+
+    def writeln(self, msg: str) -> None:
+        self.calls.append(("writeln", (msg,)))
+
+    def addDiff(self, compType: str, paramName: str, absMean: float, mean: float, absMax: float) -> None:
+        self.calls.append(("addDiff", (compType, paramName, absMean, mean, absMax)))
+
+    def addStructureDiffs(self, nDiffs: int) -> None:
+        self.calls.append(("addStructureDiffs", (nDiffs,)))
+
+    def replay(self, out: OutputWriter, diffResults: DiffResults):
+        for method, args in self.calls:
+            target = out if method == "writeln" else diffResults
+            getattr(target, method)(*args)
+
+
+class _TaskResult(NamedTuple):
+    """The recorded outcome of comparing one parameter or auxiliary group, with its name, cost and size."""
+
+    recorder: _Recorder
+    name: Optional[str] = None
+    seconds: float = 0.0
+    nBytes: int = 0
+
+
+_PARAM = "param"
+_AUX = "aux"
+
+# the files opened by each worker process of a _ParamComparer
+_workerFiles = None
+
+
+def _openWorkerFiles(refFileName: str, srcFileName: str):
+    global _workerFiles
+    _workerFiles = (h5py.File(refFileName, "r"), h5py.File(srcFileName, "r"))
+
+
+def _runWorkerTask(kind: str, objName: str, chunkRows: Optional[int]) -> _TaskResult:
+    refH5, srcH5 = _workerFiles
+    return _runTask(kind, refH5[objName], srcH5[objName], chunkRows)
+
+
+def _runTask(kind: str, refObj, srcObj, chunkRows: Optional[int]) -> _TaskResult:
+    """Compare one parameter dataset or auxiliary data group, recording the results."""
+    recorder = _Recorder()
+    start = time.perf_counter()
+    if kind == _AUX:
+        _compareAuxData(recorder, refObj, srcObj, recorder, chunkRows=chunkRows)
+        nBytes = _groupBytes(refObj) + _groupBytes(srcObj)
+    else:
+        _compareParam(recorder, refObj, srcObj, recorder, chunkRows=chunkRows)
+        nBytes = refObj.id.get_storage_size() + srcObj.id.get_storage_size()
+
+    # timings are grouped by the name within the time step, e.g. HexBlock/flux
+    return _TaskResult(recorder, refObj.name.split("/", 2)[-1], time.perf_counter() - start, nBytes)
+
+
+def _groupBytes(group: h5py.Group) -> int:
+    sizes = []
+
+    def visitor(_name, obj):
+        if isinstance(obj, h5py.Dataset):
+            sizes.append(obj.id.get_storage_size())
+
+    group.visititems(visitor)
+    return sum(sizes)
+
+
+class _ParamComparer:
+    """
+    Compares individual parameters and auxiliary data groups, either right here or on a local process pool.
+
+    Work is given out with :py:meth:`submit`, and the results collected, in any order, with :py:meth:`result`. With a
+    single process, nothing is compared until its result is asked for, so a comparison that stops early does not pay
+    for the rest.
+    """
+
+    def __init__(self, refH5: h5py.File, srcH5: h5py.File, processes: int = 1, chunkRows: Optional[int] = None):
+        self._refH5 = refH5
+        self._srcH5 = srcH5
+        self._chunkRows = chunkRows
+        self._pool = None
+        if processes > 1:
+            # imported here, since importing the process pool registers an exit hook in every process that imports armi
+            from concurrent.futures import ProcessPoolExecutor
+
+            self._pool = ProcessPoolExecutor(
+                max_workers=processes,
+                initializer=_openWorkerFiles,
+                initargs=(refH5.filename, srcH5.filename),
+            )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.cancel()
+
+    def submit(self, kind: str, objName: str) -> Union["Future", Tuple[str, str]]:
+        """Queue up the comparison of a dataset or group that has the same name in both files."""
+        if self._pool is not None:
+            return self._pool.submit(_runWorkerTask, kind, objName, self._chunkRows)
+        return (kind, objName)
+
+    def result(self, task) -> _TaskResult:
+        """Get the result of a queued comparison, or of an already-recorded one."""
+        if isinstance(task, _Recorder):
+            return _TaskResult(task)
+        if not isinstance(task, tuple):
+            # a future from the process pool
+            return task.result()
+        kind, objName = task
+        return _runTask(kind, self._refH5[objName], self._srcH5[objName], self._chunkRows)
+
+    def cancel(self):
+        """Drop any comparisons that have not started and shut down the process pool."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+
+
+def _planTimeStep(
     refGroup: h5py.Group,
     srcGroup: h5py.Group,
-    diffResults: DiffResults,
+    comparer: _ParamComparer,
     exclusions: Optional[Sequence[Pattern]] = None,
-):
-    groupNames, structDiffs = _compareH5Groups(out, refGroup, srcGroup, "composite objects/auxiliary data")
-    diffResults.addStructureDiffs(structDiffs)
+) -> List:
+    """
+    Compare the structure of a time step and queue up the comparison of its data.
+
+    Returns the tasks for the time step in the order that they are reported: recorders holding the results of the
+    structural comparisons, and queued-up comparisons of parameters and auxiliary data.
+    """
+    plan = []
+    recorder = _Recorder()
+    plan.append(recorder)
+    groupNames, structDiffs = _compareH5Groups(recorder, refGroup, srcGroup, "composite objects/auxiliary data")
+    recorder.addStructureDiffs(structDiffs)
 
     componentTypes = {gn for gn in groupNames if gn in ArmiObject.TYPES}
     auxData = set(groupNames) - componentTypes
     auxData.discard("layout")
 
     for componentType in componentTypes:
-        refTypeGroup = refGroup[componentType]
-        srcTypeGroup = srcGroup[componentType]
-
-        _compareComponentData(out, refTypeGroup, srcTypeGroup, diffResults, exclusions=exclusions)
+        plan.extend(_planComponentData(refGroup[componentType], srcGroup[componentType], comparer, exclusions))
 
     for aux in auxData:
-        _compareAuxData(out, refGroup[aux], srcGroup[aux], diffResults)
+        plan.append(comparer.submit(_AUX, refGroup[aux].name))
+
+    return plan
+
+
+def _planComponentData(
+    refGroup: h5py.Group,
+    srcGroup: h5py.Group,
+    comparer: _ParamComparer,
+    exclusions: Optional[Sequence[Pattern]] = None,
+) -> List:
+    exclusions = exclusions or []
+    recorder = _Recorder()
+    plan = [recorder]
+    compName = refGroup.name
+    paramNames, nDiff = _compareH5Groups(recorder, refGroup, srcGroup, "{} parameters".format(compName))
+    recorder.addStructureDiffs(nDiff)
+
+    for paramName in paramNames:
+        fullName = "/".join((refGroup.name, paramName))
+        if any(pattern.match(fullName) for pattern in exclusions):
+            runLog.debug("Skipping comparison of {} since it is being ignored.".format(fullName))
+            continue
+        plan.append(comparer.submit(_PARAM, fullName))
+
+    return plan
+
+
+def _compareParam(
+    out: OutputWriter,
+    refDataset: h5py.Dataset,
+    srcDataset: h5py.Dataset,
+    diffResults: DiffResults,
+    chunkRows: Optional[int] = None,
+):
+    """Compare the data of one parameter of one composite type."""
+    paramName = refDataset.name.split("/")[-1]
+    srcSpecial = srcDataset.attrs.get("specialFormatting", False)
+    refSpecial = refDataset.attrs.get("specialFormatting", False)
+
+    if srcSpecial ^ refSpecial:
+        out.writeln(
+            "Could not compare data for parameter {} because one uses special "
+            "formatting, and the other does not. Ref: {} Src: {}".format(paramName, refSpecial, srcSpecial)
+        )
+        diffResults.addDiff(refDataset.parent.name, paramName, np.inf, np.inf, np.inf)
+        return
+
+    if srcSpecial or refSpecial:
+        _diffSpecialData(refDataset, srcDataset, out, diffResults)
+    else:
+        _diffSimpleData(refDataset, srcDataset, diffResults, chunkRows=chunkRows)
 
 
 def _compareAuxData(
@@ -245,6 +499,7 @@ def _compareAuxData(
     refGroup: h5py.Group,
     srcGroup: h5py.Group,
     diffResults: DiffResults,
+    chunkRows: Optional[int] = None,
 ):
     """
     Compare auxiliary datasets, which aren't stored as Parameters on the Composite model.
@@ -270,7 +525,7 @@ def _compareAuxData(
     diffResults.addStructureDiffs(n)
     matchedSets = set(srcData.keys()) & set(refData.keys())
     for name in matchedSets:
-        _diffSimpleData(refData[name], srcData[name], diffResults)
+        _diffSimpleData(refData[name], srcData[name], diffResults, chunkRows=chunkRows)
 
 
 def _compareSets(src: set, ref: set, out: OutputWriter, name: Optional[str] = None) -> int:
@@ -413,10 +668,19 @@ def _diffSpecialData(
         diffResults.addDiff(compName, paramName, absMean, mean, absMax)
 
 
-def _diffSimpleData(ref: h5py.Dataset, src: h5py.Dataset, diffResults: DiffResults):
+def _diffSimpleData(
+    ref: h5py.Dataset,
+    src: h5py.Dataset,
+    diffResults: DiffResults,
+    chunkRows: Optional[int] = None,
+):
     paramName = ref.name.split("/")[-1]
     compName = ref.name.split("/")[-2]
 
+    if chunkRows and _canChunk(ref, src, chunkRows):
+        diffResults.addDiff(compName, paramName, *_diffSimpleDataChunked(ref, src, chunkRows))
+        return
+
     try:
         # use mean to avoid some unnecessary infinities
         mean = (src[()] + ref[()]) / 2.0
@@ -448,38 +712,45 @@ def _diffSimpleData(ref: h5py.Dataset, src: h5py.Dataset, diffResults: DiffResul
     diffResults.addDiff(compName, paramName, absMean, mean, absMax)
 
 
-def _compareComponentData(
-    out: OutputWriter,
-    refGroup: h5py.Group,
-    srcGroup: h5py.Group,
-    diffResults: DiffResults,
-    exclusions: Optional[Sequence[Pattern]] = None,
-):
-    exclusions = exclusions or []
-    compName = refGroup.name
-    paramNames, nDiff = _compareH5Groups(out, refGroup, srcGroup, "{} parameters".format(compName))
-    diffResults.addStructureDiffs(nDiff)
-
-    for paramName in paramNames:
-        fullName = "/".join((refGroup.name, paramName))
-        if any(pattern.match(fullName) for pattern in exclusions):
-            runLog.debug("Skipping comparison of {} since it is being ignored.".format(fullName))
-            continue
-        refDataset = refGroup[paramName]
-        srcDataset = srcGroup[paramName]
+def _canChunk(ref: h5py.Dataset, src: h5py.Dataset, chunkRows: int) -> bool:
+    """Whether two datasets are plain numbers of the same shape, with more than ``chunkRows`` rows."""
+    return (
+        ref.shape == src.shape
+        and ref.ndim > 0
+        and ref.shape[0] > chunkRows
+        and 0 not in ref.shape
+        and ref.dtype.kind in "iuf"
+        and src.dtype.kind in "iuf"
+    )
 
-        srcSpecial = srcDataset.attrs.get("specialFormatting", False)
-        refSpecial = refDataset.attrs.get("specialFormatting", False)
 
-        if srcSpecial ^ refSpecial:
-            out.writeln(
-                "Could not compare data for parameter {} because one uses special "
-                "formatting, and the other does not. Ref: {} Src: {}".format(paramName, refSpecial, srcSpecial)
-            )
-            diffResults.addDiff(refGroup.name, paramName, np.inf, np.inf, np.inf)
+def _diffSimpleDataChunked(ref: h5py.Dataset, src: h5py.Dataset, chunkRows: int) -> Tuple[float, float, float]:
+    """
+    Compute the same mean(abs(diff)), mean(diff) and max(abs(diff)) as :py:func:`_diffSimpleData`, reading only
+    ``chunkRows`` rows of each dataset at a time.
+    """
+    count = 0
+    total = 0.0
+    absTotal = 0.0
+    absMax = -np.inf
+    for start in range(0, ref.shape[0], chunkRows):
+        rows = slice(start, start + chunkRows)
+        srcChunk = src[rows]
+        refChunk = ref[rows]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            diff = (srcChunk - refChunk) / ((srcChunk + refChunk) / 2.0)
+
+        # like nanmean and nanmax, ignore the NaNs from 0/0
+        diff = diff[~np.isnan(diff)]
+        if diff.size == 0:
             continue
+        absDiff = np.abs(diff)
+        count += diff.size
+        total += diff.sum()
+        absTotal += absDiff.sum()
+        absMax = max(absMax, absDiff.max())
 
-        if srcSpecial or refSpecial:
-            _diffSpecialData(refDataset, srcDataset, out, diffResults)
-        else:
-            _diffSimpleData(refDataset, srcDataset, diffResults)
+    if count == 0:
+        return np.nan, np.nan, np.nan
+
+    return absTotal / count, total / count, absMax
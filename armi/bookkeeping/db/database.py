@@ -46,6 +46,7 @@ from typing import (
     Dict,
     Generator,
     List,
+    NamedTuple,
     Optional,
     Sequence,
     Tuple,
@@ -57,6 +58,7 @@ import h5py
 import numpy as np
 
 from armi import context, getApp, getPluginManagerOrFail, meta, runLog, settings
+from armi.bookkeeping.db import databaseView, historyIndex
 from armi.bookkeeping.db.jaggedArray import JaggedArray
 from armi.bookkeeping.db.layout import (
     DB_VERSION,
@@ -65,6 +67,7 @@ from armi.bookkeeping.db.layout import (
     replaceNonesWithNonsense,
     replaceNonsenseWithNones,
 )
+from armi.bookkeeping.db.storagePolicy import StoragePolicies, StoragePolicy
 from armi.bookkeeping.db.typedefs import Histories, History
 from armi.physics.neutronics.settings import CONF_LOADING_FILE
 from armi.reactor import grids, parameters
@@ -87,6 +90,47 @@ _SERIALIZER_NAME = "serializerName"
 _SERIALIZER_VERSION = "serializerVersion"
 
 
+# Parameters that are always read when loading a subset of parameters, since rebuilding the model relies on them.
+# Component dimensions are always read as well.
+_ALWAYS_LOADED_PARAMS = {
+    "assemNum",
+    "axialMesh",
+    "flags",
+    "height",
+    "modArea",
+    "mult",
+    "nuclides",
+    "numberDensities",
+    "serialNum",
+    "theoreticalDensityFrac",
+    "type",
+}
+
+
+class PackedParam(NamedTuple):
+    """A parameter's data for one type of object, ready to be written as an HDF5 dataset."""
+
+    name: str
+    data: np.ndarray
+    attrs: Dict[str, Any]
+    storage: Dict[str, Any]
+
+
+class TimeNodeSnapshot(NamedTuple):
+    """
+    Everything needed to write one time node to the database, with no references back to the reactor.
+
+    Produced by :py:meth:`Database.snapshot` and written by :py:meth:`Database.writeSnapshot`, which allows the HDF5
+    I/O to happen after the reactor has moved on.
+    """
+
+    cycle: int
+    timeNode: int
+    statePointName: Optional[str]
+    layout: Layout
+    params: List[Tuple[str, List[PackedParam]]]
+
+
 def getH5GroupName(cycle: int, timeNode: int, statePointName: str = None) -> str:
     """
     Naming convention specifier.
@@ -144,6 +188,9 @@ class Database:
         # the same whether they are open or closed.
         self._openCount: int = 0
 
+        # Compression, shuffle, and chunking of the parameter datasets that get written. See ``storagePolicy``.
+        self.storagePolicies = StoragePolicies()
+
         if permission == "w":
             self.version = DB_VERSION
         else:
@@ -618,13 +665,16 @@ class Database:
 
         This method can be used to allow other interfaces to place data into the database at the correct timestep.
         """
-        groupName = getH5GroupName(r.p.cycle, r.p.timeNode, statePointName)
+        return self._getTimeNodeGroup(r.p.cycle, r.p.timeNode, statePointName)
+
+    def _getTimeNodeGroup(self, cycle, timeNode, statePointName=None):
+        groupName = getH5GroupName(cycle, timeNode, statePointName)
         if groupName in self.h5db:
             return self.h5db[groupName]
         else:
             group = self.h5db.create_group(groupName, track_order=True)
-            group.attrs["cycle"] = r.p.cycle
-            group.attrs["timeNode"] = r.p.timeNode
+            group.attrs["cycle"] = cycle
+            group.attrs["timeNode"] = timeNode
             return group
 
     def hasTimeStep(self, cycle, timeNode, statePointName=""):
@@ -633,15 +683,34 @@ class Database:
 
     def writeToDB(self, reactor, statePointName=None):
         assert self.h5db is not None, "Database must be open before writing."
+        self.writeSnapshot(self.snapshot(reactor, statePointName))
+
+    def snapshot(self, reactor, statePointName=None) -> TimeNodeSnapshot:
+        """
+        Collect the layout and parameter data of the reactor for writing to the database.
+
+        The returned snapshot holds copies of all of the data, so the reactor may change freely before the snapshot is
+        written with :py:meth:`writeSnapshot`.
+        """
         # _createLayout is recursive
-        h5group = self.getH5Group(reactor, statePointName)
-        runLog.info("Writing to database for statepoint: {}".format(h5group.name))
         layout = Layout((self.versionMajor, self.versionMinor), comp=reactor)
-        layout.writeToDB(h5group)
-        groupedComps = layout.groupedComps
+        params = [(comps[0].__class__.__name__, self._packParams(comps)) for comps in layout.groupedComps.values()]
+        # drop the references to the reactor model; only the packed layout data are needed to write it
+        layout.groupedComps = collections.defaultdict(list)
+
+        return TimeNodeSnapshot(reactor.p.cycle, reactor.p.timeNode, statePointName, layout, params)
+
+    def writeSnapshot(self, snapshot: TimeNodeSnapshot):
+        """Write a snapshot made by :py:meth:`snapshot` to the database."""
+        assert self.h5db is not None, "Database must be open before writing."
+        # the history index does not know about this write
+        historyIndex.dropHistoryIndex(self.h5db)
+        h5group = self._getTimeNodeGroup(snapshot.cycle, snapshot.timeNode, snapshot.statePointName)
+        runLog.info("Writing to database for statepoint: {}".format(h5group.name))
+        snapshot.layout.writeToDB(h5group)
 
-        for comps in groupedComps.values():
-            self._writeParams(h5group, comps)
+        for groupName, packedParams in snapshot.params:
+            self._writePackedParams(h5group, groupName, packedParams)
 
     def syncToSharedFolder(self):
         """
@@ -669,7 +738,18 @@ class Database:
         # Reload the file in append mode and continue on our merry way
         self.h5db = h5py.File(self._fullPath, "r+")
 
-    def load(self, cycle, node, cs=None, bp=None, statePointName=None, allowMissing=False, handleInvalids=True):
+    def load(
+        self,
+        cycle,
+        node,
+        cs=None,
+        bp=None,
+        statePointName=None,
+        allowMissing=False,
+        handleInvalids=True,
+        assemblies=None,
+        params=None,
+    ):
         """Load a new reactor from a DB at (cycle, node).
 
         Case settings and blueprints can be provided, or read from the database. Providing  can be useful for snapshot
@@ -702,6 +782,14 @@ class Database:
             with undefined parameters. Default False.
         handleInvalids : bool
             Whether to check for invalid settings. Default True.
+        assemblies : iterable of str or tuple, optional
+            If provided, only these assemblies are built, selected by name or by the grid indices of their location.
+            Everything outside of assemblies is always built. See :py:meth:`Layout.selectAssemblies`.
+        params : iterable of str, optional
+            If provided, only these parameters of the assemblies, blocks, and components are read from the database; the
+            others keep their default values. The parameters that are needed to rebuild the model (dimensions, number
+            densities, types, etc.) are always read, as are all the parameters of the other objects, e.g. the reactor
+            and core.
 
         Returns
         -------
@@ -726,11 +814,30 @@ class Database:
         h5group = self.h5db[getH5GroupName(cycle, node, statePointName)]
 
         layout = Layout((self.versionMajor, self.versionMinor), h5group=h5group)
-        comps, groupedComps = layout._initComps(cs.caseTitle, bp)
+        keep = None if assemblies is None else layout.selectAssemblies(assemblies)
+        comps, groupedComps = layout._initComps(cs.caseTitle, bp, keep=keep)
+
+        # the rows of each parameter dataset that belong to the objects that were built
+        rows = collections.defaultdict(list)
+        if keep is not None:
+            for compType, indexInData, kept in zip(layout.type, layout.indexInData, keep):
+                if kept:
+                    rows[compType].append(indexInData)
+
+        if params is not None:
+            params = set(params) | _ALWAYS_LOADED_PARAMS
 
         # populate data onto initialized components
         for compType, compTypeList in groupedComps.items():
-            self._readParams(h5group, compType, compTypeList, allowMissing=allowMissing)
+            # the state of the reactor, core, etc. is small and always read in full
+            self._readParams(
+                h5group,
+                compType,
+                compTypeList,
+                allowMissing=allowMissing,
+                rows=rows.get(compType),
+                params=params if isinstance(compTypeList[0], (Assembly, Block, Component)) else None,
+            )
 
         # assign params from blueprints
         if bp is not None:
@@ -774,6 +881,23 @@ class Database:
         makeParametersReadOnly(r)
         return r
 
+    def loadView(self, cycle, node, statePointName=None) -> databaseView.CompositeView:
+        """
+        Get a lightweight, read-only view of the reactor at (cycle, node).
+
+        Unlike :py:meth:`loadReadOnly`, this does not build a reactor. The view only has the structure of the model
+        and reads each parameter from the file when it is first accessed, so it is much faster to get when only some
+        of the stored values are needed. The view can only be used while this database is open. See
+        :py:mod:`armi.bookkeeping.db.databaseView`.
+
+        Returns
+        -------
+        CompositeView
+            A view of the top-level object stored in the database; a Reactor.
+        """
+        h5group = self.h5db[getH5GroupName(cycle, node, statePointName)]
+        return databaseView.buildView(h5group, (self.versionMajor, self.versionMinor))
+
     @staticmethod
     def _setParamsBeforeFreezing(r: Reactor):
         """Set some special case parameters before they are made read-only."""
@@ -867,19 +991,13 @@ class Database:
             # not a list, tuple, or array (likely int, float, or None)
             return 1
 
-    def _writeParams(self, h5group, comps) -> tuple:
+    def _packParams(self, comps) -> List[PackedParam]:
+        """Convert the parameters of a group of objects of the same type into arrays for the database."""
         c = comps[0]
-        groupName = c.__class__.__name__
-        if groupName not in h5group:
-            # Only create the group if it doesn't already exist. This happens when re-writing params in the same time
-            # node (e.g. something changed between EveryNode and EOC).
-            g = h5group.create_group(groupName, track_order=True)
-        else:
-            g = h5group[groupName]
+        packed = []
 
         for paramDef in c.p.paramDefs.toWriteToDB():
             attrs = {}
-
             if hasattr(c, "DIMENSION_NAMES") and paramDef.name in c.DIMENSION_NAMES:
                 linkedDims = []
                 data = []
@@ -947,22 +1065,37 @@ class Database:
             if data is None:
                 continue
 
+            storage = self.storagePolicies.forParam(paramDef).datasetKwargs(data)
+            packed.append(PackedParam(paramDef.name, data, attrs, storage))
+
+        if isinstance(c, Block):
+            packed.extend(self._packHomogenizedNumberDensityParams(comps, self.storagePolicies.default))
+
+        return packed
+
+    @staticmethod
+    def _writePackedParams(h5group, groupName, packedParams: List[PackedParam]):
+        if groupName not in h5group:
+            # Only create the group if it doesn't already exist. This happens when re-writing params in the same time
+            # node (e.g. something changed between EveryNode and EOC).
+            g = h5group.create_group(groupName, track_order=True)
+        else:
+            g = h5group[groupName]
+
+        for name, data, attrs, storage in packedParams:
             try:
-                if paramDef.name in g:
-                    raise ValueError(f"`{paramDef.name}` was already in `{g}`. This time node should have been empty")
+                if name in g:
+                    raise ValueError(f"`{name}` was already in `{g}`. This time node should have been empty")
 
-                dataset = g.create_dataset(paramDef.name, data=data, compression="gzip", track_order=True)
+                dataset = g.create_dataset(name, data=data, track_order=True, **storage)
                 if any(attrs):
                     Database._writeAttrs(dataset, h5group, attrs)
             except Exception:
-                runLog.error(f"Failed to write {paramDef.name} to database. Data: {data}")
+                runLog.error(f"Failed to write {name} to database. Data: {data}")
                 raise
 
-        if isinstance(c, Block):
-            self._addHomogenizedNumberDensityParams(comps, g)
-
     @staticmethod
-    def _addHomogenizedNumberDensityParams(blocks, h5group):
+    def _packHomogenizedNumberDensityParams(blocks, storagePolicy: StoragePolicy) -> List[PackedParam]:
         """
         Create on-the-fly block homog. number density params for XTVIEW viewing.
 
@@ -970,18 +1103,31 @@ class Database:
         --------
         collectBlockNumberDensities
         """
-        nDens = collectBlockNumberDensities(blocks)
-
-        for nucName, numDens in nDens.items():
-            h5group.create_dataset(nucName, data=numDens, compression="gzip", track_order=True)
+        return [
+            PackedParam(nucName, numDens, {}, storagePolicy.datasetKwargs(numDens))
+            for nucName, numDens in collectBlockNumberDensities(blocks).items()
+        ]
 
     @staticmethod
-    def _readParams(h5group, compTypeName, comps, allowMissing=False):
+    def _readParams(h5group, compTypeName, comps, allowMissing=False, rows=None, params=None):
+        """
+        Read parameter data from the database onto a group of objects of the same type.
+
+        Parameters
+        ----------
+        rows : list of int, optional
+            The rows of the parameter datasets that correspond to ``comps``, in increasing order, if ``comps`` are not
+            all of the objects of this type.
+        params : set of str, optional
+            The names of the parameters to read. All are read if not provided.
+        """
         g = h5group[compTypeName]
 
         renames = getApp().getParamRenames()
 
         pDefs = comps[0].pDefs
+        if params is not None:
+            params = params | set(getattr(comps[0], "DIMENSION_NAMES", ()))
 
         # this can also be made faster by specializing the method by type
         for paramName, dataSet in g.items():
@@ -993,7 +1139,7 @@ class Database:
                 pDef = pDefs[paramName]
             except KeyError:
                 if re.match(r"^n[A-Z][a-z]?\d*", paramName):
-                    # This is a temporary viz param (number density) made by _addHomogenizedNumberDensityParams ignore
+                    # This is a temporary viz param (number density) made by _packHomogenizedNumberDensityParams ignore
                     # it safely
                     continue
                 else:
@@ -1009,28 +1155,30 @@ class Database:
                     else:
                         raise
 
-            data = dataSet[:]
-            attrs = Database._resolveAttrs(dataSet.attrs, h5group)
-
-            if pDef.serializer is not None:
-                assert _SERIALIZER_NAME in dataSet.attrs
-                assert dataSet.attrs[_SERIALIZER_NAME] == pDef.serializer.__name__
-                assert _SERIALIZER_VERSION in dataSet.attrs
-
-                data = np.array(pDef.serializer.unpack(data, dataSet.attrs[_SERIALIZER_VERSION], attrs))
+            if params is not None and paramName not in params:
+                continue
 
-            # nuclides are a special case where we want to keep in np.bytes_ format
-            if data.dtype.type is np.bytes_ and "nuclides" not in paramName.lower():
-                data = np.char.decode(data)
+            attrs = Database._resolveAttrs(dataSet.attrs, h5group)
+            # Data that are flattened or serialized can only be unpacked as a whole. Otherwise, only read the rows that
+            # are needed.
+            unpackWhole = pDef.serializer is not None or attrs.get("specialFormatting", False)
+            if rows is None or unpackWhole:
+                data = dataSet[:]
+            else:
+                data = dataSet[rows]
 
-            if attrs.get("specialFormatting", False):
-                data = unpackSpecialData(data, attrs, paramName)
+            data = Database._unpackParamData(data, dataSet, attrs, pDef, paramName)
 
             linkedDims = []
             if "linkedDims" in attrs:
                 linkedDims = np.char.decode(attrs["linkedDims"])
+                if rows is not None:
+                    linkedDims = linkedDims[rows]
 
             unpackedData = data.tolist()
+            if rows is not None and unpackWhole:
+                # e.g. a JaggedArray, which can only be indexed once it is unpacked into a list
+                unpackedData = [unpackedData[row] for row in rows]
             if len(comps) != len(unpackedData):
                 msg = (
                     "While unpacking special data for {}, encountered composites and parameter "
@@ -1059,6 +1207,25 @@ class Database:
                             f"{str(ae)}\nSkipping load of invalid param `{paramName}` (possibly loading from old DB)\n"
                         )
 
+    @staticmethod
+    def _unpackParamData(data, dataSet, attrs, pDef, paramName) -> np.ndarray:
+        """Undo the serialization, string encoding, and special formatting that were applied when writing a dataset."""
+        if pDef.serializer is not None:
+            assert _SERIALIZER_NAME in dataSet.attrs
+            assert dataSet.attrs[_SERIALIZER_NAME] == pDef.serializer.__name__
+            assert _SERIALIZER_VERSION in dataSet.attrs
+
+            data = np.array(pDef.serializer.unpack(data, dataSet.attrs[_SERIALIZER_VERSION], attrs))
+
+        # nuclides are a special case where we want to keep in np.bytes_ format
+        if data.dtype.type is np.bytes_ and "nuclides" not in paramName.lower():
+            data = np.char.decode(data)
+
+        if attrs.get("specialFormatting", False):
+            data = unpackSpecialData(data, attrs, paramName)
+
+        return data
+
     def getHistoryByLocation(
         self,
         comp: ArmiObject,
@@ -1257,7 +1424,51 @@ class Database:
         -------
         dict
             Dictionary ArmiObject (input): dict of str/list pairs containing ((cycle, node), value).
+
+        See Also
+        --------
+        writeHistoryIndex : speeds this up for databases that are done being written.
+        """
+        histData = None
+        index = historyIndex.HistoryIndex.read(self.h5db)
+        if index is not None:
+            groups = [g for g in self.genTimeStepGroups(timeSteps) if "layout" in g]
+            histData = index.getHistories(comps, params, groups)
+
+        if histData is None:
+            histData = self._readHistories(comps, params, timeSteps)
+
+        r = comps[0].getAncestor(lambda c: isinstance(c, Reactor))
+        cycleNode = r.p.cycle, r.p.timeNode
+        for c, paramHistories in histData.items():
+            for paramName, hist in paramHistories.items():
+                if cycleNode not in hist:
+                    try:
+                        hist[cycleNode] = c.p[paramName]
+                    except Exception:
+                        if paramName == "location":
+                            hist[cycleNode] = tuple(c.spatialLocator.indices)
+
+        return histData
+
+    def writeHistoryIndex(self):
+        """
+        Write an index of the parameter histories of all time nodes, which ``getHistories`` reads instead of the time
+        nodes themselves.
+
+        The index is dropped when another time node is written, so this is meant to be called once all time nodes have
+        been written. See :py:mod:`armi.bookkeeping.db.historyIndex`.
         """
+        assert self.h5db is not None, "Database must be open before writing."
+        historyIndex.writeHistoryIndex(self)
+
+    def _readHistories(
+        self,
+        comps: Sequence[ArmiObject],
+        params: Optional[Sequence[str]] = None,
+        timeSteps: Optional[Sequence[Tuple[int, int]]] = None,
+    ) -> Histories:
+        """Read the parameter histories of a sequence of ARMI Objects from every time node. See ``getHistories``."""
         histData: Histories = {c: collections.defaultdict(collections.OrderedDict) for c in comps}
         types = {c.__class__ for c in comps}
         compsByTypeThenSerialNum: Dict[Type[ArmiObject], Dict[int, ArmiObject]] = {t: dict() for t in types}
@@ -1349,17 +1560,6 @@ class Database:
 
                         histData[c][paramName][cycle, timeNode] = val
 
-        r = comps[0].getAncestor(lambda c: isinstance(c, Reactor))
-        cycleNode = r.p.cycle, r.p.timeNode
-        for c, paramHistories in histData.items():
-            for paramName, hist in paramHistories.items():
-                if cycleNode not in hist:
-                    try:
-                        hist[cycleNode] = c.p[paramName]
-                    except Exception:
-                        if paramName == "location":
-                            hist[cycleNode] = tuple(c.spatialLocator.indices)
-
         return histData
 
     @staticmethod
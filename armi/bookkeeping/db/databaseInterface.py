@@ -29,11 +29,16 @@ from typing import (
 )
 
 from armi import context, interfaces, runLog
+from armi.bookkeeping.db.backgroundWriter import BackgroundWriter
 from armi.bookkeeping.db.database import Database, getH5GroupName
+from armi.bookkeeping.db.storagePolicy import StoragePolicies
 from armi.bookkeeping.db.typedefs import Histories, History
 from armi.reactor.composites import ArmiObject
 from armi.reactor.parameters import parameterDefinitions
 from armi.settings.fwSettings.databaseSettings import (
+    CONF_DB_BACKGROUND_WRITE,
+    CONF_DB_HISTORY_INDEX,
+    CONF_DB_WRITE_QUEUE_SIZE,
     CONF_FORCE_DB_PARAMS,
     CONF_SYNC_AFTER_WRITE,
 )
@@ -62,6 +67,7 @@ class DatabaseInterface(interfaces.Interface):
         interfaces.Interface.__init__(self, r, cs)
         self._db = None
         self._dbPath: Optional[pathlib.Path] = None
+        self._writer: Optional[BackgroundWriter] = None
 
         if cs[CONF_FORCE_DB_PARAMS]:
             toSet = {paramName: set() for paramName in cs[CONF_FORCE_DB_PARAMS]}
@@ -79,8 +85,9 @@ class DatabaseInterface(interfaces.Interface):
 
     @property
     def database(self):
-        """Presents the internal database object, if it exists."""
+        """Presents the internal database object, if it exists, after any background writes have finished."""
         if self._db is not None:
+            self.flushDB()
             return self._db
         else:
             raise RuntimeError(
@@ -114,9 +121,13 @@ class DatabaseInterface(interfaces.Interface):
                 "This could lead to data loss! Rename the reload DB or the case."
             )
         self._db = Database(self._dbPath, "w")
+        self._db.storagePolicies = StoragePolicies.fromSettings(self.cs)
         self._db.open()
         self._db.writeInputsToDB(self.cs)
 
+        if self.cs[CONF_DB_BACKGROUND_WRITE]:
+            self._writer = BackgroundWriter(self._db, self.cs[CONF_DB_WRITE_QUEUE_SIZE])
+
     def interactEveryNode(self, cycle, node):
         """
         Write to database.
@@ -136,10 +147,20 @@ class DatabaseInterface(interfaces.Interface):
     def writeDBEveryNode(self):
         """Write the database at the end of the time node."""
         self.r.core.p.minutesSinceStart = (time.time() - self.r.core.timeOfStart) / 60.0
-        self._db.writeToDB(self.r)
+        if self._writer is not None:
+            self._writer.submit(self._db.snapshot(self.r))
+        else:
+            self._db.writeToDB(self.r)
+
         if self.cs[CONF_SYNC_AFTER_WRITE]:
+            self.flushDB()
             self._db.syncToSharedFolder()
 
+    def flushDB(self):
+        """Wait for any background database writes to finish."""
+        if self._writer is not None:
+            self._writer.flush()
+
     def interactEOC(self, cycle=None):
         """
         Do not write; this state doesn't tend to be important since its decay only step.
@@ -154,12 +175,25 @@ class DatabaseInterface(interfaces.Interface):
         """DB's should be closed at run's end. (End of Life)."""
         # minutesSinceStarts should include as much of the ARMI run as possible so EOL is necessary, too.
         self.r.core.p.minutesSinceStart = (time.time() - self.r.core.timeOfStart) / 60.0
+        self.flushDB()
         self._db.writeToDB(self.r, "EOL")
+        if self.cs[CONF_DB_HISTORY_INDEX]:
+            self._db.writeHistoryIndex()
         self.closeDB()
 
     def closeDB(self):
         """Close the DB, writing to file."""
-        self._db.close(True)
+        try:
+            self._stopWriter()
+        finally:
+            # the file is closed even if a background write failed
+            self._db.close(True)
+
+    def _stopWriter(self):
+        """Finish any background database writes and stop the writer thread."""
+        if self._writer is not None:
+            writer, self._writer = self._writer, None
+            writer.stop()
 
     def interactError(self):
         """Get shutdown state information even if the run encounters an error."""
@@ -168,6 +202,7 @@ class DatabaseInterface(interfaces.Interface):
 
             # this can result in a double-error if the error occurred in the database
             # writing
+            self._stopWriter()
             self._db.writeToDB(self.r, "error")
             self._db.close(False)
         except Exception:  # we're already responding to an error
@@ -299,6 +334,7 @@ class DatabaseInterface(interfaces.Interface):
             If fileName is not specified and neither the database in memory, nor the
             ``cs["reloadDBName"]`` have the time step specified.
         """
+        self.flushDB()
         for potentialDatabase in self._getLoadDB(fileName):
             with potentialDatabase as loadDB:
                 if loadDB.hasTimeStep(cycle, timeNode, statePointName=timeStepName):
@@ -0,0 +1,227 @@
+# Copyright 2026 TerraPower, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Lightweight, read-only views of the reactor model stored in a database time node.
+
+:py:meth:`Database.loadReadOnly <armi.bookkeeping.db.database.Database.loadReadOnly>` builds a complete reactor, with
+blueprints, materials, and every parameter of every object set up front. Code that only needs to look at the stored
+values, like reports, plots, and database comparisons, can instead use a view from
+:py:meth:`Database.loadView <armi.bookkeeping.db.database.Database.loadView>`. A view is a tree of
+:py:class:`CompositeView` objects, built from the layout alone. Parameters are read from the file the first time they
+are accessed on any object of a given type, and that dataset is then cached for all objects of that type.
+
+Views read from the open database file, so they can only be used while the database is open.
+"""
+
+from typing import Callable, Dict, Iterator, List, Optional
+
+import numpy as np
+
+from armi import getApp
+from armi.bookkeeping.db.layout import Layout
+from armi.reactor.composites import ArmiObject
+from armi.reactor.reactors import Core
+
+
+class _TypeParamData:
+    """The parameter datasets of one object type in one time node, read on first access and cached."""
+
+    def __init__(self, h5group, typeName: str):
+        self._h5group = h5group
+        self._typeGroup = h5group.get(typeName, {})
+        self.pDefs = ArmiObject.TYPES[typeName].pDefs
+        self._cache: Dict[str, List] = {}
+
+        # honor historical databases where the parameters may have changed names since
+        renames = getApp().getParamRenames()
+        self._datasetNames = {}
+        for datasetName in self._typeGroup.keys():
+            paramName = datasetName
+            while paramName in renames:
+                paramName = renames[paramName]
+            self._datasetNames[paramName] = datasetName
+
+    def names(self) -> List[str]:
+        """Names of the parameters stored for this type."""
+        return [name for name in self._datasetNames if name in self.pDefs]
+
+    def get(self, paramName: str, indexInData: int):
+        """Get the value of a parameter for one object; undefined parameters raise a KeyError."""
+        values = self._cache.get(paramName)
+        if values is None:
+            pDef = self.pDefs[paramName]
+            if paramName not in self._datasetNames:
+                return pDef.default
+            values = self._cache[paramName] = self._read(pDef)
+
+        return values[indexInData]
+
+    def _read(self, pDef) -> List:
+        # imported here because the database module uses this one
+        from armi.bookkeeping.db.database import Database
+
+        dataSet = self._typeGroup[self._datasetNames[pDef.name]]
+        attrs = Database._resolveAttrs(dataSet.attrs, self._h5group)
+        data = Database._unpackParamData(dataSet[()], dataSet, attrs, pDef, pDef.name)
+        values = [np.array(val) if isinstance(val, list) else val for val in data.tolist()]
+
+        # like Database._readParams, dimensions linked to other components are the links, not their stored values
+        if "linkedDims" in attrs:
+            for i, linkedDim in enumerate(np.char.decode(attrs["linkedDims"]).tolist()):
+                if linkedDim != "":
+                    values[i] = linkedDim
+
+        return values
+
+
+class ParameterView:
+    """Read-only access to the parameters of one object, by item or attribute, like a ParameterCollection."""
+
+    __slots__ = ("_data", "_indexInData")
+
+    def __init__(self, data: _TypeParamData, indexInData: int):
+        object.__setattr__(self, "_data", data)
+        object.__setattr__(self, "_indexInData", indexInData)
+
+    def __getitem__(self, name):
+        return self._data.get(name, self._indexInData)
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(f"{self._data.pDefs} has no parameter `{name}`") from None
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Database views are read-only")
+
+    def __setitem__(self, name, value):
+        raise TypeError("Database views are read-only")
+
+    def __contains__(self, name):
+        return name in self._data.pDefs
+
+    @property
+    def paramDefs(self):
+        return self._data.pDefs
+
+    def get(self, name, default=None):
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
+    def keys(self) -> List[str]:
+        return self._data.names()
+
+
+class CompositeView:
+    """
+    A read-only stand-in for an ARMI object stored in a database time node.
+
+    Supports the tree navigation and parameter access of :py:class:`ArmiObject
+    <armi.reactor.composites.ArmiObject>` that do not need the physics model: iteration over children, ``p``,
+    ``hasFlags``, ``getChildren``, ``getAncestor`` and so on.
+    """
+
+    # these only rely on ``p``, ``parent``, and ``hasFlags``
+    hasFlags = ArmiObject.hasFlags
+    getAncestor = ArmiObject.getAncestor
+
+    def __init__(self, typeName: str, name: str, parent: Optional["CompositeView"], p: ParameterView, location):
+        self.typeName = typeName
+        self.name = name
+        self.parent = parent
+        self.p = p
+        self.location = location
+        self.children: List["CompositeView"] = []
+
+    def __repr__(self):
+        return "<{} view of {}>".format(self.typeName, self.name)
+
+    def __iter__(self) -> Iterator["CompositeView"]:
+        return iter(self.children)
+
+    def __len__(self):
+        return len(self.children)
+
+    def __getitem__(self, index):
+        return self.children[index]
+
+    @property
+    def armiType(self):
+        """The ARMI class of the object this views."""
+        return ArmiObject.TYPES[self.typeName]
+
+    @property
+    def core(self) -> Optional["CompositeView"]:
+        """The core within this object, if there is one."""
+        return next((c for c in self.children if issubclass(c.armiType, Core)), None)
+
+    def getType(self):
+        return self.p.type
+
+    def iterChildren(
+        self, deep=False, predicate: Optional[Callable[["CompositeView"], bool]] = None
+    ) -> Iterator["CompositeView"]:
+        for child in self.children:
+            if predicate is None or predicate(child):
+                yield child
+            if deep:
+                yield from child.iterChildren(deep, predicate)
+
+    def getChildren(self, deep=False, generationNum=1, predicate=None) -> List["CompositeView"]:
+        if deep or generationNum == 1:
+            return list(self.iterChildren(deep, predicate))
+
+        return [
+            grandChild
+            for child in self.children
+            for grandChild in child.getChildren(generationNum=generationNum - 1, predicate=predicate)
+        ]
+
+    def getChildrenWithFlags(self, typeSpec, exactMatch=False) -> List["CompositeView"]:
+        return [child for child in self.children if child.hasFlags(typeSpec, exact=exactMatch)]
+
+
+def buildView(h5group, version) -> CompositeView:
+    """Build a view of the reactor model stored in a time node group. Returns the root, usually the Reactor."""
+    layout = Layout(version, h5group=h5group)
+    paramData: Dict[str, _TypeParamData] = {}
+
+    root = None
+    # each entry is [view, number of its children not yet built]
+    stack = []
+    for typeName, name, indexInData, numChildren, location in zip(
+        layout.type, layout.name, layout.indexInData, layout.numChildren, layout.location
+    ):
+        while stack and stack[-1][1] == 0:
+            stack.pop()
+        parent = stack[-1][0] if stack else None
+
+        if typeName not in paramData:
+            paramData[typeName] = _TypeParamData(h5group, typeName)
+        view = CompositeView(typeName, name, parent, ParameterView(paramData[typeName], indexInData), location)
+
+        if parent is None:
+            root = view
+        else:
+            parent.children.append(view)
+            stack[-1][1] -= 1
+        stack.append([view, numChildren])
+
+    return root
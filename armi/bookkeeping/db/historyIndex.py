@@ -0,0 +1,239 @@
+# Copyright 2026 TerraPower, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+A columnar index of parameter histories, stored alongside the time nodes of a database.
+
+Without an index, :py:meth:`Database.getHistories <armi.bookkeeping.db.database.Database.getHistories>` has to read
+the layout and the parameter datasets of every time node. The history index stores, for each object type and
+parameter, one dataset holding the values of every object at every time node, with one row per object serial number
+and one column per time node::
+
+    historyIndex/
+        groupNames          names of the time node groups, one per column
+        HexBlock/
+            serialNum       sorted serial numbers, one per row
+            present         whether each object exists at each time node
+            location        grid indices or coordinates of each object at each time node
+            percentBu       ...
+
+Only plain numeric data are indexed. Parameters that are stored with special formatting, with a serializer, as
+strings, or with a shape that changes between time nodes are left out, and queries for them read the time nodes
+directly.
+
+The index is a snapshot of the database at the time it is written. It is dropped when a time node is written
+afterwards, and queries for time nodes that it does not cover fall back to reading the time nodes.
+"""
+
+import collections
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from armi import runLog
+from armi.bookkeeping.db.layout import Layout
+from armi.bookkeeping.db.typedefs import Histories
+
+HISTORY_INDEX_GROUP = "historyIndex"
+_LOCATION = "location"
+_NUMERIC_KINDS = "biuf"
+
+
+def writeHistoryIndex(db):
+    """Build the history index of a database from all of its time nodes, replacing any existing index."""
+    h5db = db.h5db
+    version = (db.versionMajor, db.versionMinor)
+    groups = [g for g in db.genTimeStepGroups() if "layout" in g]
+    groupNames = [g.name.lstrip("/") for g in groups]
+    runLog.info(f"Writing the history index of {len(groups)} time nodes in {db}")
+
+    # for each type, the serial numbers and rows in the parameter datasets of its objects at each time node
+    serialNums = collections.defaultdict(dict)
+    indexInData = collections.defaultdict(dict)
+    locations = collections.defaultdict(dict)
+    for column, group in enumerate(groups):
+        layout = Layout(version, h5group=group)
+        for typeName in np.unique(layout.type):
+            layoutIndices = np.where(layout.type == typeName)[0]
+            serialNums[typeName][column] = layout.serialNum[layoutIndices]
+            indexInData[typeName][column] = layout.indexInData[layoutIndices]
+            locations[typeName][column] = [layout.location[i] for i in layoutIndices]
+
+    dropHistoryIndex(h5db)
+    indexGroup = h5db.create_group(HISTORY_INDEX_GROUP, track_order=True)
+    indexGroup.create_dataset("groupNames", data=np.array(groupNames, dtype="S"))
+    storage = db.storagePolicies.default
+
+    for typeName, serialNumsByColumn in serialNums.items():
+        allSerialNums = np.unique(np.concatenate(list(serialNumsByColumn.values())))
+        rowsByColumn = {column: np.searchsorted(allSerialNums, sns) for column, sns in serialNumsByColumn.items()}
+        present = np.zeros((len(allSerialNums), len(groups)), dtype=bool)
+        for column, rows in rowsByColumn.items():
+            present[rows, column] = True
+
+        typeGroup = indexGroup.create_group(typeName, track_order=True)
+        typeGroup.create_dataset("serialNum", data=allSerialNums)
+        typeGroup.create_dataset("present", data=present, **storage.datasetKwargs(present))
+
+        try:
+            columnData = {column: np.array(locs) for column, locs in locations[typeName].items()}
+        except ValueError:
+            # multi-index locations do not make a regular array
+            columnData = None
+        if columnData is not None:
+            _writeIndexedParam(typeGroup, _LOCATION, columnData, rowsByColumn, present.shape, storage)
+
+        paramNames = set()
+        for column in rowsByColumn:
+            paramNames.update(groups[column][typeName].keys())
+
+        complete = True
+        # the serial numbers and locations were written above, from the layout
+        for paramName in sorted(paramNames - {"serialNum", _LOCATION}):
+            columnData = _readColumns(groups, typeName, paramName, indexInData[typeName])
+            indexed = columnData is not None and _writeIndexedParam(
+                typeGroup, paramName, columnData, rowsByColumn, present.shape, storage
+            )
+            complete = complete and indexed
+
+        # whether queries for all parameters of this type can be answered from the index
+        typeGroup.attrs["complete"] = complete
+
+
+def _readColumns(groups, typeName, paramName, indexInDataByColumn) -> Optional[Dict[int, np.ndarray]]:
+    """Read the data of a parameter at each time node, ordered like the layout, or None if it cannot be indexed."""
+    columnData = {}
+    for column, indexInData in indexInDataByColumn.items():
+        typeGroup = groups[column][typeName]
+        if paramName not in typeGroup:
+            return None
+
+        dataSet = typeGroup[paramName]
+        if dataSet.attrs.get("specialFormatting", False) or "serializerName" in dataSet.attrs:
+            return None
+        if dataSet.ndim == 0 or dataSet.shape[0] != len(indexInData):
+            # not one value per object of this type, e.g. a placeholder for a parameter that was never set
+            return None
+
+        columnData[column] = dataSet[()][indexInData]
+
+    return columnData
+
+
+def _writeIndexedParam(typeGroup, paramName, columnData, rowsByColumn, shape, storage) -> bool:
+    """Gather the data of each time node into a single [row x time node] dataset, if they are compatible."""
+    first = next(iter(columnData.values()))
+    for data in columnData.values():
+        if data.dtype.kind not in _NUMERIC_KINDS or data.dtype.kind != first.dtype.kind:
+            return False
+        if data.shape[1:] != first.shape[1:]:
+            return False
+
+    dtype = np.result_type(*columnData.values())
+    indexed = np.zeros(shape + first.shape[1:], dtype=dtype)
+    for column, data in columnData.items():
+        indexed[rowsByColumn[column], column] = data
+
+    typeGroup.create_dataset(paramName, data=indexed, **storage.datasetKwargs(indexed))
+    return True
+
+
+def dropHistoryIndex(h5db):
+    """Remove the history index from a database file, if it has one."""
+    if HISTORY_INDEX_GROUP in h5db:
+        del h5db[HISTORY_INDEX_GROUP]
+
+
+class HistoryIndex:
+    """Answers history queries from the history index of a database."""
+
+    def __init__(self, indexGroup):
+        self._group = indexGroup
+        self._columns = {name.decode(): i for i, name in enumerate(indexGroup["groupNames"][()])}
+
+    @classmethod
+    def read(cls, h5db) -> Optional["HistoryIndex"]:
+        """Return the history index of a database file, or None if it does not have one."""
+        if HISTORY_INDEX_GROUP not in h5db:
+            return None
+        return cls(h5db[HISTORY_INDEX_GROUP])
+
+    def getHistories(self, comps, params: Optional[Sequence[str]], groups: List) -> Optional[Histories]:
+        """
+        Get the histories of some parameters of some objects over some time node groups.
+
+        Returns None if the index cannot answer the query, because it does not cover one of the groups, object types,
+        or parameters.
+        """
+        if any(g.name.lstrip("/") not in self._columns for g in groups):
+            return None
+
+        compsByType = collections.defaultdict(list)
+        for c in comps:
+            compsByType[c.__class__.__name__].append(c)
+
+        paramsByType = {}
+        for typeName in compsByType:
+            if typeName not in self._group:
+                return None
+            typeGroup = self._group[typeName]
+            typeParams = params if params is not None else self._storedParams(typeName)
+            if typeParams is None or any(p not in typeGroup for p in typeParams):
+                return None
+            paramsByType[typeName] = typeParams
+
+        columns = [self._columns[g.name.lstrip("/")] for g in groups]
+        timeSteps = [(int(g.attrs["cycle"]), int(g.attrs["timeNode"])) for g in groups]
+        histData: Histories = {c: collections.defaultdict(collections.OrderedDict) for c in comps}
+
+        for typeName, typeComps in compsByType.items():
+            typeGroup = self._group[typeName]
+            allSerialNums = typeGroup["serialNum"][()]
+            serialNums = np.array([c.p.serialNum for c in typeComps])
+            rows = np.minimum(np.searchsorted(allSerialNums, serialNums), len(allSerialNums) - 1)
+            # objects that never appear in the database have no history
+            found = allSerialNums[rows] == serialNums
+            typeComps = [c for c, f in zip(typeComps, found) if f]
+            rows = rows[found]
+            if not typeComps:
+                continue
+
+            # h5py needs increasing, unique rows
+            uniqueRows, inverse = np.unique(rows, return_inverse=True)
+            present = typeGroup["present"][uniqueRows][:, columns][inverse]
+
+            for paramName in paramsByType[typeName]:
+                if paramName == "serialNum":
+                    # the serial number of an object is that of its row, at every time node
+                    data = np.repeat(allSerialNums[rows][:, np.newaxis], len(columns), axis=1)
+                else:
+                    data = typeGroup[paramName][uniqueRows][:, columns][inverse]
+                for c, compPresent, compData in zip(typeComps, present, data):
+                    for timeStep, isPresent, val in zip(timeSteps, compPresent, compData.tolist()):
+                        if not isPresent:
+                            continue
+                        if paramName == _LOCATION:
+                            val = tuple(val)
+                        elif isinstance(val, list):
+                            val = np.array(val)
+                        histData[c][paramName][timeStep] = val
+
+        return histData
+
+    def _storedParams(self, typeName) -> Optional[List[str]]:
+        """All parameters of a type, if every one of them is in the index."""
+        typeGroup = self._group[typeName]
+        if not typeGroup.attrs.get("complete", False):
+            return None
+        return [name for name in typeGroup.keys() if name not in ("present", _LOCATION)]
@@ -25,19 +25,23 @@ versioning information.
 """
 
 import collections
+import itertools
 from typing import (
     Any,
     Dict,
+    Iterable,
     List,
     Optional,
     Tuple,
     Type,
+    Union,
 )
 
 import numpy as np
 
 from armi import runLog
 from armi.reactor import grids
+from armi.reactor.assemblies import Assembly
 from armi.reactor.components import Component
 from armi.reactor.composites import ArmiObject
 from armi.reactor.excoreStructure import ExcoreStructure
@@ -309,10 +313,59 @@ class Layout:
             runLog.error("Failed to get layout information from group: {}".format(h5group.name))
             raise e
 
-    def _initComps(self, caseTitle, bp):
+    def _parentIndices(self) -> List[Optional[int]]:
+        """Return the layout index of the parent of each object in the layout, or None for the root."""
+        parents = []
+        # each entry is [layout index, number of its children not yet visited]
+        stack = []
+        for i, numChildren in enumerate(self.numChildren):
+            while stack and stack[-1][1] == 0:
+                stack.pop()
+            if stack:
+                parents.append(stack[-1][0])
+                stack[-1][1] -= 1
+            else:
+                parents.append(None)
+            stack.append([i, numChildren])
+
+        return parents
+
+    def selectAssemblies(self, assemblies: Iterable[Union[str, Tuple[int, ...]]]) -> np.ndarray:
+        """
+        Return a mask of the objects in the layout to build when only some assemblies are needed.
+
+        Assemblies are selected by name, or by the grid indices of their location, e.g. ``(1, 2)`` or ``(1, 2, 0)``.
+        Objects that are not part of an assembly are always kept, so the selection is still a complete tree; only the
+        unselected assemblies and their children are dropped.
+        """
+        names = {a for a in assemblies if isinstance(a, str)}
+        indices = {tuple(a) for a in assemblies if not isinstance(a, str)}
+
+        keep = np.ones(len(self.type), dtype=bool)
+        for i, (compType, name, location, parent) in enumerate(
+            zip(self.type, self.name, self.location, self._parentIndices())
+        ):
+            if parent is not None and not keep[parent]:
+                keep[i] = False
+            elif issubclass(ArmiObject.TYPES[compType], Assembly) and name not in names:
+                keep[i] = location is not None and any(tuple(location[: len(index)]) == index for index in indices)
+
+        return keep
+
+    def _initComps(self, caseTitle, bp, keep: Optional[np.ndarray] = None):
         comps = []
         groupedComps = collections.defaultdict(list)
 
+        numChildren = self.numChildren
+        if keep is not None:
+            # dropped objects no longer count as children of their parents
+            numChildren = np.array(self.numChildren)
+            for i, parent in enumerate(self._parentIndices()):
+                if not keep[i] and parent is not None and keep[parent]:
+                    numChildren[parent] -= 1
+        else:
+            keep = itertools.repeat(True)
+
         for (
             compType,
             name,
@@ -323,17 +376,22 @@ class Layout:
             material,
             temperatures,
             gridIndex,
+            kept,
         ) in zip(
             self.type,
             self.name,
             self.serialNum,
-            self.numChildren,
+            numChildren,
             self.location,
             self.locationType,
             self.material,
             self.temperatures,
             self.gridIndex,
+            keep,
         ):
+            if not kept:
+                continue
+
             Klass = ArmiObject.TYPES[compType]
 
             if issubclass(Klass, Reactor):
@@ -0,0 +1,180 @@
+# Copyright 2026 TerraPower, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+HDF5 storage policies for parameter datasets in the ARMI database.
+
+A :py:class:`StoragePolicy` decides which HDF5 filters (compression, shuffle) and which chunk shape are used when a
+parameter dataset is written. A :py:class:`StoragePolicies` object holds the default policy along with any overrides,
+keyed on parameter name or parameter category, and picks the policy for each parameter as it is written.
+
+Filters are transparent to readers, so databases written with any policy are read the same way.
+"""
+
+from typing import Dict, Optional
+
+import numpy as np
+
+from armi.settings.fwSettings.databaseSettings import (
+    CONF_DB_AUTO_COMPRESS_MIN_BYTES,
+    CONF_DB_CHUNK_ROWS,
+    CONF_DB_COMPRESSION,
+    CONF_DB_COMPRESSION_LEVEL,
+    CONF_DB_SHUFFLE,
+    CONF_DB_STORAGE_OVERRIDES,
+)
+
+COMPRESSION_NONE = "none"
+COMPRESSION_GZIP = "gzip"
+COMPRESSION_LZF = "lzf"
+COMPRESSION_AUTO = "auto"
+COMPRESSION_OPTIONS = (COMPRESSION_NONE, COMPRESSION_GZIP, COMPRESSION_LZF, COMPRESSION_AUTO)
+
+
+class StoragePolicy:
+    """
+    How a single dataset is laid out and filtered in the HDF5 file.
+
+    Parameters
+    ----------
+    compression : str
+        One of ``"none"``, ``"gzip"``, ``"lzf"`` or ``"auto"``. ``"auto"`` writes datasets smaller than
+        ``autoMinBytes`` uncompressed and gzips the rest.
+    level : int
+        gzip compression level, 0-9. Ignored for other compressions.
+    shuffle : bool
+        Whether to apply the HDF5 byte-shuffle filter ahead of compression.
+    chunkRows : int
+        Number of objects per chunk along the first (object-index) axis. Zero lets h5py choose the chunk shape.
+        Chunks always span the full extent of the remaining axes, so reading one object's data never touches more
+        than one chunk.
+    autoMinBytes : int
+        Size threshold, in bytes, below which ``"auto"`` does not compress.
+    """
+
+    def __init__(
+        self,
+        compression: str = COMPRESSION_GZIP,
+        level: int = 4,
+        shuffle: bool = False,
+        chunkRows: int = 0,
+        autoMinBytes: int = 16384,
+    ):
+        if compression not in COMPRESSION_OPTIONS:
+            raise ValueError(f"Unknown database compression `{compression}`; expected one of {COMPRESSION_OPTIONS}")
+        if not 0 <= level <= 9:
+            raise ValueError(f"gzip compression level must be between 0 and 9, got {level}")
+        if chunkRows < 0:
+            raise ValueError(f"chunkRows must be non-negative, got {chunkRows}")
+
+        self.compression = compression
+        self.level = level
+        self.shuffle = shuffle
+        self.chunkRows = chunkRows
+        self.autoMinBytes = autoMinBytes
+
+    def __repr__(self):
+        return "<{} compression={} level={} shuffle={} chunkRows={}>".format(
+            self.__class__.__name__, self.compression, self.level, self.shuffle, self.chunkRows
+        )
+
+    def __eq__(self, other):
+        return isinstance(other, StoragePolicy) and vars(self) == vars(other)
+
+    def update(self, **overrides) -> "StoragePolicy":
+        """Return a copy of this policy with some of its attributes replaced."""
+        kwargs = dict(vars(self))
+        kwargs.update(overrides)
+        return StoragePolicy(**kwargs)
+
+    def datasetKwargs(self, data: np.ndarray) -> Dict:
+        """
+        Build the keyword arguments to pass to ``h5py.Group.create_dataset`` for ``data``.
+
+        Scalar and empty datasets cannot be chunked, so they are always written contiguous and unfiltered.
+        """
+        if data.ndim == 0 or data.size == 0:
+            return {}
+
+        compression = self.compression
+        if compression == COMPRESSION_AUTO:
+            compression = COMPRESSION_NONE if data.nbytes < self.autoMinBytes else COMPRESSION_GZIP
+
+        kwargs = {}
+        if compression == COMPRESSION_GZIP:
+            kwargs["compression"] = "gzip"
+            kwargs["compression_opts"] = self.level
+        elif compression == COMPRESSION_LZF:
+            kwargs["compression"] = "lzf"
+
+        # shuffling single-byte data (bools, byte strings) does nothing
+        if self.shuffle and kwargs and data.dtype.itemsize > 1:
+            kwargs["shuffle"] = True
+
+        if self.chunkRows and (kwargs or data.shape[0] > self.chunkRows):
+            kwargs["chunks"] = (min(self.chunkRows, data.shape[0]),) + data.shape[1:]
+
+        return kwargs
+
+
+class StoragePolicies:
+    """
+    The storage policy for every parameter written to a database.
+
+    Overrides are looked up first by parameter name, then by parameter category; the first category of a parameter
+    that has an override wins. Parameters with no override use the default policy.
+    """
+
+    def __init__(self, default: Optional[StoragePolicy] = None, overrides: Optional[Dict[str, StoragePolicy]] = None):
+        self.default = default or StoragePolicy()
+        self.overrides = dict(overrides or {})
+
+    @classmethod
+    def fromSettings(cls, cs) -> "StoragePolicies":
+        """
+        Build the storage policies from case settings.
+
+        ``dbStorageOverrides`` maps a parameter name or category to a dictionary of :py:class:`StoragePolicy`
+        attributes to replace in the default policy, e.g. ``{"pinQuantities": {"compression": "lzf",
+        "shuffle": True}}``.
+        """
+        default = StoragePolicy(
+            compression=cs[CONF_DB_COMPRESSION],
+            level=cs[CONF_DB_COMPRESSION_LEVEL],
+            shuffle=cs[CONF_DB_SHUFFLE],
+            chunkRows=cs[CONF_DB_CHUNK_ROWS],
+            autoMinBytes=cs[CONF_DB_AUTO_COMPRESS_MIN_BYTES],
+        )
+        overrides = {}
+        for key, attrs in (cs[CONF_DB_STORAGE_OVERRIDES] or {}).items():
+            try:
+                overrides[key] = default.update(**attrs)
+            except TypeError as ee:
+                raise ValueError(f"Invalid database storage override for `{key}`: {attrs}") from ee
+
+        return cls(default, overrides)
+
+    def forParam(self, paramDef) -> StoragePolicy:
+        """Return the storage policy to use for a parameter definition."""
+        if not self.overrides:
+            return self.default
+
+        if paramDef.name in self.overrides:
+            return self.overrides[paramDef.name]
+
+        for category in sorted(paramDef.categories):
+            if category in self.overrides:
+                return self.overrides[category]
+
+        return self.default
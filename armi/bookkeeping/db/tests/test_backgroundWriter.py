@@ -0,0 +1,74 @@
+# Copyright 2026 TerraPower, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the background database writer."""
+
+import threading
+import unittest
+
+from armi.bookkeeping.db.backgroundWriter import BackgroundWriter
+
+
+class MockDatabase:
+    """Records the snapshots it is asked to write, optionally waiting on an event before each write."""
+
+    def __init__(self, failOn=None):
+        self.written = []
+        self.failOn = failOn
+        self.proceed = threading.Event()
+        self.proceed.set()
+
+    def writeSnapshot(self, snapshot):
+        self.proceed.wait()
+        if snapshot == self.failOn:
+            raise OSError("disk full")
+        self.written.append(snapshot)
+
+
+class TestBackgroundWriter(unittest.TestCase):
+    def test_writesInOrder(self):
+        db = MockDatabase()
+        writer = BackgroundWriter(db, maxQueued=2)
+        for snapshot in range(5):
+            writer.submit(snapshot)
+        writer.flush()
+        self.assertEqual(db.written, list(range(5)))
+
+        writer.stop()
+        self.assertFalse(writer.isAlive)
+        with self.assertRaises(RuntimeError):
+            writer.submit(5)
+
+    def test_stopWritesPending(self):
+        db = MockDatabase()
+        db.proceed.clear()
+        writer = BackgroundWriter(db, maxQueued=3)
+        for snapshot in range(3):
+            writer.submit(snapshot)
+        self.assertEqual(db.written, [])
+
+        db.proceed.set()
+        writer.stop()
+        self.assertEqual(db.written, [0, 1, 2])
+
+    def test_errorIsRaised(self):
+        db = MockDatabase(failOn=1)
+        writer = BackgroundWriter(db, maxQueued=3)
+        for snapshot in range(3):
+            writer.submit(snapshot)
+        with self.assertRaises(RuntimeError):
+            writer.flush()
+
+        # snapshots after the failed one are dropped
+        self.assertEqual(db.written, [0])
+        writer.stop()
@@ -194,6 +194,34 @@ class TestCompareDB3(unittest.TestCase):
         self.assertIn("Reactor/flags mean(diff)", diffs.diffs)
         self.assertEqual(diffs.nDiffs(), 3)
 
+        # the same comparison, sharded over processes and read in chunks, gives the same results
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            shardedDiffs = compareDatabases(
+                dbs[0]._fullPath,
+                dbs[1]._fullPath,
+                timestepCompare=[(0, 0), (0, 1)],
+                processes=2,
+                chunkRows=1,
+                reportTiming=True,
+            )
+        self.assertEqual(shardedDiffs._columns, diffs._columns)
+        self.assertEqual(shardedDiffs._structureDiffs, diffs._structureDiffs)
+        self.assertEqual(shardedDiffs.nDiffs(), diffs.nDiffs())
+        self.assertEqual(sorted(shardedDiffs.diffs), sorted(diffs.diffs))
+
+        # stopping early still reports the first difference
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            firstDiff = compareDatabases(
+                dbs[0]._fullPath,
+                dbs[1]._fullPath,
+                timestepCompare=[(0, 0), (0, 1)],
+                stopAtFirstDiff=True,
+            )
+        self.assertGreater(firstDiff.nDiffs(), 0)
+        self.assertLessEqual(firstDiff.nDiffs(), diffs.nDiffs())
+
     def test_diffSpecialData(self):
         dr = DiffResults(0.01)
 
@@ -293,6 +321,25 @@ class TestCompareDB3(unittest.TestCase):
         _diffSimpleData(refData, srcData3, dr)
         self.assertEqual(dr.nDiffs(), 3)
 
+    def test_diffSimpleDataChunked(self):
+        whole = DiffResults(0.0)
+        chunked = DiffResults(0.0)
+        with h5py.File(self._testMethodName + ".h5", "w") as f:
+            ref = np.arange(100, dtype="<f8").reshape(50, 2)
+            src = ref * 1.01
+            src[7, 1] = 0.0
+            refData = f.create_group("ref").create_dataset("percentBu", data=ref)
+            srcData = f.create_group("src").create_dataset("percentBu", data=src)
+
+            with warnings.catch_warnings():
+                warnings.filterwarnings("ignore")
+                _diffSimpleData(refData, srcData, whole)
+            _diffSimpleData(refData, srcData, chunked, chunkRows=7)
+
+        self.assertEqual(sorted(chunked.diffs), sorted(whole.diffs))
+        for key, values in whole.diffs.items():
+            self.assertAlmostEqual(chunked.diffs[key][0], values[0])
+
     def test_compareAuxData(self):
         dr = DiffResults(0.01)
 
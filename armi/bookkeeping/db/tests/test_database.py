@@ -30,6 +30,7 @@ from armi.bookkeeping.db.databaseInterface import DatabaseInterface
 from armi.bookkeeping.db.jaggedArray import JaggedArray
 from armi.reactor import parameters
 from armi.reactor.excoreStructure import ExcoreCollection, ExcoreStructure
+from armi.reactor.flags import Flags
 from armi.reactor.grids import CoordinateLocation, MultiIndexLocation
 from armi.reactor.reactors import Core, Reactor
 from armi.reactor.spentFuelPool import SpentFuelPool
@@ -151,6 +152,104 @@ class TestDatabase(unittest.TestCase):
         with self.assertRaises(RuntimeError):
             self.db.fileName = "whatever.h5"
 
+    def test_loadPartial(self):
+        """Load only some assemblies and some parameters from the database."""
+        # arrays of different lengths are written as a jagged array, which is unpacked as a whole
+        for ii, b in enumerate(self.r.core.iterBlocks()):
+            b.p.detailedNDens = np.arange(ii % 3 + 1, dtype=float)
+        self.makeShuffleHistory()
+        del self.db.h5db["c00n00/Reactor/missingParam"]
+        full = self.db.load(0, 1)
+        grid = full.core.spatialGrid
+        centerAssem = full.core.childrenByLocator[grid[0, 0, 0]]
+        otherAssem = full.core.childrenByLocator[grid[1, 0, 0]]
+
+        r = self.db.load(0, 1, assemblies=[centerAssem.name, (1, 0)], params=["percentBu", "detailedNDens"])
+        self.assertEqual(r.p.timeNode, 1)
+        self.assertEqual(
+            sorted(a.name for a in r.core),
+            sorted([centerAssem.name, otherAssem.name]),
+        )
+
+        molesHmBOLDefault = r.core.getFirstBlock().p.pDefs["molesHmBOL"].default
+        for a in r.core:
+            fullAssem = full.core.getAssemblyByName(a.name)
+            self.assertEqual(a.spatialLocator.getRingPos(), fullAssem.spatialLocator.getRingPos())
+            self.assertEqual(len(a), len(fullAssem))
+            for b, fullB in zip(a, fullAssem):
+                self.assertEqual(b.p.serialNum, fullB.p.serialNum)
+                self.assertEqual(b.p.percentBu, fullB.p.percentBu)
+                np.testing.assert_array_equal(b.p.detailedNDens, fullB.p.detailedNDens)
+                # parameters that were not requested keep their defaults, but the composition is always loaded
+                self.assertEqual(b.p.molesHmBOL, molesHmBOLDefault)
+                self.assertAlmostEqual(b.getHMMass(), fullB.getHMMass())
+
+    def test_historyIndex(self):
+        """Histories read from the history index match those read from the time nodes."""
+        self.makeShuffleHistory()
+        assems = [self.r.core[0], self.r.core[-1]]
+        blocks = [assems[0][0], assems[0][-1], assems[1][1]]
+        params = ["serialNum", "location", "chargeTime", "percentBu"]
+        timeSteps = [(0, 1), (1, 0)]
+        expected = self.db.getHistories(assems, params[:3])
+        expectedBlocks = self.db.getHistories(blocks, params[::3], timeSteps)
+        expectedAll = self.db.getHistories(assems)
+
+        self.db.writeHistoryIndex()
+        self.assertIn("historyIndex", self.db.h5db)
+        with patch.object(Database, "_readHistories", side_effect=AssertionError("index not used")):
+            self.assertEqual(self.db.getHistories(assems, params[:3]), expected)
+            self.assertEqual(self.db.getHistories(blocks, params[::3], timeSteps), expectedBlocks)
+
+        # not every assembly parameter can be indexed, so this falls back to reading the time nodes
+        self.assertEqual(self.db.getHistories(assems).keys(), expectedAll.keys())
+
+        # writing another time node drops the index
+        self.r.p.cycle, self.r.p.timeNode = 2, 0
+        self.db.writeToDB(self.r)
+        self.assertNotIn("historyIndex", self.db.h5db)
+
+    def test_loadView(self):
+        """A view of a time node has the same structure and values as the loaded reactor."""
+        self.makeShuffleHistory()
+        r = self.db.load(0, 1, allowMissing=True)
+        view = self.db.loadView(0, 1)
+
+        self.assertIs(view.armiType, Reactor)
+        self.assertEqual(view.p.timeNode, 1)
+        self.assertEqual(len(view.core), len(r.core))
+        self.assertEqual(len(view.getChildren(deep=True)), len(r.getChildren(deep=True)))
+
+        for a, aView in zip(r.core, view.core):
+            self.assertEqual(a.name, aView.name)
+            self.assertIs(aView.getAncestor(lambda c: c.parent is None), view)
+            for b, bView in zip(a, aView):
+                self.assertEqual(b.p.serialNum, bView.p["serialNum"])
+                self.assertEqual(b.p.percentBu, bView.p.percentBu)
+                self.assertEqual(b.p.height, bView.p.height)
+                self.assertEqual(b.hasFlags(Flags.FUEL), bView.hasFlags(Flags.FUEL))
+                self.assertEqual(len(b.getChildren()), len(bView.getChildren()))
+
+        # only the datasets that were touched are read; parameters without a dataset just have their default
+        blockData = view.core[0][0].p._data
+        self.assertIn("height", blockData._datasetNames)
+        touched = ["flags", "height", "percentBu", "serialNum"]
+        self.assertEqual(sorted(blockData._cache), [name for name in touched if name in blockData._datasetNames])
+
+        # dimensions linked to other components are read as the links
+        componentViews = {cView.name: cView for cView in view.core[0][0]}
+        for c in r.core[0][0]:
+            cView = componentViews[c.name]
+            for dimName in c.DIMENSION_NAMES:
+                value = c.p[dimName]
+                if isinstance(value, tuple):
+                    self.assertEqual(cView.p[dimName], f"{value[0].name}.{value[1]}")
+
+        with self.assertRaises(AttributeError):
+            view.core[0].p.chargeTime = 1.0
+        with self.assertRaises(AttributeError):
+            view.p.notAParameter
+
     def test_loadSortSetting(self):
         self.makeShuffleHistory()
 
@@ -355,7 +454,7 @@ class TestDatabaseSmaller(unittest.TestCase):
         self._compareArrays(data, roundTrip)
 
     def test_getArrayShape(self):
-        """Tests a helper method for ``_writeParams``."""
+        """Tests a helper method for ``_packParams``."""
         base = [1, 2, 3, 4]
         self.assertEqual(Database._getArrayShape(base), (4,))
         self.assertEqual(Database._getArrayShape(tuple(base)), (4,))
@@ -23,6 +23,7 @@ from numpy.testing import assert_allclose, assert_equal
 
 from armi import __version__ as version
 from armi import interfaces, runLog, settings
+from armi.bookkeeping.db.backgroundWriter import BackgroundWriter
 from armi.bookkeeping.db.database import Database
 from armi.bookkeeping.db.databaseInterface import DatabaseInterface
 from armi.cases import case
@@ -240,6 +241,31 @@ class TestDatabaseInterface(unittest.TestCase):
         self.dbi.interactEOL()
         self.assertTrue(os.path.exists(self.dbi.database.fileName))
 
+    def test_backgroundWrite(self):
+        """Time nodes written in the background hold the state at the time they were submitted."""
+        self.o.cs["syncDbAfterWrite"] = False
+        self.dbi._writer = BackgroundWriter(self.dbi._db)
+        r = self.r
+        b = r.core.getFirstBlock()
+
+        for timeNode in range(2):
+            r.p.cycle, r.p.timeNode = 0, timeNode
+            b.p.flux = 100.0 * (timeNode + 1)
+            self.dbi.interactEveryNode(r.p.cycle, r.p.timeNode)
+            # changing the reactor right away must not change what gets written
+            b.p.flux = -1.0
+
+        # accessing the database waits for the pending writes
+        histories = self.dbi.database.getHistory(b, ["flux"], [(0, 0), (0, 1)])
+        self.assertEqual(histories["flux"][0, 0], 100.0)
+        self.assertEqual(histories["flux"][0, 1], 200.0)
+
+        self.dbi.interactEOL()
+        self.assertIsNone(self.dbi._writer)
+        with Database(self._testMethodName + ".h5", "r") as db:
+            self.assertTrue(db.hasTimeStep(0, 1))
+            self.assertTrue(db.hasTimeStep(0, 1, "EOL"))
+
     def test_writeDBFromDBLoadSameDir(self):
         """
         Test to ensure that a reactor loaded from a database can be written to a
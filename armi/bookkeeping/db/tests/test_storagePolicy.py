@@ -0,0 +1,99 @@
+# Copyright 2026 TerraPower, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the database storage policies."""
+
+import unittest
+
+import h5py
+import numpy as np
+
+from armi import settings
+from armi.bookkeeping.db.storagePolicy import StoragePolicies, StoragePolicy
+from armi.reactor.blocks import Block
+from armi.utils.directoryChangers import TemporaryDirectoryChanger
+
+
+class TestStoragePolicy(unittest.TestCase):
+    def test_defaultIsGzip(self):
+        kwargs = StoragePolicy().datasetKwargs(np.arange(10.0))
+        self.assertEqual(kwargs, {"compression": "gzip", "compression_opts": 4})
+
+    def test_noCompression(self):
+        kwargs = StoragePolicy(compression="none").datasetKwargs(np.arange(10.0))
+        self.assertEqual(kwargs, {})
+
+    def test_auto(self):
+        policy = StoragePolicy(compression="auto", autoMinBytes=800)
+        self.assertEqual(policy.datasetKwargs(np.arange(10.0)), {})
+        self.assertEqual(policy.datasetKwargs(np.arange(100.0))["compression"], "gzip")
+
+    def test_shuffleAndChunks(self):
+        policy = StoragePolicy(compression="lzf", shuffle=True, chunkRows=8)
+        kwargs = policy.datasetKwargs(np.zeros((20, 3, 2)))
+        self.assertEqual(kwargs, {"compression": "lzf", "shuffle": True, "chunks": (8, 3, 2)})
+
+        # shuffle is pointless on single-byte data, and the chunk cannot be larger than the data
+        kwargs = policy.datasetKwargs(np.zeros(5, dtype=bool))
+        self.assertEqual(kwargs, {"compression": "lzf", "chunks": (5,)})
+
+    def test_scalarAndEmpty(self):
+        self.assertEqual(StoragePolicy().datasetKwargs(np.array(1.0)), {})
+        self.assertEqual(StoragePolicy().datasetKwargs(np.array([])), {})
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            StoragePolicy(compression="zstd")
+        with self.assertRaises(ValueError):
+            StoragePolicy(level=10)
+
+    def test_roundTrip(self):
+        data = np.linspace(0.0, 1.0, 1000).reshape(100, 10)
+        policy = StoragePolicy(compression="gzip", level=9, shuffle=True, chunkRows=16)
+        with TemporaryDirectoryChanger():
+            with h5py.File("policy.h5", "w") as hf:
+                hf.create_dataset("data", data=data, **policy.datasetKwargs(data))
+            with h5py.File("policy.h5", "r") as hf:
+                dataset = hf["data"]
+                self.assertEqual(dataset.compression, "gzip")
+                self.assertEqual(dataset.compression_opts, 9)
+                self.assertTrue(dataset.shuffle)
+                self.assertEqual(dataset.chunks, (16, 10))
+                np.testing.assert_array_equal(dataset[()], data)
+
+
+class TestStoragePolicies(unittest.TestCase):
+    def test_forParam(self):
+        pDefs = Block.pDefs
+        cs = settings.Settings().modified(
+            newSettings={
+                "dbCompression": "auto",
+                "dbStorageOverrides": {
+                    "newDPA": {"compression": "none"},
+                    "cumulative": {"compression": "lzf", "shuffle": True},
+                },
+            }
+        )
+        policies = StoragePolicies.fromSettings(cs)
+        self.assertEqual(policies.default.compression, "auto")
+        self.assertEqual(policies.forParam(pDefs["newDPA"]).compression, "none")
+        self.assertEqual(policies.forParam(pDefs["percentBuByPin"]), policies.default)
+
+        cumulative = policies.forParam(pDefs["percentBu"])
+        self.assertEqual(cumulative.compression, "lzf")
+        self.assertTrue(cumulative.shuffle)
+
+    def test_badOverride(self):
+        cs = settings.Settings().modified(newSettings={"dbStorageOverrides": {"newDPA": {"filter": "lzf"}}})
+        with self.assertRaises(ValueError):
+            StoragePolicies.fromSettings(cs)
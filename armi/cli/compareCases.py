@@ -93,6 +93,30 @@ class CompareCases(EntryPoint):
             help="The database to be used as the comparison, evaluated case.",
         )
         parser.add_argument("--output", "-o", type=str, default="", help="Output file name.")
+        parser.add_argument(
+            "--processes",
+            default=1,
+            type=int,
+            help="Number of local processes to spread the comparison of individual parameters over.",
+        )
+        parser.add_argument(
+            "--chunkRows",
+            default=None,
+            type=int,
+            help="Read and compare large numeric datasets this many rows at a time, to limit memory use.",
+        )
+        parser.add_argument(
+            "--stopAtFirstDiff",
+            action="store_true",
+            default=False,
+            help="Stop comparing as soon as any difference is found.",
+        )
+        parser.add_argument(
+            "--reportTiming",
+            action="store_true",
+            default=False,
+            help="Report the time spent comparing, and the size of, each parameter.",
+        )
 
     def parse(self, args):
         EntryPoint.parse(self, args)
@@ -112,6 +136,10 @@ class CompareCases(EntryPoint):
             tolerance=self.args.tolerance,
             exclusions=self.args.exclude,
             timestepCompare=self.args.timestepCompare,
+            processes=self.args.processes,
+            chunkRows=self.args.chunkRows,
+            stopAtFirstDiff=self.args.stopAtFirstDiff,
+            reportTiming=self.args.reportTiming,
         )
         return diffs.nDiffs()
 
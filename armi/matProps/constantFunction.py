@@ -14,6 +14,8 @@
 
 """A constant function to a single float value in a material YAML file."""
 
+import numpy as np
+
 from armi.matProps.function import Function
 
 
@@ -53,3 +55,7 @@ class ConstantFunction(Function):
     def _calcSpecific(self, point: dict) -> float:
         """Returns a constant value."""
         return self.value
+
+    def _calcArraySpecific(self, points: dict) -> np.ndarray:
+        """Returns a constant value at every point."""
+        return np.full(np.shape(next(iter(points.values()))), self.value)
@@ -0,0 +1,214 @@
+# Copyright 2026 TerraPower, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+A cache of the compiled equations of symbolic functions.
+
+Turning an equation string from a YAML file into a Python callable goes through sympy (``parse_expr`` and
+``lambdastr``), which is slow, and importing sympy itself is slower still. Each equation is therefore only translated
+once: the resulting lambda source is kept in memory, keyed by a hash of the equation and its variables, and optionally
+on disk, so that other processes never need sympy for equations that have been seen before. Unpickling a symbolic
+function only compiles the lambda source it carries, which is looked up in memory by the source itself.
+
+The on-disk cache is off by default. It is turned on by setting the ``MATPROPS_EXPRESSION_CACHE`` environment variable
+to a directory, or by calling ``setCacheDir``.
+"""
+
+import hashlib
+import math
+import os
+import types
+
+import numpy as np
+
+# Increment this if the way equations are translated to lambda source changes.
+_FORMAT_VERSION = 1
+
+# directory the lambda sources are stored in, or None to only cache them in memory
+cacheDir = os.environ.get("MATPROPS_EXPRESSION_CACHE") or None
+
+# d[key of equation and variables] = lambda source
+_sources = {}
+# d[lambda source] = CompiledExpression
+_compiled = {}
+
+# A stand-in for the math module whose functions are numpy ufuncs, so the sympy-generated lambdas (which call e.g.
+# ``math.exp``) accept arrays. Anything numpy does not provide falls back to the math module.
+_ARRAY_MATH = types.SimpleNamespace(**{name: getattr(math, name) for name in dir(math) if not name.startswith("_")})
+for _name, _ufunc in {
+    "acos": np.arccos,
+    "acosh": np.arccosh,
+    "asin": np.arcsin,
+    "asinh": np.arcsinh,
+    "atan": np.arctan,
+    "atan2": np.arctan2,
+    "atanh": np.arctanh,
+    "ceil": np.ceil,
+    "cos": np.cos,
+    "cosh": np.cosh,
+    "exp": np.exp,
+    "expm1": np.expm1,
+    "fabs": np.fabs,
+    "floor": np.floor,
+    "log10": np.log10,
+    "log1p": np.log1p,
+    "log2": np.log2,
+    "sin": np.sin,
+    "sinh": np.sinh,
+    "sqrt": np.sqrt,
+    "tan": np.tan,
+    "tanh": np.tanh,
+}.items():
+    setattr(_ARRAY_MATH, _name, _ufunc)
+
+
+def _arrayLog(x, base=None):
+    return np.log(x) if base is None else np.log(x) / np.log(base)
+
+
+_ARRAY_MATH.log = _arrayLog
+
+
+class CompiledExpression:
+    """
+    An equation compiled from lambda source, in a scalar and an array form.
+
+    Attributes
+    ----------
+    source : str
+        The lambda source, e.g. ``"lambda T: (2.0*T + 1.0)"``.
+    scalar : callable
+        The lambda, evaluated with the ``math`` module. It takes floats and behaves exactly like the source.
+    array : callable
+        The lambda, evaluated with numpy ufuncs in place of the ``math`` functions, so it also takes arrays.
+    """
+
+    def __init__(self, source: str):
+        self.source = source
+        code = compile(source, "<matProps equation>", "eval")
+        self.scalar = eval(code, {"math": math})
+        self.array = eval(code, {"math": _ARRAY_MATH})
+
+
+def setCacheDir(path: str) -> None:
+    """
+    Set the directory the lambda sources of equations are stored in.
+
+    Parameters
+    ----------
+    path: str
+        Directory to store the sources in, or None to only cache them in memory.
+    """
+    global cacheDir
+    cacheDir = path
+
+
+def clear() -> None:
+    """Clears the equations cached in memory. The on-disk cache is left alone."""
+    _sources.clear()
+    _compiled.clear()
+
+
+def getExpression(equation: str, varNames: list) -> CompiledExpression:
+    """
+    Returns the compiled form of an equation, translating it with sympy only if it has never been seen before.
+
+    Parameters
+    ----------
+    equation: str
+        The equation, as written in the YAML file.
+    varNames: list of str
+        The independent variables, in the order of the arguments of the compiled lambdas.
+
+    Returns
+    -------
+    CompiledExpression
+        The compiled equation.
+    """
+    key = _getKey(equation, varNames)
+    source = _sources.get(key)
+    if source is None:
+        source = _readSource(key)
+    if source is None:
+        source = _translate(equation, varNames)
+        _writeSource(key, source)
+    _sources[key] = source
+
+    return fromSource(source)
+
+
+def fromSource(source: str) -> CompiledExpression:
+    """
+    Returns the compiled form of a lambda source, e.g. when a symbolic function is unpickled.
+
+    Parameters
+    ----------
+    source: str
+        The lambda source.
+
+    Returns
+    -------
+    CompiledExpression
+        The compiled lambda source.
+    """
+    expression = _compiled.get(source)
+    if expression is None:
+        expression = CompiledExpression(source)
+        _compiled[source] = expression
+
+    return expression
+
+
+def _getKey(equation: str, varNames: list) -> str:
+    text = f"{_FORMAT_VERSION}\n{equation}\n{','.join(varNames)}"
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def _translate(equation: str, varNames: list) -> str:
+    """Translate an equation into lambda source with sympy."""
+    # sympy is slow to import, so it is only imported when an equation is not cached
+    from sympy import symbols
+    from sympy.parsing import parse_expr
+    from sympy.utilities.lambdify import lambdastr
+
+    symbolList = [symbols(var) for var in varNames]
+    return lambdastr(symbolList, parse_expr(equation, evaluate=False))
+
+
+def _readSource(key: str):
+    if cacheDir is None:
+        return None
+
+    try:
+        with open(os.path.join(cacheDir, key + ".txt"), "r") as f:
+            return f.read() or None
+    except OSError:
+        return None
+
+
+def _writeSource(key: str, source: str) -> None:
+    if cacheDir is None:
+        return
+
+    path = os.path.join(cacheDir, key + ".txt")
+    tmpPath = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(cacheDir, exist_ok=True)
+        with open(tmpPath, "w") as f:
+            f.write(source)
+        # atomically, so other processes never read half of a source
+        os.replace(tmpPath, path)
+    except OSError:
+        # the cache is only an optimization
+        pass
@@ -14,6 +14,8 @@
 
 """Generic class for a function to be defined in a YAML."""
 
+import numpy as np
+
 
 class Function:
     """
@@ -75,7 +77,8 @@ class Function:
         """
         Calculate the quantity of a specific Property.
 
-        The user must provide a "point" dictionary, or kwargs, but not both or neither.
+        The user must provide a "point" dictionary, or kwargs, but not both or neither. If any of the values are arrays,
+        the function is evaluated at every point at once; see ``calcArray``.
 
         Parameters
         ----------
@@ -86,7 +89,7 @@ class Function:
 
         Returns
         -------
-        float
+        float or np.ndarray
             property evaluation
         """
         # This method should take in one dictionary or a set of kwargs, but not both
@@ -101,6 +104,9 @@ class Function:
         else:
             data = kwargs
 
+        if any(isinstance(val, (np.ndarray, list, tuple)) for val in data.values()):
+            return self._calcArray(data)
+
         # input sanity checking
         if not self.independentVars.keys() <= data.keys():
             raise KeyError(
@@ -133,6 +139,55 @@ class Function:
         """
         return self.__call__(point=point, **kwargs)
 
+    def calcArray(self, point: dict = None, **kwargs) -> np.ndarray:
+        """
+        Calculate the quantity of a specific Property at many points at once.
+
+        The values of the independent variables are arrays (or scalars) that are broadcast against each other, so e.g.
+        the density of every component can be computed from an array of their temperatures in a single call. The
+        bounds are checked once for all of the points.
+
+        Parameters
+        ----------
+        point: dict
+            dictionary of independent variable/array pairs
+        kwargs:
+            dictionary of independent variable/array pairs, same purpose but to allow a nicer API.
+
+        Returns
+        -------
+        np.ndarray
+            property evaluations, in the broadcast shape of the inputs
+        """
+        if point is not None and kwargs:
+            raise ValueError("Please provide either a single dictionary or a set of kwargs, but not both.")
+        elif point is None and not kwargs:
+            raise ValueError("Please provide at least one input to this method.")
+
+        return self._calcArray(point or kwargs)
+
+    def _calcArray(self, data: dict) -> np.ndarray:
+        """Check the points in a dictionary of arrays and evaluate the function at all of them."""
+        if not self.independentVars.keys() <= data.keys():
+            raise KeyError(
+                f"Material {self.material.name}, Property {self.property.name}: Specified points {data} do not contain "
+                f"the correct independent variables: {self.independentVars}"
+            )
+
+        # a function without independent variables still returns one value per point
+        varNames = list(self.independentVars) or list(data)
+        arrays = np.broadcast_arrays(*[np.asarray(data[var], dtype=float) for var in varNames])
+        points = dict(zip(varNames, arrays))
+        inRange = self.inRangeArray(points)
+        if not inRange.all():
+            badPoint = {var: vals[~inRange][0] for var, vals in points.items()}
+            raise ValueError(
+                f"Material {self.material.name}, Property {self.property.name}: {np.count_nonzero(~inRange)} requested "
+                f"calculation points, e.g. {badPoint}, are not in the valid range of the function"
+            )
+
+        return self._calcArraySpecific(points)
+
     def clear(self):
         self.tableData = None
 
@@ -215,6 +270,25 @@ class Function:
                 return False
         return True
 
+    def inRangeArray(self, points: dict) -> np.ndarray:
+        """
+        Determine which of many points are within range of the function.
+
+        Parameters
+        ----------
+        points: dict
+            dictionary of independent variable/array pairs, all of the same shape
+
+        Returns
+        -------
+        np.ndarray
+            boolean array, True where the point is in the valid range.
+        """
+        inRange = np.ones(np.shape(next(iter(points.values()), 0.0)), dtype=bool)
+        for var, bounds in self.independentVars.items():
+            inRange &= (points[var] >= bounds[0]) & (points[var] <= bounds[1])
+        return inRange
+
     def __repr__(self):
         """Provides string representation of Function object."""
         return f"<{self.__class__.__name__}>"
@@ -356,3 +430,26 @@ class Function:
             property evaluation at specified independent variable point
         """
         raise NotImplementedError()
+
+    def _calcArraySpecific(self, points: dict) -> np.ndarray:
+        """
+        Private method that evaluates the property at many points at once.
+
+        This falls back to evaluating each point with ``_calcSpecific``; child classes override it with a vectorized
+        expression.
+
+        Parameters
+        ----------
+        points : dict
+            dictionary of independent variable/array pairs, all of the same shape and within the valid range
+
+        Returns
+        -------
+        np.ndarray
+            property evaluations at the specified points
+        """
+        shape = np.shape(next(iter(points.values()), 0.0))
+        flat = {var: np.ravel(vals) for var, vals in points.items()}
+        numPoints = int(np.prod(shape))
+        values = [self._calcSpecific({var: float(vals[i]) for var, vals in flat.items()}) for i in range(numPoints)]
+        return np.array(values, dtype=float).reshape(shape)
@@ -15,34 +15,41 @@
 """Some basic interpolation routines."""
 
 import math
+from bisect import bisect_left
 
+import numpy as np
 
-def findIndex(val: float, x: list) -> int:
+
+def findIndex(val: float, x: list, hint: int = None) -> int:
     """
     Find the location of the provided value in the provided collection.
 
+    The interval is found with a binary search, unless the value is in the interval given by ``hint``, e.g. the one
+    found for the previous value when evaluating nearby values one after another.
+
     Parameters
     ----------
     val: float
         Value whose index is needed in x
     x: list
-        List of numbers
+        Sorted list of numbers
+    hint: int, optional
+        Index of the interval to check first
 
     Returns
     -------
     int
-        Integer containing index wherein x[i] <= Tc <= x[i+1]
+        Integer containing the first index i wherein x[i] <= Tc <= x[i+1]
     """
-    if val < x[0]:
-        raise ValueError(f"Value {val} out of bounds: {x}")
+    if hint is not None and 0 <= hint < len(x) - 1 and x[hint] <= val <= x[hint + 1]:
+        # a value on the lower edge of the hint also belongs to the interval below it, if there is one
+        if val != x[hint] or hint == 0:
+            return hint
 
-    for ii in range(len(x) - 1):
-        Tc1 = x[ii]
-        Tc2 = x[ii + 1]
-        if val >= Tc1 and val <= Tc2:
-            return ii
+    if not x[0] <= val <= x[-1]:
+        raise ValueError(f"Value {val} out of bounds: {x}")
 
-    raise ValueError(f"Value {val} out of bounds: {x}")
+    return max(bisect_left(x, val) - 1, 0)
 
 
 def linearLinear(Tc: float, x: list, y: list) -> float:
@@ -91,3 +98,54 @@ def logLinear(Tc: float, x: list, y: list) -> float:
     Tc1: float = math.log10(x[ii])
     Tc2: float = math.log10(x[ii + 1])
     return (math.log10(Tc) - Tc1) / (Tc2 - Tc1) * (y[ii + 1] - y[ii]) + y[ii]
+
+
+def findIndices(vals: np.ndarray, x: list) -> np.ndarray:
+    """
+    Find the locations of many values in the provided collection; the vectorized form of ``findIndex``.
+
+    Parameters
+    ----------
+    vals: np.ndarray
+        Values whose indices are needed in x
+    x: list
+        Sorted list of numbers
+
+    Returns
+    -------
+    np.ndarray
+        Integer array containing the first index i wherein x[i] <= val <= x[i+1] for each value
+    """
+    x = np.asarray(x, dtype=float)
+    vals = np.asarray(vals, dtype=float)
+    outOfBounds = (vals < x[0]) | (vals > x[-1])
+    if outOfBounds.any():
+        raise ValueError(f"Value {vals[outOfBounds][0]} out of bounds: {x.tolist()}")
+
+    return np.clip(np.searchsorted(x, vals, side="left") - 1, 0, len(x) - 2)
+
+
+def linearLinearArray(Tc: np.ndarray, x: list, y: list) -> np.ndarray:
+    """
+    Find the approximate values on a XY table assuming a linear-linear curve; the vectorized form of ``linearLinear``.
+
+    Parameters
+    ----------
+    Tc: np.ndarray
+        Independent variable values at which interpolation values are desired.
+    x: list
+        List of independent variable values
+    y: list
+        List of dependent variable values
+
+    Returns
+    -------
+    np.ndarray
+        Interpolation values based on a linear-linear interpolation.
+    """
+    ii = findIndices(Tc, x)
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    Tc1 = x[ii]
+    Tc2 = x[ii + 1]
+    return (Tc - Tc1) / (Tc2 - Tc1) * (y[ii + 1] - y[ii]) + y[ii]
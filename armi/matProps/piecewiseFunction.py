@@ -20,6 +20,8 @@ Each piece can be of any other type that matProps supports.
 
 import math
 
+import numpy as np
+
 from armi.matProps.function import Function
 
 
@@ -76,6 +78,9 @@ class PiecewiseFunction(Function):
         self.functions = []
         """List of Function objects used to compose PiecewiseFunction object."""
 
+        self._lastFunction = None
+        """The sub-function used by the last evaluation, checked first by the next one."""
+
     def __repr__(self):
         """Provides string representation of PiecewiseFunction object."""
         msg = "<PiecewiseFunction "
@@ -89,6 +94,7 @@ class PiecewiseFunction(Function):
         for fun in self.functions:
             del fun
         self.functions.clear()
+        self._lastFunction = None
 
     def _parseSpecific(self, node):
         """
@@ -148,8 +154,45 @@ class PiecewiseFunction(Function):
         float
             property evaluation at specified independent variable point
         """
+        # Sub-functions may share a boundary, where the first one listed is used, so the last sub-function used can
+        # only be reused for points strictly inside of it.
+        subFunc = self._lastFunction
+        if subFunc is not None and all(
+            bounds[0] < point[var] < bounds[1] for var, bounds in subFunc.independentVars.items()
+        ):
+            return subFunc.calc(point)
+
         for subFunc in self.functions:
             if subFunc.inRange(point):
+                self._lastFunction = subFunc
                 return subFunc.calc(point)
 
         raise ValueError("PiecewiseFunction error, could not evaluate")
+
+    def _calcArraySpecific(self, points: dict) -> np.ndarray:
+        """
+        Evaluates each sub-function at the points that are in its range.
+
+        Parameters
+        ----------
+        points: dict
+            dictionary of independent variable/array pairs
+
+        Returns
+        -------
+        np.ndarray
+            property evaluations at the specified points
+        """
+        shape = np.shape(next(iter(points.values())))
+        result = np.empty(shape)
+        remaining = np.ones(shape, dtype=bool)
+        for subFunc in self.functions:
+            inSub = remaining & subFunc.inRangeArray(points)
+            if inSub.any():
+                result[inSub] = subFunc.calcArray({var: vals[inSub] for var, vals in points.items()})
+                remaining &= ~inSub
+
+        if remaining.any():
+            raise ValueError("PiecewiseFunction error, could not evaluate")
+
+        return result
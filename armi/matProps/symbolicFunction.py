@@ -14,14 +14,12 @@
 
 """A generic symbolic function support for curves in a material YAML file."""
 
-# Import math so that it is available for the eval statement
 import math
 from copy import copy
 
-from sympy import symbols
-from sympy.parsing import parse_expr
-from sympy.utilities.lambdify import lambdastr
+import numpy as np
 
+from armi.matProps import expressionCache
 from armi.matProps.function import Function
 
 
@@ -57,6 +55,8 @@ class SymbolicFunction(Function):
         super().__init__(mat, prop)
         self.eqn = None
         self.sympyStr = None
+        # the equation, evaluated with numpy ufuncs so that it takes arrays
+        self._eqnArray = None
 
     def _parseSpecific(self, node):
         """
@@ -70,12 +70,11 @@ class SymbolicFunction(Function):
         eqn = str(node["function"]["equation"])
 
         try:
-            symbolList = []
-            for var in self.independentVars:
-                symbolList.append(symbols(var))
-            sympyEqn = parse_expr(eqn, evaluate=False)
-            self.sympyStr = lambdastr(symbolList, sympyEqn)
-            self.eqn = eval(self.sympyStr)
+            # sympy only translates equations that have not been seen before
+            expression = expressionCache.getExpression(eqn, list(self.independentVars))
+            self.sympyStr = expression.source
+            self.eqn = expression.scalar
+            self._eqnArray = expression.array
 
             # Try evaluating the function at the maximum bound. This should result in a number if the equation is
             # properly formatted. Bad equations will throw an error either in the `lambdastr` `eval` or this `float( )`
@@ -109,6 +108,32 @@ class SymbolicFunction(Function):
 
         return float(result)
 
+    def _calcArraySpecific(self, points: dict) -> np.ndarray:
+        """
+        Returns evaluations of a symbolic function at many points.
+
+        Parameters
+        ----------
+        points: dict
+            dictionary of independent variable/array pairs
+        """
+        shape = np.shape(next(iter(points.values())))
+        try:
+            with np.errstate(divide="raise", over="raise", invalid="raise"):
+                result = self._eqnArray(*[points[var] for var in self.independentVars])
+        except (TypeError, ValueError, ArithmeticError):
+            # the equation uses functions that only take scalars, or fails at some points; evaluating one point at a
+            # time gives the same results and errors as calc
+            return super()._calcArraySpecific(points)
+
+        if np.iscomplexobj(result):
+            raise ValueError(f"Function is undefined at some of {points}. Evaluates to complex numbers: {result}")
+        result = np.broadcast_to(np.asarray(result, dtype=float), shape).copy()
+        if np.isnan(result).any():
+            raise ValueError(f"Function is undefined at some of {points}. Evaluates to not a number.")
+
+        return result
+
     def __repr__(self):
         """Provides string representation of SymbolicFunction object."""
         return f"<SymbolicFunction {self.sympyStr}>"
@@ -116,8 +141,12 @@ class SymbolicFunction(Function):
     def __getstate__(self):
         d = copy(self.__dict__)
         d["eqn"] = None
+        d["_eqnArray"] = None
         return d
 
     def __setstate__(self, s):
         self.__dict__ = s
-        self.eqn = eval(self.sympyStr)
+        # the lambda source is compiled once per process, no matter how many times the function is unpickled
+        expression = expressionCache.fromSource(self.sympyStr)
+        self.eqn = expression.scalar
+        self._eqnArray = expression.array
@@ -14,7 +14,9 @@
 
 """A simple implementation for a one dimensional table to replace analytic curves in the YAML data files."""
 
-from armi.matProps.interpolationFunctions import linearLinear
+import numpy as np
+
+from armi.matProps.interpolationFunctions import findIndex, linearLinearArray
 from armi.matProps.tableFunction import TableFunction
 
 
@@ -58,6 +60,15 @@ class TableFunction1D(TableFunction):
         self._values = []
         """List of property values for TableFunction1D object."""
 
+        self._slopes = []
+        """List of the slopes of the segments between consecutive table points."""
+
+        self._var1Array = np.array([])
+        self._valueArray = np.array([])
+
+        self._lastIndex = 0
+        """Index of the segment used by the last evaluation, checked first by the next one."""
+
     def __repr__(self):
         """Provides string representation of TableFunction1D object."""
         return "<TableFunction1D>"
@@ -89,6 +100,24 @@ class TableFunction1D(TableFunction):
             self._var1s.append(float(val[0]))
             self._values.append(float(val[1]))
 
+        self._precompute()
+
+    def _precompute(self):
+        """Precompute the slopes of the segments of the table, and arrays of the table for evaluating many points."""
+        # the segments are found by binary search, which needs the breakpoints in order
+        if any(x2 < x1 for x1, x2 in zip(self._var1s, self._var1s[1:])):
+            raise ValueError(
+                f"Material {self.material.name}, Property {self.property.name}: The tabulated values of the "
+                f"independent variable must be in increasing order: {self._var1s}"
+            )
+
+        self._slopes = [
+            (y2 - y1) / (x2 - x1) if x2 != x1 else 0.0
+            for x1, x2, y1, y2 in zip(self._var1s, self._var1s[1:], self._values, self._values[1:])
+        ]
+        self._var1Array = np.array(self._var1s)
+        self._valueArray = np.array(self._values)
+
     def _calcSpecific(self, point: dict) -> float:
         """
         Performs a linear interpolation on tabular data.
@@ -98,8 +127,23 @@ class TableFunction1D(TableFunction):
         point: dict
             dictionary of independent variable/value pairs
         """
-        var = list(self.independentVars.keys())[0]
+        var = next(iter(self.independentVars))
         if var in point:
-            return linearLinear(point[var], self._var1s, self._values)
+            val = point[var]
+            ii = findIndex(val, self._var1s, self._lastIndex)
+            self._lastIndex = ii
+            return self._values[ii] + self._slopes[ii] * (val - self._var1s[ii])
 
         raise ValueError(f"Specified point does contain the correct independent variables: {self.independentVars}")
+
+    def _calcArraySpecific(self, points: dict) -> np.ndarray:
+        """
+        Performs a linear interpolation on tabular data at many points.
+
+        Parameters
+        ----------
+        points: dict
+            dictionary of independent variable/array pairs
+        """
+        var = next(iter(self.independentVars))
+        return linearLinearArray(points[var], self._var1Array, self._valueArray)
@@ -15,8 +15,11 @@
 """A simple implementation for a 2D table to replace analytic curves in the YAML data files."""
 
 import copy
+import math
 
-from armi.matProps.interpolationFunctions import findIndex, logLinear
+import numpy as np
+
+from armi.matProps.interpolationFunctions import findIndex, findIndices
 from armi.matProps.tableFunction import TableFunction
 
 
@@ -62,6 +65,17 @@ class TableFunction2D(TableFunction):
         self._data = []
         """List containing all of the property values in TableFunction2D object."""
 
+        self._logRowValues = []
+        """List containing the base 10 logarithms of the row values, which are interpolated log-linearly."""
+
+        self._columnArray = np.array([])
+        self._logRowArray = np.array([])
+        self._dataArray = np.array([])
+
+        self._lastColumnIndex = 0
+        self._lastRowIndex = 0
+        """Indices of the cell used by the last evaluation, checked first by the next one."""
+
     def __repr__(self):
         """Provides string representation of TableFunction2D object."""
         return "<TableFunction2D>"
@@ -130,6 +144,25 @@ class TableFunction2D(TableFunction):
                 value = var1DependentData[cIndex]
                 self._data[cIndex].append(None if value in ("null", None) else float(value))
 
+        self._precompute()
+
+    def _precompute(self):
+        """Precompute the logarithms of the row values, and arrays of the table for evaluating many points."""
+        # the cells are found by binary search, which needs the breakpoints in order
+        for name, values in (("column", self._columnValues), ("row", self._rowValues)):
+            if any(v2 < v1 for v1, v2 in zip(values, values[1:])):
+                raise ValueError(
+                    f"Material {self.material.name}, Property {self.property.name}: The {name} values of the table "
+                    f"must be in increasing order: {values}"
+                )
+
+        # rows that cannot be log-interpolated only fail if they are used
+        self._logRowValues = [math.log10(rVal) if rVal > 0.0 else math.nan for rVal in self._rowValues]
+        self._columnArray = np.array(self._columnValues)
+        self._logRowArray = np.array(self._logRowValues)
+        # null values become NaN
+        self._dataArray = np.array(self._data, dtype=float)
+
     def _calcSpecific(self, point: dict) -> float:
         """
         Performs 2D interpolation on tabular data.
@@ -147,9 +180,47 @@ class TableFunction2D(TableFunction):
         else:
             raise ValueError(f"Specified point does contain the correct independent variables: {self.independentVars}")
 
-        cIndex = findIndex(columnVal, self._columnValues)
-        rVal0 = logLinear(rowVal, self._rowValues, self._data[cIndex])
-        rVal1 = logLinear(rowVal, self._rowValues, self._data[cIndex + 1])
+        cIndex = findIndex(columnVal, self._columnValues, self._lastColumnIndex)
+        rIndex = findIndex(rowVal, self._rowValues, self._lastRowIndex)
+        self._lastColumnIndex = cIndex
+        self._lastRowIndex = rIndex
+
+        logRow0 = self._logRowValues[rIndex]
+        rowFrac = (math.log10(rowVal) - logRow0) / (self._logRowValues[rIndex + 1] - logRow0)
+        if math.isnan(rowFrac):
+            raise ValueError(f"Row value {rowVal} cannot be log-interpolated between rows: {self._rowValues}")
+
+        column0 = self._data[cIndex]
+        column1 = self._data[cIndex + 1]
+        rVal0 = rowFrac * (column0[rIndex + 1] - column0[rIndex]) + column0[rIndex]
+        rVal1 = rowFrac * (column1[rIndex + 1] - column1[rIndex]) + column1[rIndex]
         cVal0 = self._columnValues[cIndex]
         cVal1 = self._columnValues[cIndex + 1]
         return (columnVal - cVal0) / (cVal1 - cVal0) * (rVal1 - rVal0) + rVal0
+
+    def _calcArraySpecific(self, points: dict) -> np.ndarray:
+        """
+        Performs 2D interpolation on tabular data at many points.
+
+        Parameters
+        ----------
+        points: dict
+            dictionary of independent variable/array pairs
+        """
+        columnVar, rowVar = list(self.independentVars.keys())[:2]
+        columnVals = points[columnVar]
+        rowVals = points[rowVar]
+
+        cIndex = findIndices(columnVals, self._columnArray)
+        rIndex = findIndices(rowVals, self._rowValues)
+        data = self._dataArray
+        logRows = self._logRowArray
+        rowFrac = (np.log10(rowVals) - logRows[rIndex]) / (logRows[rIndex + 1] - logRows[rIndex])
+        rVal0 = rowFrac * (data[cIndex, rIndex + 1] - data[cIndex, rIndex]) + data[cIndex, rIndex]
+        rVal1 = rowFrac * (data[cIndex + 1, rIndex + 1] - data[cIndex + 1, rIndex]) + data[cIndex + 1, rIndex]
+        if np.isnan(rVal0).any() or np.isnan(rVal1).any():
+            raise ValueError(f"Specified points require null values of the table: {self.independentVars}")
+
+        cVal0 = self._columnArray[cIndex]
+        cVal1 = self._columnArray[cIndex + 1]
+        return (columnVals - cVal0) / (cVal1 - cVal0) * (rVal1 - rVal0) + rVal0
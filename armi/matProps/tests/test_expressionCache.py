@@ -0,0 +1,90 @@
+# Copyright 2026 TerraPower, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the cache of compiled symbolic equations."""
+
+import os
+import pickle
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from armi.matProps import expressionCache
+from armi.matProps.material import MatPropsMaterial
+
+
+class TestExpressionCache(unittest.TestCase):
+    def setUp(self):
+        self.yaml = {
+            "file format": "TESTS",
+            "material type": "Metal",
+            "composition": {"a": "balance"},
+            "density": {
+                "function": {
+                    "type": "symbolic",
+                    "T": {"min": 0.0, "max": 500.0},
+                    "equation": "2.0 * exp(T / 500.0) + T",
+                }
+            },
+        }
+        self._cacheDir = expressionCache.cacheDir
+        expressionCache.clear()
+
+    def tearDown(self):
+        expressionCache.setCacheDir(self._cacheDir)
+        expressionCache.clear()
+
+    def loadMaterial(self):
+        mat = MatPropsMaterial()
+        mat.loadNode(self.yaml)
+        return mat
+
+    def test_translatedOnce(self):
+        with mock.patch.object(expressionCache, "_translate", wraps=expressionCache._translate) as translate:
+            mat1 = self.loadMaterial()
+            mat2 = self.loadMaterial()
+            self.assertEqual(translate.call_count, 1)
+
+        self.assertIs(mat1.rho.eqn, mat2.rho.eqn)
+        self.assertAlmostEqual(mat1.rho.calc(T=250.0), 2.0 * np.exp(0.5) + 250.0)
+
+        # unpickling reattaches the compiled equation instead of compiling it again
+        unpickled = pickle.loads(pickle.dumps(mat1))
+        self.assertIs(unpickled.rho.eqn, mat1.rho.eqn)
+        self.assertAlmostEqual(unpickled.rho.calc(T=250.0), mat1.rho.calc(T=250.0))
+
+    def test_onDiskCache(self):
+        with tempfile.TemporaryDirectory() as cacheDir:
+            expressionCache.setCacheDir(os.path.join(cacheDir, "expressions"))
+            mat1 = self.loadMaterial()
+            self.assertEqual(len(os.listdir(os.path.join(cacheDir, "expressions"))), 1)
+
+            # a new process only has the files, and does not need sympy
+            expressionCache.clear()
+            with mock.patch.object(expressionCache, "_translate", side_effect=AssertionError("translated")):
+                mat2 = self.loadMaterial()
+
+            self.assertEqual(mat1.rho.sympyStr, mat2.rho.sympyStr)
+            self.assertAlmostEqual(mat1.rho.calc(T=100.0), mat2.rho.calc(T=100.0))
+
+    def test_arrayForm(self):
+        mat = self.loadMaterial()
+        temps = np.linspace(0.0, 500.0, 11)
+        self.assertTrue(np.allclose(mat.rho.calcArray(T=temps), [mat.rho.calc(T=temp) for temp in temps]))
+
+        expression = expressionCache.fromSource("lambda T: (math.log(T, 10) + math.sqrt(T))")
+        self.assertTrue(np.allclose(expression.array(np.array([1.0, 100.0])), [1.0, 12.0]))
+        self.assertAlmostEqual(expression.scalar(100.0), 12.0)
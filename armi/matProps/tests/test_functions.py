@@ -14,6 +14,8 @@
 
 """Unit tests for the Function class."""
 
+import numpy as np
+
 from armi.matProps.material import MatPropsMaterial
 from armi.matProps.tests import MatPropsFunTestBase
 
@@ -122,6 +124,31 @@ class TestFunctions(MatPropsFunTestBase):
         with self.assertRaises(KeyError):
             mat.loadNode(materialData)
 
+    def test_calcArray(self):
+        mat = self._createFunction({"type": "symbolic", "equation": "2.0 * T + 1.0"})
+        fun = mat.rho
+
+        temps = np.array([-100.0, 0.0, 250.0, 500.0])
+        self.assertTrue(np.array_equal(fun.calcArray(T=temps), 2.0 * temps + 1.0))
+        self.assertTrue(np.array_equal(fun({"T": temps}), 2.0 * temps + 1.0))
+        self.assertEqual(fun.calcArray(T=[]).shape, (0,))
+
+        # constant equations still give a value at every point
+        constant = self._createFunction(self.baseConstantData).rho
+        self.assertTrue(np.array_equal(constant.calcArray(T=temps), np.full(4, 9123.5)))
+
+        with self.assertRaises(ValueError):
+            fun.calcArray({"T": temps}, T=temps)
+
+        with self.assertRaises(ValueError):
+            fun.calcArray()
+
+        with self.assertRaises(KeyError):
+            fun.calcArray({"Z": temps})
+
+        with self.assertRaisesRegex(ValueError, "1 requested calculation points"):
+            fun.calcArray(T=[0.0, 501.0])
+
     def test_references(self):
         materialData = {
             "file format": "TESTS",
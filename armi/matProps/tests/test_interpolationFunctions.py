@@ -41,6 +41,26 @@ class TestInterpolationFunctions(unittest.TestCase):
         with self.assertRaises(ValueError):
             findIndex(9, x)
 
+    def test_findIndexHint(self):
+        x = [2, 4, 6, 8]
+        for hint in [None, 0, 1, 2, 3, -1]:
+            self.assertEqual(findIndex(2, x, hint), 0)
+            self.assertEqual(findIndex(4, x, hint), 0)
+            self.assertEqual(findIndex(4.001, x, hint), 1)
+            self.assertEqual(findIndex(6, x, hint), 1)
+            self.assertEqual(findIndex(7, x, hint), 2)
+            self.assertEqual(findIndex(8, x, hint), 2)
+            with self.assertRaises(ValueError):
+                findIndex(9, x, hint)
+
+        # a sweep over a fine table gives the same intervals as a linear search
+        x = np.linspace(0.0, 1000.0, 501).tolist()
+        hint = 0
+        for val in np.concatenate([np.linspace(0.0, 1000.0, 2003), np.linspace(1000.0, 0.0, 1999)]):
+            hint = findIndex(val, x, hint)
+            expected = next(ii for ii in range(len(x) - 1) if x[ii] <= val <= x[ii + 1])
+            self.assertEqual(hint, expected)
+
     def test_linearLinear(self):
         """
         Test which validates the values returned from the linear-linear interpolation method.
@@ -20,6 +20,8 @@ import pickle
 import timeit
 import unittest
 
+import numpy as np
+
 import armi.matProps
 
 # NOTE: This is a sketchy magic number for testing that are heavily machine dependent.
@@ -69,6 +71,26 @@ class TestPerformance(unittest.TestCase):
 
         self.assertLess(t, _LIMIT_SECONDS, msg="matProps material calculation takes too long to execute.")
 
+    def test_calcArray(self):
+        """Tests the per-point cost of calculating a property value at many points at once."""
+        armi.matProps.clear()
+
+        testFiles = os.path.join(os.path.dirname(__file__), "testMaterialsData")
+        armi.matProps.loadAll(testFiles)
+        mat = armi.matProps.getMaterial("materialA")
+        prop = mat.rho
+        temps = np.linspace(prop.getMinBound("T"), prop.getMaxBound("T"), 10000)
+
+        tArray = timeit.timeit(lambda: prop.calcArray(T=temps), number=10) / 10
+        tLoop = timeit.timeit(lambda: [prop.calc(T=temp) for temp in temps], number=1)
+
+        self.assertLess(tArray, _LIMIT_SECONDS, msg="matProps material calculation takes too long to execute.")
+        self.assertLess(
+            tArray / len(temps),
+            tLoop / len(temps),
+            msg="matProps calculation over an array costs more per point than calculating one point at a time.",
+        )
+
     def test_deepcopy(self):
         """
         Tests the speed of deepcopying a material. Copying is important for copying other objects that may be
@@ -14,6 +14,8 @@
 
 """Tests related to piecewise functions."""
 
+import numpy as np
+
 from armi.matProps.material import MatPropsMaterial
 from armi.matProps.tests import MatPropsFunTestBase
 
@@ -75,6 +77,21 @@ class TestPiecewiseFunction(MatPropsFunTestBase):
         with self.assertRaises(ValueError):
             func.calc({"T": 0})
 
+    def test_piecewiseEqnEvalRepeated(self):
+        """Tests that reusing the last sub function still evaluates shared boundaries with the first one listed."""
+        func = self._createFunction(self.basePiecewiseData).rho
+        for temp, expected in [(30, 99), (40, 99), (25.4, 10), (25.41, 99), (50, 99), (75, -99), (50, 99)]:
+            self.assertAlmostEqual(func.calc({"T": temp}), expected)
+
+    def test_piecewiseEqnEvalArray(self):
+        """Tests that a PiecewiseFunction evaluates each of many points with the appropriate sub function."""
+        func = self._createFunction(self.basePiecewiseData).rho
+        vals = func.calcArray(T=[0, 25.4, 25.41, 50, 50.1, 100])
+        self.assertTrue(np.allclose(vals, [10, 10, 99, 99, -99, -99]))
+
+        with self.assertRaises(ValueError):
+            func.calcArray(T=[50, 100.1])
+
     def test_piecewiseEqnGap(self):
         """Test that PiecewiseFunction evaluates correctly with gaps."""
         data = {
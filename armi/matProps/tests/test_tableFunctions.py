@@ -139,6 +139,42 @@ class TestTableFunctions(MatPropsFunTestBase):
         self.assertAlmostEqual(func.calc({"T": 355.6559, "t": 100}), 463.6559)
         self.assertAlmostEqual(func.calc({"T": 355.6559, "t": 177.828}), 476.155906)
 
+    def test_interpolationTablesArray(self):
+        """Test that evaluating table functions at arrays of points matches evaluating them one point at a time."""
+        func = self._createFunction(self.baseOneDimTableData, self.baseOneDimTable).rho
+        temps = np.linspace(0.0, 100.0, 9)
+        vals = func.calcArray(T=temps)
+        self.assertEqual(vals.shape, temps.shape)
+        for temp, val in zip(temps, vals):
+            self.assertAlmostEqual(val, func.calc(T=temp))
+
+        func = self._createFunction(self.baseTwoDimTableData, self.baseTwoDimTable).rho
+        temps = np.array([[2, 200, 355.6559], [100, 632.4555, 200]])
+        times = np.array([[1, 100, 177.828], [10, 316.2278, 177.828]])
+        vals = func(T=temps, t=times)
+        self.assertEqual(vals.shape, temps.shape)
+        for temp, time, val in zip(temps.flat, times.flat, vals.flat):
+            self.assertAlmostEqual(val, func.calc(T=temp, t=time))
+
+        # scalars are broadcast against the arrays
+        self.assertTrue(np.allclose(func.calcArray(T=[2, 200], t=100), [110, 308]))
+
+        with self.assertRaises(ValueError):
+            func.calcArray(T=[2, 700], t=1)
+
+    def test_unsortedTables(self):
+        """Tables whose breakpoints are out of order are rejected when they are loaded."""
+        with self.assertRaisesRegex(ValueError, "increasing order"):
+            self._createFunction(self.baseOneDimTableData, [[0.0, 5.0], [100.0, 105.0], [50.0, 55.0]])
+
+        unsortedColumns = [[None, [200.0, 2.0, 632.4555]]] + self.baseTwoDimTable[1:]
+        with self.assertRaisesRegex(ValueError, "column values"):
+            self._createFunction(self.baseTwoDimTableData, unsortedColumns)
+
+        unsortedRows = [self.baseTwoDimTable[0], self.baseTwoDimTable[2], self.baseTwoDimTable[1]]
+        with self.assertRaisesRegex(ValueError, "row values"):
+            self._createFunction(self.baseTwoDimTableData, unsortedRows)
+
     def test_interpolationTable2DMissNode(self):
         """Test to make sure TableFunction2D throws a KeyError if 'tabulated data' node is absent."""
         with self.assertRaisesRegex(KeyError, "tabulated data"):
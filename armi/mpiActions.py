@@ -56,13 +56,19 @@ and override the :py:meth:`~armi.mpiActions.MpiAction.invokeHook` method.
 
 import collections
 import gc
+import hashlib
+import itertools
 import math
 import pickle
 import timeit
+import weakref
+
+import numpy as np
 
 from armi import context, interfaces, runLog, settings, utils
-from armi.reactor import reactors
-from armi.reactor.parameters import parameterDefinitions
+from armi.reactor import composites, reactors
+from armi.reactor.parameters import parameterDefinitions, parameterSync
+from armi.settings.fwSettings.globalSettings import CONF_INCREMENTAL_DISTRIBUTE
 from armi.utils import iterables, tabulate
 
 
@@ -535,6 +541,12 @@ class MpiActionError(Exception):
 
 
 class DistributeStateAction(MpiAction):
+    _lastDistributed = (None, None, None)
+    """
+    A weak reference to the reactor most recently distributed incrementally from this process, its layout, and the
+    identities of its replaceable state.
+    """
+
     def __init__(self, skipInterfaces=False):
         MpiAction.__init__(self)
         self._skipInterfaces = skipInterfaces
@@ -545,6 +557,10 @@ class DistributeStateAction(MpiAction):
         Notes
         -----
         This is run by all workers and the primary any time the code needs to sync all processors.
+
+        If the ``incrementalDistributeState`` setting is enabled, only the reactor changes since the last distribute
+        are sent whenever the workers' reactors can be reconciled with the primary's. See
+        ``_distributeReactorChanges``.
         """
         if context.MPI_SIZE <= 1:
             runLog.extra("Not distributing state because there is only one processor")
@@ -555,10 +571,24 @@ class DistributeStateAction(MpiAction):
         # like the MPI Comm and the SQL database connections.
         runLog.info("Distributing State")
         start = timeit.default_timer()
+        incremental = False
         try:
             cs = self._distributeSettings()
 
-            self._distributeReactor(cs)
+            if cs[CONF_INCREMENTAL_DISTRIBUTE]:
+                incremental = self._distributeReactorChanges(cs)
+            if not incremental:
+                self._distributeReactor(cs)
+            if context.MPI_RANK == 0:
+                # the layout is only needed, and worth walking the reactor for, by the next incremental distribute
+                if cs[CONF_INCREMENTAL_DISTRIBUTE]:
+                    DistributeStateAction._lastDistributed = (
+                        weakref.ref(self.r),
+                        _getReactorLayout(self.r),
+                        _getReplaceableState(self.r),
+                    )
+                else:
+                    DistributeStateAction._lastDistributed = (None, None, None)
             DistributeStateAction._distributeParamAssignments()
 
             if self._skipInterfaces:
@@ -589,9 +619,10 @@ class DistributeStateAction(MpiAction):
 
         beforeCollection = timeit.default_timer()
 
-        # force collection; we've just created a bunch of objects that don't need to be used again.
-        runLog.debug("Forcing garbage collection.")
-        gc.collect()
+        if not incremental:
+            # force collection; we've just created a bunch of objects that don't need to be used again.
+            runLog.debug("Forcing garbage collection.")
+            gc.collect()
 
         stop = timeit.default_timer()
         runLog.extra(
@@ -637,6 +668,50 @@ class DistributeStateAction(MpiAction):
         # attach here so any interface actions use a properly-setup reactor.
         self.o.reattach(self.r, cs)  # sets r and cs
 
+    def _distributeReactorChanges(self, cs):
+        """
+        Bring the workers' reactors up to date by sending only what changed since the last distribute.
+
+        The primary sends the structural changes to the direct children of the Core and the ex-core structures
+        (removals, moves, and pickled copies of new or internally-modified objects) along with the parameters changed
+        ``SINCE_LAST_DISTRIBUTE_STATE`` and the cross section library of the Core, if it was replaced. This requires
+        that every worker still holds the reactor from the previous distribute, unchanged (or synchronized) since then.
+
+        Returns
+        -------
+        bool
+            True if all ranks are up to date, False if the changes could not be reconciled and the caller must fall
+            back to broadcasting the whole reactor.
+        """
+        delta = None
+        if context.MPI_RANK == 0:
+            lastReactorRef, lastLayout, lastState = DistributeStateAction._lastDistributed
+            if lastReactorRef is not None and lastReactorRef() is self.r:
+                delta = _ReactorDelta.fromReactor(self.r, lastLayout, lastState)
+        delta = self.broadcast(delta)
+        if delta is None:
+            return False
+
+        ok = context.MPI_RANK == 0 or delta.canApplyTo(self.r)
+        if not all(context.MPI_COMM.allgather(ok)):
+            runLog.info("Worker reactors cannot be reconciled with the primary; distributing the whole reactor.")
+            return False
+
+        if context.MPI_RANK != 0:
+            try:
+                delta.applyTo(self.r)
+                ok = _layoutDigest(_getReactorLayout(self.r)) == delta.newDigest
+            except Exception as error:
+                runLog.warning(f"Failed to apply reactor changes on rank {context.MPI_RANK}: {error}")
+                ok = False
+        if not all(context.MPI_COMM.allgather(ok)):
+            return False
+
+        runLog.debug(f"Distributed reactor changes: {delta}")
+        self.r.o = self.o
+        self.o.reattach(self.r, cs)
+        return True
+
     @staticmethod
     def _distributeParamAssignments():
         data = dict()
@@ -733,3 +808,232 @@ class DistributeStateAction(MpiAction):
                     runLog.debug("Skipping broadcast of interface {0}".format(iName))
                     if iOld:
                         iOld.interactDistributeState()
+
+
+def _getReactorLayout(r):
+    """
+    Describe the structure of a reactor, for detecting structural changes between distributes.
+
+    Returns
+    -------
+    list
+        One ``(containerName, children)`` tuple for each direct child of the Reactor (the Core and the ex-core
+        structures), where ``children`` holds ``(name, locationIndices, subtreeDigest)`` for each of its children, in
+        order.
+    """
+    layout = []
+    for container in r:
+        children = tuple((c.name, _getLocationIndices(c), _subtreeDigest(c)) for c in container)
+        layout.append((container.name, children))
+    return layout
+
+
+def _getLocationIndices(obj):
+    if obj.spatialLocator is None:
+        return None
+    return tuple(np.ravel(obj.spatialLocator.indices).tolist())
+
+
+def _subtreeDigest(obj):
+    """Digest of the types and names of an object and all its descendants; stable across processes."""
+    items = itertools.chain([obj], obj.iterChildren(deep=True))
+    names = "\n".join(f"{type(c).__name__}:{c.name}" for c in items)
+    return hashlib.sha1(names.encode()).hexdigest()
+
+
+def _layoutDigest(layout):
+    return hashlib.sha1(repr(layout).encode()).hexdigest()
+
+
+def _getReplaceableState(r):
+    """
+    Identify the state of a reactor, besides its structure and parameters, that is replaced as a whole when it changes.
+
+    This is the cross section library of the Core, and, for each child of the Reactor's containers, its spatial grid
+    (e.g. the axial mesh of an assembly) and the macroscopic cross sections of its children. The objects are recorded
+    by identity, with :py:func:`_identify`.
+
+    Returns
+    -------
+    tuple
+        The identity of the library, and a dictionary of the identities of the state of each child, by name.
+    """
+    lib = _identify(r.core._lib if r.core is not None else None)
+    children = {c.name: [_identify(obj) for obj in _iterReplaceableState(c)] for container in r for c in container}
+    return lib, children
+
+
+def _iterReplaceableState(obj):
+    """The state of a child of a container that is replaced as a whole when it changes; see ``_getReplaceableState``."""
+    yield obj.spatialGrid
+    for child in obj.iterChildren():
+        yield getattr(child, "macros", None)
+
+
+def _identify(obj):
+    """Record the identity of an object, without keeping it alive when it can be weakly referenced."""
+    try:
+        return weakref.ref(obj)
+    except TypeError:
+        return obj
+
+
+def _isSame(identity, obj) -> bool:
+    """Whether an object is the one recorded by :py:func:`_identify`."""
+    if isinstance(identity, weakref.ref):
+        return obj is not None and identity() is obj
+    return identity is obj
+
+
+def _isSameState(identities, obj) -> bool:
+    """Whether the replaceable state of a child of a container is the one recorded by ``_getReplaceableState``."""
+    state = list(_iterReplaceableState(obj))
+    return (
+        identities is not None
+        and len(identities) == len(state)
+        and all(_isSame(identity, o) for identity, o in zip(identities, state))
+    )
+
+
+def _getSyncedObjects(r):
+    """All objects with parameters, in the same order as ``Composite.syncMpiState`` uses."""
+    return [c for c in itertools.chain([r], r.iterChildrenWithMaterials(deep=True)) if hasattr(c, "p")]
+
+
+class _ReactorDelta:
+    """
+    The changes made to a reactor since the last time it was distributed.
+
+    Structure is tracked at the level of the children of the Reactor's containers (typically assemblies in the Core
+    and the spent fuel pool). Objects that were moved are identified by name and relocated on the workers, while new
+    objects, and objects whose internal structure or replaceable state (see :py:func:`_getReplaceableState`) changed,
+    are pickled along with this delta. Parameter changes are carried as a
+    :py:class:`~armi.reactor.parameters.parameterSync.SyncPacket`, and the cross section library of the Core is carried
+    if it was replaced.
+    """
+
+    def __init__(self, baseDigest, newDigest, removed, moved, added, order, params, libChanged=False, lib=None):
+        self.baseDigest = baseDigest
+        self.newDigest = newDigest
+        self.removed = removed
+        self.moved = moved
+        self.added = added
+        self.order = order
+        self.params = params
+        self.libChanged = libChanged
+        self.lib = lib
+
+    def __repr__(self):
+        return "<{} removed:{} moved:{} added:{} params:{} lib changed:{}>".format(
+            self.__class__.__name__,
+            len(self.removed),
+            len(self.moved),
+            len(self.added),
+            len(self.params.records) + len(self.params.pickled),
+            self.libChanged,
+        )
+
+    @classmethod
+    def fromReactor(cls, r, lastLayout, lastState):
+        """
+        Build the delta between a reactor and the layout and replaceable state it had when it was last distributed, if
+        possible.
+        """
+        layout = _getReactorLayout(r)
+        if [name for name, _ in layout] != [name for name, _ in lastLayout]:
+            return None
+
+        lastLib, lastChildState = lastState
+        oldChildren = {}
+        for containerName, children in lastLayout:
+            for name, indices, digest in children:
+                oldChildren[name] = (containerName, indices, digest)
+
+        removed = []
+        moved = []
+        added = []
+        order = {}
+        seen = set()
+        for container, (containerName, children) in zip(r, layout):
+            order[containerName] = [name for name, _, _ in children]
+            for obj, (name, indices, digest) in zip(container, children):
+                if name in seen:
+                    # children are matched by name, so the names must be unique
+                    return None
+                seen.add(name)
+
+                old = oldChildren.get(name)
+                if old is None or old[2] != digest or not _isSameState(lastChildState.get(name), obj):
+                    if old is not None:
+                        removed.append(name)
+                    added.append((containerName, indices, obj))
+                elif old[:2] != (containerName, indices):
+                    moved.append((name, containerName, indices))
+
+        removed.extend(name for name in oldChildren if name not in seen)
+        params = parameterSync.packSyncData([c.p for c in _getSyncedObjects(r)])
+        lib = r.core._lib if r.core is not None else None
+        libChanged = not _isSame(lastLib, lib)
+
+        return cls(
+            _layoutDigest(lastLayout),
+            _layoutDigest(layout),
+            removed,
+            moved,
+            added,
+            order,
+            params,
+            libChanged,
+            lib if libChanged else None,
+        )
+
+    def canApplyTo(self, r):
+        """Whether a worker's reactor is in the state this delta starts from, with no local changes of its own."""
+        if r is None or _layoutDigest(_getReactorLayout(r)) != self.baseDigest:
+            return False
+
+        return not any(c.p.assigned & parameterDefinitions.SINCE_LAST_DISTRIBUTE_STATE for c in _getSyncedObjects(r))
+
+    def applyTo(self, r):
+        """Apply the structural, parameter, and library changes to a worker's copy of the reactor."""
+        containers = {container.name: container for container in r}
+        children = {c.name: c for container in r for c in container}
+
+        # detach everything leaving its container first, so that locations are free to be reused
+        for name in self.removed:
+            children[name].parent.remove(children[name])
+        for name, containerName, indices in self.moved:
+            obj = children[name]
+            if obj.parent is not containers[containerName]:
+                obj.parent.remove(obj)
+        for name, containerName, indices in self.moved:
+            obj = children[name]
+            if obj.parent is containers[containerName]:
+                obj.moveTo(obj.parent.spatialGrid[indices])
+
+        if r.core is not None:
+            r.core.regenAssemblyLists()
+
+        incoming = [(containerName, indices, children[name]) for name, containerName, indices in self.moved]
+        for containerName, indices, obj in itertools.chain(incoming, self.added):
+            container = containers[containerName]
+            if obj.parent is container:
+                continue
+            loc = None if indices is None else container.spatialGrid[indices]
+            container.add(obj, loc)
+
+        for containerName, names in self.order.items():
+            position = {name: i for i, name in enumerate(names)}
+            containers[containerName]._children.sort(key=lambda c: position[c.name])
+        composites.markTreeChanged()
+
+        comps = _getSyncedObjects(r)
+        for ci, syncData in enumerate(self.params.unpack()):
+            if syncData:
+                comp = comps[ci]
+                for name, val in syncData.items():
+                    comp.p[name] = val
+                comp.clearCache()
+
+        if self.libChanged and r.core is not None:
+            r.core.lib = self.lib
@@ -94,12 +94,12 @@ Settings. Pardon the mess during this transition.
 """
 
 import os
+import time
 
 import numpy as np
-from ruamel.yaml import YAML
 
 from armi import context, runLog
-from armi.nucDirectory import elements, transmutations
+from armi.nucDirectory import elements, nuclideDataCache, transmutations
 from armi.utils.units import HEAVY_METAL_CUTOFF_Z
 
 # Global nuclide and nuclideBases data
@@ -1197,6 +1197,8 @@ class NuclideBases:
         if mccNuclidesFile:
             self.mccNuclidesFile = mccNuclidesFile
 
+        startTime = time.perf_counter()
+
         # load the fundamental elements library
         elements.factory(elementsFile)
         self.elements = elements.elements
@@ -1210,6 +1212,7 @@ class NuclideBases:
         self.readMCCNuclideData(self.mccNuclidesFile)
         self.__renormalizeNuclideToElementRelationship()
         self.__deriveElementalWeightsByNaturalNuclideAbundances()
+        runLog.debug(f"Built {len(self.instances)} nuclides in {time.perf_counter() - startTime:.3f} s")
 
     def initReachableActiveNuclidesThroughBurnChain(self, nuclides, numberDensities, activeNuclides):
         """
@@ -1395,15 +1398,16 @@ class NuclideBases:
         self.burnChainImposed = True
         global burnChainImposed
         burnChainImposed = True
-        yaml = YAML(typ="rt")
-        yaml.allow_duplicate_keys = False
-        burnData = yaml.load(burnChainStream)
+        startTime = time.perf_counter()
+        burnData = nuclideDataCache.loadYaml(burnChainStream)
 
         for nucName, burnInfo in burnData.items():
             nuclide = self.byName[nucName]
             # think of this protected stuff as "module level protection" rather than class.
             nuclide._processBurnData(burnInfo)
 
+        runLog.debug(f"Imposed the burn chain of {len(burnData)} nuclides in {time.perf_counter() - startTime:.3f} s")
+
     def addNuclideBases(self, nuclidesFile: str):
         """
         Read natural abundances of any natural nuclides.
@@ -1503,8 +1507,7 @@ class NuclideBases:
             with the nuclide bases keyed by their corresponding ID for each code.
         """
         with open(mccNuclidesFile, "r") as f:
-            yaml = YAML(typ="rt")
-            nuclides = yaml.load(f)
+            nuclides = nuclideDataCache.loadYaml(f)
 
         for n in nuclides:
             nb = self.byName[n]
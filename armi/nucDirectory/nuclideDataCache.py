@@ -0,0 +1,143 @@
+# Copyright 2026 TerraPower, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+A startup cache of the YAML data the nuclide directory is built from.
+
+Building the nuclide directory reads ``mcc-nuclides.yaml``, and imposing the burn chain reads ``burn-chain.yaml``. Both
+are parsed with ruamel in round-trip mode, which is most of the time it takes to get the nuclide directory ready, and
+every ARMI process (each MPI rank, each test worker) pays it. This module keeps a snapshot of the parsed contents of
+each YAML file, keyed by a hash of the file contents, so that every later process loads the snapshot with ``marshal``
+instead. A changed file has a new hash, so it is parsed again and gets a new snapshot.
+
+The snapshots only hold plain data (dicts, lists, strings and numbers); the nuclides themselves are still built by
+:py:class:`~armi.nucDirectory.nuclideBases.NuclideBases`, because other objects hold on to their identities.
+
+The cache is in a per-user directory under :py:data:`armi.context.APP_DATA` by default. It can be moved by setting the
+``ARMI_NUCLIDE_DATA_CACHE`` environment variable to a directory, or turned off by setting it to an empty string.
+"""
+
+import hashlib
+import marshal
+import os
+
+from ruamel.yaml import YAML
+
+from armi import context
+
+# Increment this if the way YAML data is converted into a snapshot changes.
+_FORMAT_VERSION = 1
+
+_DEFAULT_CACHE_DIR = os.path.join(context.APP_DATA, f"nuclideDataCache-{context.USER}")
+
+# directory the snapshots are stored in, or None to not cache them
+cacheDir = os.environ.get("ARMI_NUCLIDE_DATA_CACHE", _DEFAULT_CACHE_DIR) or None
+
+
+def setCacheDir(path: str) -> None:
+    """
+    Set the directory the snapshots of the YAML files are stored in.
+
+    Parameters
+    ----------
+    path: str
+        Directory to store the snapshots in, or None to always parse the YAML files.
+    """
+    global cacheDir
+    cacheDir = path
+
+
+def loadYaml(stream):
+    """
+    Load the contents of a YAML file, from its snapshot if an identical file has been parsed before.
+
+    Parameters
+    ----------
+    stream: file-like or str
+        The open YAML file, or its text.
+
+    Returns
+    -------
+    object
+        The parsed contents, as plain dicts, lists, strings, and numbers.
+    """
+    text = stream if isinstance(stream, str) else stream.read()
+    key = _getKey(text)
+    data = _readSnapshot(key)
+    if data is None:
+        yaml = YAML(typ="rt")
+        yaml.allow_duplicate_keys = False
+        data = yaml.load(text)
+        try:
+            data = _toPlain(data)
+        except TypeError:
+            # e.g. dates, which the nuclide data does not use; such a file is just never cached
+            return data
+        _writeSnapshot(key, data)
+
+    return data
+
+
+def _getKey(text: str) -> str:
+    return hashlib.sha256(f"{_FORMAT_VERSION}\n{text}".encode()).hexdigest()
+
+
+def _getPath(key: str) -> str:
+    return os.path.join(cacheDir, key + ".marshal")
+
+
+def _toPlain(obj):
+    """Convert the round-trip types of ruamel (``CommentedMap``, ``ScalarFloat``, ...) into the builtin ones."""
+    if isinstance(obj, dict):
+        return {_toPlain(key): _toPlain(val) for key, val in obj.items()}
+    elif isinstance(obj, (list, tuple)):
+        return [_toPlain(val) for val in obj]
+    elif obj is None or isinstance(obj, bool):
+        return obj
+    elif isinstance(obj, int):
+        return int(obj)
+    elif isinstance(obj, float):
+        return float(obj)
+    elif isinstance(obj, str):
+        return str(obj)
+
+    raise TypeError(f"Cannot store {obj!r} of type {type(obj)} in a nuclide data snapshot.")
+
+
+def _readSnapshot(key: str):
+    if cacheDir is None:
+        return None
+
+    try:
+        with open(_getPath(key), "rb") as f:
+            return marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+
+def _writeSnapshot(key: str, data) -> None:
+    if cacheDir is None:
+        return
+
+    path = _getPath(key)
+    tmpPath = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(cacheDir, exist_ok=True)
+        with open(tmpPath, "wb") as f:
+            marshal.dump(data, f)
+        # atomically, so other processes never read half of a snapshot
+        os.replace(tmpPath, path)
+    except (OSError, ValueError):
+        # the cache is only an optimization
+        pass
@@ -0,0 +1,71 @@
+# Copyright 2026 TerraPower, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the startup cache of nuclide YAML data."""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from ruamel.yaml import YAML
+
+from armi.context import RES
+from armi.nucDirectory import nuclideDataCache
+from armi.nucDirectory.nuclideBases import NuclideBases
+
+
+class TestNuclideDataCache(unittest.TestCase):
+    def setUp(self):
+        self._cacheDir = nuclideDataCache.cacheDir
+        self.td = tempfile.TemporaryDirectory()
+        nuclideDataCache.setCacheDir(os.path.join(self.td.name, "nuclideData"))
+
+    def tearDown(self):
+        nuclideDataCache.setCacheDir(self._cacheDir)
+        self.td.cleanup()
+
+    def test_snapshotMatchesYaml(self):
+        for fileName in ["burn-chain.yaml", "mcc-nuclides.yaml"]:
+            with open(os.path.join(RES, fileName), "r") as f:
+                parsed = YAML(typ="rt").load(f)
+            with open(os.path.join(RES, fileName), "r") as f:
+                data = nuclideDataCache.loadYaml(f)
+
+            # a later process loads the snapshot, without parsing any YAML
+            with open(os.path.join(RES, fileName), "r") as f:
+                with mock.patch.object(nuclideDataCache, "YAML", side_effect=AssertionError("parsed")):
+                    cached = nuclideDataCache.loadYaml(f)
+
+            self.assertEqual(data, parsed)
+            self.assertEqual(cached, parsed)
+            self.assertEqual(list(cached), list(parsed))
+
+        self.assertEqual(len(os.listdir(nuclideDataCache.cacheDir)), 2)
+
+    def test_changedFileIsParsedAgain(self):
+        self.assertEqual(nuclideDataCache.loadYaml("U235:\n- nuSF: 1.0\n"), {"U235": [{"nuSF": 1.0}]})
+        self.assertEqual(nuclideDataCache.loadYaml("U235:\n- nuSF: 2.0\n"), {"U235": [{"nuSF": 2.0}]})
+        self.assertEqual(len(os.listdir(nuclideDataCache.cacheDir)), 2)
+
+        nuclideDataCache.setCacheDir(None)
+        self.assertEqual(nuclideDataCache.loadYaml("U235:\n- nuSF: 3.0\n"), {"U235": [{"nuSF": 3.0}]})
+
+    def test_nuclideBasesFromSnapshot(self):
+        nuclideBases = NuclideBases()
+        with mock.patch.object(nuclideDataCache, "YAML", side_effect=AssertionError("parsed")):
+            cachedNuclideBases = NuclideBases()
+
+        self.assertEqual(sorted(nuclideBases.byMcc3Id), sorted(cachedNuclideBases.byMcc3Id))
+        self.assertEqual(nuclideBases.byName["U235"].mcc2id, cachedNuclideBases.byName["U235"].mcc2id)
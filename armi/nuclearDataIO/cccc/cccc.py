@@ -33,7 +33,9 @@ Defines containers for the reading and writing standard interface files for reac
     list or matrix, relying on the child implementation of the literal types that the container
     possesses. The binary conversion is implemented in :py:class:`BinaryRecordReader` and
     :py:class:`BinaryRecordWriter`. The ASCII conversion is implemented in
-    :py:class:`AsciiRecordReader` and :py:class:`AsciiRecordWriter`.
+    :py:class:`AsciiRecordReader` and :py:class:`AsciiRecordWriter`. The binary classes read or write
+    each record in one piece, and convert lists and matrices of numbers with numpy rather than
+    value by value, so the large arrays of flux files are read and written at close to disk speed.
 
     These :py:class:`IORecord` classes are used within :py:class:`Stream` objects for the data
     conversion. :py:class:`Stream` is a context manager that opens a file for reading or writing on
@@ -86,6 +88,9 @@ from armi.nuclearDataIO import nuclearFileMetadata
 IMPLICIT_INT = "IJKLMN"
 """Letters that trigger implicit integer types in old FORTRAN 77 codes."""
 
+_NUMPY_TYPES = {"int": np.dtype("i"), "float": np.dtype("f"), "double": np.dtype("d")}
+"""numpy types of the values in lists of each type, matching the struct formats of the binary records."""
+
 
 class IORecord:
     """
@@ -329,37 +334,63 @@ class BinaryRecordReader(IORecord):
     This class reads a single CCCC record in binary format. A CCCC record consists of a leading and
     ending integer indicating how many bytes the record is. The data contained within the record may
     be integer, float, double, or string.
+
+    The whole record is read from the stream when it is opened, and values are then decoded from
+    that buffer. Lists and matrices of numbers are decoded in one go with ``np.frombuffer``.
     """
 
+    def __init__(self, stream, hasRecordBoundaries=True):
+        IORecord.__init__(self, stream, hasRecordBoundaries)
+        self._buffer = None
+        self._trailingNumBytes = None
+
     def open(self):
-        """Open the record by reading the number of bytes in the record, this value will be used
-        to ensure the entire record was read.
-        """
+        """Open the record by reading the number of bytes in the record, and then the whole record."""
         if not self._hasRecordBoundaries:
             return
-        self.numBytes = self.rwInt(None)
-        self.byteCount -= 4
+        (self.numBytes,) = struct.unpack("i", self._readFromStream(self._intSize))
+        self._buffer = self._readFromStream(self.numBytes)
+        (self._trailingNumBytes,) = struct.unpack("i", self._readFromStream(self._intSize))
 
     def close(self):
-        """Closes the record by reading the number of bytes from then end of the record, if it
-        does not match the initial value, an exception will be raised.
+        """Closes the record, raising an exception if the number of bytes at the end of the record does not match
+        the initial value, or if the record was not read entirely.
         """
         if not self._hasRecordBoundaries:
             return
-        # now read end of record
-        numBytes2 = self.rwInt(None)
-        self.byteCount -= 4
-        if numBytes2 != self.numBytes:
+        if self._trailingNumBytes != self.numBytes:
             raise BufferError(
                 "Number of bytes specified at end the of record, {}, "
                 "does not match the originally specified number, {}.\n"
-                "Read {} bytes.".format(numBytes2, self.numBytes, self.byteCount)
+                "Read {} bytes.".format(self._trailingNumBytes, self.numBytes, self.byteCount)
             )
+        if self.byteCount != self.numBytes:
+            raise BufferError("Only read {} bytes of a {} byte record.".format(self.byteCount, self.numBytes))
+
+    def _readFromStream(self, numBytes):
+        data = self._stream.read(numBytes)
+        if len(data) != numBytes:
+            raise BufferError("Reached the end of the stream while reading a {} byte record.".format(self.numBytes))
+        return data
+
+    def _read(self, numBytes):
+        """Return the next bytes of the record."""
+        if self._buffer is None:
+            data = self._readFromStream(numBytes)
+        else:
+            if self.byteCount + numBytes > self.numBytes:
+                raise BufferError(
+                    "Cannot read {} bytes beyond byte {} of a {} byte record.".format(
+                        numBytes, self.byteCount, self.numBytes
+                    )
+                )
+            data = memoryview(self._buffer)[self.byteCount : self.byteCount + numBytes]
+        self.byteCount += numBytes
+        return data
 
     def rwInt(self, val):
         """Reads an integer value from the binary stream."""
-        self.byteCount += self._intSize
-        (i,) = struct.unpack("i", self._stream.read(self._intSize))
+        (i,) = struct.unpack("i", self._read(self._intSize))
         return i
 
     def rwBool(self, val):
@@ -368,28 +399,62 @@ class BinaryRecordReader(IORecord):
 
     def rwLong(self, val):
         """Reads an integer value from the binary stream."""
-        self.byteCount += self._longSize
-        (ll,) = struct.unpack("q", self._stream.read(self._longSize))
+        (ll,) = struct.unpack("q", self._read(self._longSize))
         return ll
 
     def rwFloat(self, val):
         """Reads a single precision floating point value from the binary stream."""
-        self.byteCount += self._floatSize
-        (f,) = struct.unpack("f", self._stream.read(self._floatSize))
+        (f,) = struct.unpack("f", self._read(self._floatSize))
         return f
 
     def rwDouble(self, val):
         """Reads a double precision floating point value from the binary stream."""
-        self.byteCount += self._floatSize * 2
-        (d,) = struct.unpack("d", self._stream.read(self._floatSize * 2))
+        (d,) = struct.unpack("d", self._read(self._floatSize * 2))
         return d
 
     def rwString(self, val, length):
         """Reads a string of specified length from the binary stream."""
-        self.byteCount += length
-        (s,) = struct.unpack("%ds" % length, self._stream.read(length))
+        (s,) = struct.unpack("%ds" % length, self._read(length))
         return s.rstrip().decode()  # convert bytes to string on reading.
 
+    def _readArray(self, dtype, count):
+        return np.frombuffer(self._read(dtype.itemsize * count), dtype=dtype, count=count)
+
+    def rwList(self, contents, containedType, length, strLength=0):
+        """Read a list of values, decoding lists of numbers all at once."""
+        dtype = _NUMPY_TYPES.get(containedType)
+        if dtype is None:
+            return IORecord.rwList(self, contents, containedType, length, strLength)
+        # match the types of the lists built from python values
+        return self._readArray(dtype, length).astype(int if containedType == "int" else float)
+
+    def rwMatrix(self, contents, *shape):
+        """Read a matrix of single precision floating point values."""
+        return self._readMatrix(contents, _NUMPY_TYPES["float"], shape)
+
+    def rwDoubleMatrix(self, contents, *shape):
+        """Read a matrix of double precision floating point values."""
+        return self._readMatrix(contents, _NUMPY_TYPES["double"], shape)
+
+    def rwIntMatrix(self, contents, *shape):
+        """Read a matrix of integer values."""
+        return self._readMatrix(contents, _NUMPY_TYPES["int"], shape)
+
+    def _readMatrix(self, contents, dtype, shape):
+        """
+        Read a matrix into ``contents``, or a new array if it is empty.
+
+        See Also
+        --------
+        IORecord._rwMatrix : The order of the values in the record.
+        """
+        fortranShape = tuple(reversed(shape))
+        values = self._readArray(dtype, int(np.prod(shape))).reshape(fortranShape, order="F")
+        if contents is None or contents.size == 0:
+            contents = np.empty(fortranShape)
+        contents[tuple(slice(n) for n in fortranShape)] = values
+        return contents
+
 
 class BinaryRecordWriter(IORecord):
     """
@@ -452,8 +517,51 @@ class BinaryRecordWriter(IORecord):
         self.data.append(struct.pack("%ds" % length, val.ljust(length).encode("utf-8")))
         return val
 
+    def _writeArray(self, values, dtype):
+        data = np.asarray(values, dtype=dtype).tobytes(order="F")
+        self.numBytes += len(data)
+        self.data.append(data)
+
+    def rwList(self, contents, containedType, length, strLength=0):
+        """Write a list of values, encoding lists of numbers all at once."""
+        dtype = _NUMPY_TYPES.get(containedType)
+        if dtype is None:
+            return IORecord.rwList(self, contents, containedType, length, strLength)
+        values = np.array(contents[:length])
+        if len(values) != length:
+            raise IndexError("Cannot write {} values from a list of {}.".format(length, len(values)))
+        self._writeArray(values, dtype)
+        return values
+
+    def rwMatrix(self, contents, *shape):
+        """Write a matrix of single precision floating point values."""
+        return self._writeMatrix(contents, _NUMPY_TYPES["float"], shape)
+
+    def rwDoubleMatrix(self, contents, *shape):
+        """Write a matrix of double precision floating point values."""
+        return self._writeMatrix(contents, _NUMPY_TYPES["double"], shape)
+
+    def rwIntMatrix(self, contents, *shape):
+        """Write a matrix of integer values."""
+        return self._writeMatrix(contents, _NUMPY_TYPES["int"], shape)
+
+    def _writeMatrix(self, contents, dtype, shape):
+        """
+        Write the leading ``shape`` part of a matrix.
+
+        See Also
+        --------
+        IORecord._rwMatrix : The order of the values in the record.
+        """
+        fortranShape = tuple(reversed(shape))
+        values = contents[tuple(slice(n) for n in fortranShape)]
+        if values.shape != fortranShape:
+            raise IndexError("Cannot write a {} matrix from one of shape {}.".format(fortranShape, contents.shape))
+        self._writeArray(values, dtype)
+        return contents
+
 
-class AsciiRecordReader(BinaryRecordReader):
+class AsciiRecordReader(IORecord):
     """
     Reads a single CCCC record in ASCII format.
 
@@ -462,8 +570,21 @@ class AsciiRecordReader(BinaryRecordReader):
     AsciiRecordWriter
     """
 
+    def open(self):
+        """Open the record by reading the number of bytes in the record."""
+        if not self._hasRecordBoundaries:
+            return
+        self.numBytes = self.rwInt(None)
+
     def close(self):
-        BinaryRecordReader.close(self)
+        """Closes the record, raising an exception if the number of bytes at the end of the record does not match."""
+        if self._hasRecordBoundaries:
+            numBytes2 = self.rwInt(None)
+            if numBytes2 != self.numBytes:
+                raise BufferError(
+                    "Number of bytes specified at end the of record, {}, "
+                    "does not match the originally specified number, {}.".format(numBytes2, self.numBytes)
+                )
         # read one extra character for the new line \n... python somehow correctly figures out
         # that on windows \r\n is really just a \n... no idea how.
         self._stream.read(1)
@@ -623,6 +744,47 @@ class Stream:
         recordClass = self._fileModes[self._fileMode]
         return recordClass(self._stream, hasRecordBoundaries)
 
+    @property
+    def fileName(self):
+        return self._fileName
+
+    @property
+    def fileMode(self):
+        return self._fileMode
+
+    def tell(self) -> int:
+        """Return the current position in the file, in bytes."""
+        return self._stream.tell()
+
+    def seek(self, position: int):
+        """Move to a position in the file, in bytes."""
+        self._stream.seek(position)
+
+    def skipRecord(self):
+        """
+        Move past the next binary record without reading its contents.
+
+        Only the leading and trailing byte counts of the record are read, so this is much cheaper than reading the
+        record. This is used to index the records of a file so they can be read later.
+        """
+        intSize = IORecord._intSize
+        (numBytes,) = struct.unpack("i", self._stream.read(intSize))
+        self._stream.seek(numBytes, io.SEEK_CUR)
+        (numBytes2,) = struct.unpack("i", self._stream.read(intSize))
+        if numBytes2 != numBytes:
+            raise BufferError(
+                "Number of bytes specified at the end of the record, {}, does not match the originally specified "
+                "number, {}, in {}.".format(numBytes2, numBytes, self)
+            )
+
+    def readRawBytes(self, numBytes: int) -> bytes:
+        """Read some bytes of a binary file as they are, e.g. to copy whole records into another file."""
+        return self._stream.read(numBytes)
+
+    def writeRawBytes(self, data: bytes):
+        """Write bytes to a binary file as they are, e.g. whole records copied from another file."""
+        self._stream.write(data)
+
     @classmethod
     def readBinary(cls, fileName: str):
         """Read data from a binary file into a data structure."""
@@ -163,6 +163,7 @@ class _GamisoNuclideIO(isotxs._IsotxsNuclideIO):
     """
 
     _FILE_LABEL = "GAMISO"
+    _XS_ATTR = "gammaXS"
 
     def _getFileMetadata(self):
         return self._lib.gamisoMetadata
@@ -35,9 +35,16 @@ Examples
 >>> captureEnergy = nuc.isotxsMetadata["ecapt"]
 >>> isotxs.writeBinary(myLib, "ISOTXS-modified")
 
+Large libraries can be read lazily. Only the records that describe the library and each nuclide are read up front, and
+the cross sections of a nuclide are read the first time they are accessed:
+
+>>> myLib = isotxs.readBinary("ISOTXS-ref", lazy=True)
+>>> fis5 = myLib.getNuclide("U235", "AA").micros.fission[5]  # reads the U235 cross sections
+
 """
 
 import itertools
+import os
 import traceback
 
 import numpy as np
@@ -188,12 +195,15 @@ class IsotxsIO(cccc.Stream):
 
     _FILE_LABEL = "ISOTXS"
 
-    def __init__(self, fileName, lib, fileMode, getNuclideFunc):
+    def __init__(self, fileName, lib, fileMode, getNuclideFunc, lazy=False):
         cccc.Stream.__init__(self, fileName, fileMode)
+        if lazy and fileMode != "rb":
+            raise ValueError("Only binary files can be read lazily, not {} with mode {}".format(fileName, fileMode))
         self._lib = lib
         self._metadata = self._getFileMetadata()
         self._metadata.fileNames.append(fileName)
         self._getNuclide = getNuclideFunc
+        self.lazy = lazy
 
     def _getFileMetadata(self):
         return self._lib.isotxsMetadata
@@ -202,22 +212,42 @@ class IsotxsIO(cccc.Stream):
         return _IsotxsNuclideIO
 
     @classmethod
-    def _read(cls, fileName, fileMode):
+    def readBinary(cls, fileName: str, lazy: bool = False):
+        """
+        Read a binary file into a library.
+
+        Parameters
+        ----------
+        fileName : str
+            The file to read.
+        lazy : bool, optional
+            If True, the cross sections of each nuclide are only located in the file, and are read the first time they
+            are accessed. Writing a lazily read nuclide to another binary file copies its records without reading
+            them. The file must not change while the library is in use.
+        """
+        return cls._read(fileName, "rb", lazy=lazy)
+
+    @classmethod
+    def _read(cls, fileName, fileMode, lazy=False):
         lib = xsLibraries.IsotxsLibrary()
         return cls._readWrite(
             lib,
             fileName,
             fileMode,
             lambda containerKey: xsNuclides.XSNuclide(lib, containerKey),
+            lazy=lazy,
         )
 
     @classmethod
     def _write(cls, lib, fileName, fileMode):
+        # cross sections that have not been read yet from the file about to be overwritten have to be read now
+        for nuc in lib.nuclides:
+            nuc.loadPendingRecords(fileName)
         return cls._readWrite(lib, fileName, fileMode, lambda containerKey: lib[containerKey])
 
     @classmethod
-    def _readWrite(cls, lib, fileName, fileMode, getNuclideFunc):
-        with cls(fileName, lib, fileMode, getNuclideFunc) as rw:
+    def _readWrite(cls, lib, fileName, fileMode, getNuclideFunc, lazy=False):
+        with cls(fileName, lib, fileMode, getNuclideFunc, lazy=lazy) as rw:
             rw.readWrite()
         return lib
 
@@ -401,9 +431,11 @@ class _IsotxsNuclideIO:
     This is to be used in conjunction with an IsotxsIO object.
     """
 
-    def __init__(self, nuclide, isotxsIO, lib):
+    _XS_ATTR = "micros"
+
+    def __init__(self, nuclide, isotxsIO, lib, metadata=None):
         self._nuclide = nuclide
-        self._metadata = self._getNuclideMetadata()
+        self._metadata = self._getNuclideMetadata() if metadata is None else metadata
         self._isotxsIO = isotxsIO
         self._lib = lib
         self._fileWideChiFlag = self._getFileMetadata()["fileWideChiFlag"]
@@ -427,19 +459,51 @@ class _IsotxsNuclideIO:
         try:
             self._rw4DRecord()
             self._nuclide.updateBaseNuclide()
-            self._rw5DRecord()
-            if self._metadata["chiFlag"] > 1:
-                self._rw6DRecord()
-
-            # get scatter matrix
-            for blockNumIndex in range(self._maxScatteringBlocks):
-                for subBlock in range(self._subblockingControl):
-                    if self._metadata["ords"][blockNumIndex] > 0:
-                        # ords flag == 1 implies this scatter type of scattering exists on this nuclide.
-                        self._rw7DRecord(blockNumIndex, subBlock)
+            if self._isotxsIO.lazy:
+                self._indexCrossSectionRecords()
+            elif not self._copyCrossSectionRecords():
+                self._rwCrossSectionRecords()
         finally:
             properties.lockImmutableProperties(self._nuclide)
 
+    def _rwCrossSectionRecords(self):
+        """Read or write the 5D, 6D, and 7D records, which hold the cross sections of the nuclide."""
+        self._rw5DRecord()
+        if self._metadata["chiFlag"] > 1:
+            self._rw6DRecord()
+
+        # get scatter matrix
+        for blockNumIndex in range(self._maxScatteringBlocks):
+            for subBlock in range(self._subblockingControl):
+                if self._metadata["ords"][blockNumIndex] > 0:
+                    # ords flag == 1 implies this scatter type of scattering exists on this nuclide.
+                    self._rw7DRecord(blockNumIndex, subBlock)
+
+    def _getNumCrossSectionRecords(self):
+        numScatterBlocks = sum(1 for _ord in self._metadata["ords"] if _ord > 0)
+        return 1 + (self._metadata["chiFlag"] > 1) + numScatterBlocks * self._subblockingControl
+
+    def _indexCrossSectionRecords(self):
+        """Skip over the cross section records of the nuclide, leaving their location for them to be read later."""
+        start = self._isotxsIO.tell()
+        for _ in range(self._getNumCrossSectionRecords()):
+            self._isotxsIO.skipRecord()
+        records = CrossSectionRecords(self, start, self._isotxsIO.tell())
+        self._nuclide.setPendingRecords(self._XS_ATTR, records)
+
+    def _copyCrossSectionRecords(self):
+        """
+        Write the cross section records of a lazily read nuclide as they are in its file.
+
+        Returns False if the records have to be written from the cross sections instead, because the nuclide has
+        been read, the file is not binary, or the layout of the records has changed since they were indexed.
+        """
+        records = self._nuclide.getPendingRecords(self._XS_ATTR)
+        if records is None or self._isotxsIO.fileMode != "wb" or not records.fitsLayoutOf(self):
+            return False
+        self._isotxsIO.writeRawBytes(records.readRawBytes())
+        return True
+
     def _rw4DRecord(self):
         """
         Read 4D ISOTXS record.
@@ -617,16 +681,16 @@ class _IsotxsNuclideIO:
                         indptr.append(len(indices) + bandWidth)
                         # add the indices in reverse
                         indices.extend(range(jup - 1, jdown - 1, -1))
-                        # read the data as-is
-                        for _ in range(bandWidth):
-                            dataVals.append(record.rwFloat(0.0))
                     else:
-                        for xs in reversed(scatter[g, jdown:jup].tolist()):
-                            record.rwFloat(xs)
+                        dataVals.extend(reversed(scatter[g, jdown:jup].tolist()))
+
+            # the data of all the rows are read or written at once, as-is
+            numVals = len(indices) if scatter is None else len(dataVals)
+            dataVals = record.rwList(dataVals, "float", numVals)
 
         if scatter is None:
             # we're reading.
-            scatter = sparse.csr_matrix((np.array(dataVals), indices, indptr), shape=(ng, ng))
+            scatter = sparse.csr_matrix((dataVals, indices, indptr), shape=(ng, ng))
             scatter.eliminate_zeros()
             self._setScatterMatrix(blockNumIndex, scatter)
 
@@ -706,3 +770,73 @@ class _IsotxsNuclideIO:
             scatterMatrix = self._getMicros().higherOrderScatter.get(blockNumIndex, None)
 
         return scatterMatrix
+
+
+class CrossSectionRecords:
+    """
+    The location of the cross section records of a nuclide in a lazily read ISOTXS or GAMISO file.
+
+    The 5D, 6D, and 7D records of a nuclide are read the first time its cross sections are accessed, or copied as
+    they are when it is written to another binary file. They are read with the file and nuclide metadata as they were
+    when the records were located, since merging libraries may change the metadata.
+    """
+
+    def __init__(self, nuclideIO, start, end):
+        self._nuclideIOClass = nuclideIO.__class__
+        self._lib = nuclideIO._lib
+        self._fileLayout = self._getFileLayout(nuclideIO)
+        self._metadata = nuclideIO._metadata.__class__()
+        self._metadata.update(nuclideIO._metadata)
+        self._start = start
+        self._end = end
+        self.fileName = nuclideIO._isotxsIO.fileName
+        self._fileStat = self._getFileStat()
+
+    def __repr__(self):
+        return "<{} bytes {}-{} of {}>".format(self.__class__.__name__, self._start, self._end, self.fileName)
+
+    def _getFileStat(self):
+        stat = os.stat(self.fileName)
+        return stat.st_size, stat.st_mtime_ns
+
+    def _checkFile(self):
+        if self._getFileStat() != self._fileStat:
+            raise OSError(
+                "{} has changed since it was lazily read, so the cross sections in it can no longer be read.".format(
+                    self.fileName
+                )
+            )
+
+    @staticmethod
+    def _getFileLayout(nuclideIO):
+        """The file metadata that determine the number and length of the records."""
+        return nuclideIO._numGroups, nuclideIO._maxScatteringBlocks, nuclideIO._subblockingControl
+
+    def fitsLayoutOf(self, nuclideIO):
+        """Whether the records can be copied as they are into a file being written by a nuclide reader/writer."""
+        if self._getFileLayout(nuclideIO) != self._fileLayout:
+            return False
+
+        metadata = nuclideIO._metadata
+        keys = set(metadata.keys()) | set(self._metadata.keys())
+        return all(properties.numpyHackForEqual(metadata[key], self._metadata[key]) for key in keys)
+
+    def readRawBytes(self):
+        """Read the records as they are in the file, including their byte counts."""
+        self._checkFile()
+        with cccc.Stream(self.fileName, "rb") as stream:
+            stream.seek(self._start)
+            return stream.readRawBytes(self._end - self._start)
+
+    def load(self, nuclide):
+        """Read the cross sections into a nuclide."""
+        self._checkFile()
+        runLog.debug("Reading the cross sections of {} from {}".format(nuclide, self.fileName))
+        with cccc.Stream(self.fileName, "rb") as stream:
+            stream.seek(self._start)
+            nuclideIO = self._nuclideIOClass(nuclide, stream, self._lib, self._metadata)
+            properties.unlockImmutableProperties(nuclide)
+            try:
+                nuclideIO._rwCrossSectionRecords()
+            finally:
+                properties.lockImmutableProperties(nuclide)
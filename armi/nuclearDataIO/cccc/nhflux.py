@@ -507,8 +507,9 @@ class NhfluxStream(cccc.StreamWithDataContainer):
 
         Notes
         -----
-        These data are harder to read with rwMatrix, though it could be done if we
-        discarded the unwanted data at another level if that is much faster.
+        The currents are stored with the ``nscoef`` index varying fastest, i.e.
+        ``(((CUR(M,J,I),M=1,NSCOEF),J=1,NSURF),I=1,NINTXY)``, so the arrays are transposed on
+        the way in/out of ``rwDoubleMatrix``.
         """
         with self.createRecord() as record:
             nAssem = self._metadata["nintxy"]
@@ -520,23 +521,14 @@ class NhfluxStream(cccc.StreamWithDataContainer):
 
             numPartialCurrentsHex_ext = self._metadata["npcxy"] - self._metadata["nintxy"] * self._metadata["nSurf"]
 
-            # Loop through all lateral surfaces of all assemblies
-            for i in range(nAssem):
-                for j in range(nSurf):
-                    for m in range(nscoef):
-                        # OUTGOING partial currents on each lateral surface in each assembly.
-                        # If m > 0, other NSCOEF options (i.e., half-angle integrated
-                        # flux when reading DIF3D-Nodal data, and higher current moments
-                        # when reading DIF3D-VARIANT data) are processed.
-                        surfCurrents[i, j, m] = record.rwDouble(surfCurrents[i, j, m])
-
-            for j in range(numPartialCurrentsHex_ext):
-                for m in range(nscoef):
-                    # INCOMING current at each surface of outer core boundary. If m > 0,
-                    # other NSCOEF options (i.e., half-angle integrated flux when
-                    # reading DIF3D-Nodal data, and higher current moments when reading
-                    # DIF3D-VARIANT data) are processed.
-                    externalSurfCurrents[j, m] = record.rwDouble(externalSurfCurrents[j, m])
+            # OUTGOING partial currents on each lateral surface in each assembly.
+            # If m > 0, other NSCOEF options (i.e., half-angle integrated
+            # flux when reading DIF3D-Nodal data, and higher current moments
+            # when reading DIF3D-VARIANT data) are processed.
+            surfCurrents[:] = record.rwDoubleMatrix(surfCurrents.T, nAssem, nSurf, nscoef).T
+
+            # INCOMING current at each surface of outer core boundary.
+            externalSurfCurrents[:] = record.rwDoubleMatrix(externalSurfCurrents.T, numPartialCurrentsHex_ext, nscoef).T
 
             return surfCurrents, externalSurfCurrents
 
@@ -569,17 +561,12 @@ class NhfluxStream(cccc.StreamWithDataContainer):
             nSurf = 2
             nscoef = self._metadata["nscoef"]
 
-            # Loop through all (up and down) partial currents on all hexes
-            # These loops are in a different order than in the 4D record above!!!
-            # Here we loop through surface FIRST and assemblies SECOND!!!
-            for j in range(nSurf):
-                for i in range(nAssem):
-                    for m in range(nscoef):
-                        # Outward partial current. For m > 0, other NSCOEF options
-                        # (i.e., half-angle integrated flux when reading DIF3D-Nodal
-                        # data, and higher current moments when reading DIF3D-VARIANT
-                        # data) are processed.
-                        surfCurrents[i, j, m] = record.rwDouble(surfCurrents[i, j, m])
+            # All (up and down) partial currents on all hexes. These are in a different order
+            # than in the 4D record above!!! Here the surface index varies SLOWEST, then the
+            # assembly, then the NSCOEF options (i.e., half-angle integrated flux when reading
+            # DIF3D-Nodal data, and higher current moments when reading DIF3D-VARIANT data).
+            result = record.rwDoubleMatrix(surfCurrents.transpose(2, 0, 1), nSurf, nAssem, nscoef)
+            surfCurrents[:] = result.transpose(1, 2, 0)
 
         return surfCurrents
 
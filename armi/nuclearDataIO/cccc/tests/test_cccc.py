@@ -16,6 +16,8 @@
 import io
 import unittest
 
+import numpy as np
+
 from armi.nuclearDataIO import cccc
 
 
@@ -69,6 +71,30 @@ class TestCcccBinaryRecord(unittest.TestCase):
             self.assertEqual(value, reader.rwString(None, size))
         self.assertEqual(size, writer.numBytes)
 
+    def test_writeAndReadListsAndMatrices(self):
+        stream = self.streamCls()
+        ints = [3, -1, 4]
+        floats = np.array([[1.5, -2.25, 3.0], [0.125, 5.0, -6.5]])
+        doubles = np.arange(24, dtype=float).reshape(2, 3, 4) / 7.0
+        with self.writerClass(stream) as writer:
+            writer.rwList(ints, "int", 3)
+            writer.rwString("ab", 2)
+            # shapes are passed in the order of the loops in the file, the outermost first
+            writer.rwMatrix(floats, 3, 2)
+            writer.rwDoubleMatrix(doubles, 4, 3, 2)
+            writer.rwIntMatrix(np.array([[1, 2], [3, 4]]), 2, 2)
+
+        with self.readerClass(self.streamCls(stream.getvalue())) as reader:
+            self.assertEqual(writer.numBytes, reader.numBytes)
+            self.assertEqual(ints, reader.rwList(None, "int", 3).tolist())
+            self.assertEqual("ab", reader.rwString(None, 2))
+            self.assertTrue(np.allclose(floats, reader.rwMatrix(None, 3, 2)))
+            self.assertTrue(np.allclose(doubles, reader.rwDoubleMatrix(None, 4, 3, 2)))
+            # reading into an existing array fills it
+            intMatrix = np.zeros((2, 2), dtype=int)
+            reader.rwIntMatrix(intMatrix, 2, 2)
+            self.assertEqual([[1, 2], [3, 4]], intMatrix.tolist())
+
     def test_readPartialRecord(self):
         """Not reading an entire record raises an exception."""
         # I'm going to create a record with two pieces of data, and only read one...
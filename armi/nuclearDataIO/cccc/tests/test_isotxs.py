@@ -195,3 +195,42 @@ class TestIsotxsMerge(unittest.TestCase):
             del someIsotxs[key]
         someIsotxs.merge(isotxs.readBinary(ISOAA_PATH))
         self.assertEqual(None, someIsotxs.isotxsMetadata["chi"])
+
+
+class TestLazyIsotxs(unittest.TestCase):
+    def test_lazyReadMatchesEager(self):
+        eager = isotxs.readBinary(ISOAA_PATH)
+        lazy = isotxs.readBinary(ISOAA_PATH, lazy=True)
+        self.assertEqual(eager.nuclideLabels, lazy.nuclideLabels)
+        self.assertTrue(all(nuc.getPendingRecords("micros") is not None for nuc in lazy.nuclides))
+
+        # the 4D record is read up front, and the cross sections on first access
+        nuc = lazy["U235AA"]
+        self.assertEqual(nuc.isotxsMetadata["nuclideId"], eager["U235AA"].isotxsMetadata["nuclideId"])
+        self.assertEqual(list(nuc.micros.fission), list(eager["U235AA"].micros.fission))
+        self.assertIsNone(nuc.getPendingRecords("micros"))
+        self.assertTrue(isotxs.compare(eager, lazy))
+
+    def test_lazyWriteAndMerge(self):
+        with TemporaryDirectoryChanger():
+            isotxs.writeBinary(isotxs.readBinary(ISOAA_PATH), "ISOTXS-eager")
+            lazy = isotxs.readBinary(ISOAA_PATH, lazy=True)
+            isotxs.writeBinary(lazy, "ISOTXS-lazy")
+
+            # the records were copied without reading them
+            self.assertTrue(all(nuc.getPendingRecords("micros") is not None for nuc in lazy.nuclides))
+            with open("ISOTXS-eager", "rb") as eagerFile, open("ISOTXS-lazy", "rb") as lazyFile:
+                self.assertEqual(eagerFile.read(), lazyFile.read())
+
+            # merging twice removes the file-wide chi, which changes the records of the fissile nuclides
+            for fileName, lazy in [("ISOTXS-mergedEager", False), ("ISOTXS-mergedLazy", True)]:
+                merged = xsLibraries.IsotxsLibrary()
+                merged.merge(isotxs.readBinary("ISOTXS-lazy", lazy=lazy))
+                for key in merged.nuclideLabels:
+                    del merged[key]
+                merged.merge(isotxs.readBinary("ISOTXS-lazy", lazy=lazy))
+                self.assertEqual(lazy, all(nuc.getPendingRecords("micros") is not None for nuc in merged.nuclides))
+                isotxs.writeBinary(merged, fileName)
+
+            with open("ISOTXS-mergedEager", "rb") as eagerFile, open("ISOTXS-mergedLazy", "rb") as lazyFile:
+                self.assertEqual(eagerFile.read(), lazyFile.read())
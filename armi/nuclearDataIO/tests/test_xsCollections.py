@@ -17,6 +17,8 @@
 import os
 import unittest
 
+import numpy as np
+
 from armi import settings
 from armi.nuclearDataIO import isotxs, xsCollections
 from armi.reactor.blocks import HexBlock
@@ -91,6 +93,27 @@ class TestXsCollections(unittest.TestCase):
         self.assertAlmostEqual(sum(self.mc.macros.fission), totalMacroFissionXs)
         self.assertAlmostEqual(sum(self.mc.macros.absorption), totalMacroAbsXs)
 
+    def test_createMacrosForBlocks(self):
+        """Macros built for many blocks at once match those built one block at a time."""
+        block2 = MockBlock()
+        block2.setNumberDensity("U235", 0.01)
+        block2.setNumberDensity("FE", 0.03)
+        block2.setNumberDensity("NA23", 0.005)
+        blocks = [self.block, block2]
+
+        batchMacros = self.mc.createMacrosForBlocks(self.microLib, blocks)
+        self.assertEqual(len(batchMacros), 2)
+        for block, macros in zip(blocks, batchMacros):
+            expected = xsCollections.MacroscopicCrossSectionCreator(minimumNuclideDensity=1e-13).createMacrosFromMicros(
+                self.microLib, block
+            )
+            for xsName in xsCollections.BASIC_XS + xsCollections.DERIVED_XS + ["total", "chi"]:
+                np.testing.assert_allclose(macros[xsName], expected[xsName], rtol=1e-12, atol=1e-20)
+            for matrixName in xsCollections.BASIC_SCAT_MATRIX + ["totalScatter"]:
+                np.testing.assert_allclose(
+                    macros[matrixName].toarray(), expected[matrixName].toarray(), rtol=1e-12, atol=1e-20
+                )
+
     def test_collapseCrossSection(self):
         """
         Tests cross section collapsing.
@@ -0,0 +1,79 @@
+# Copyright 2026 TerraPower, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the cache of parsed cross section libraries."""
+
+import os
+import shutil
+import unittest
+
+import numpy as np
+
+from armi.nuclearDataIO.cccc import gamiso, isotxs
+from armi.nuclearDataIO.tests.test_xsLibraries import GAMISO_AA, ISOTXS_AA, ISOTXS_AB
+from armi.nuclearDataIO.xsLibraryCache import XSLibraryCache
+from armi.utils.directoryChangers import TemporaryDirectoryChanger
+
+
+class TestXSLibraryCache(unittest.TestCase):
+    def setUp(self):
+        self.td = TemporaryDirectoryChanger()
+        self.td.__enter__()
+        self.cache = XSLibraryCache(os.path.join(self.td.destination, "xsCache"))
+
+    def tearDown(self):
+        self.td.__exit__(None, None, None)
+
+    def test_readBinaryMatchesFile(self):
+        lib = self.cache.readBinary(ISOTXS_AA)
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 1))
+
+        cached = self.cache.readBinary(ISOTXS_AA)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+        self.assertTrue(isotxs.compare(lib, cached))
+        self.assertEqual(cached.isotxsMetadata.fileNames, [ISOTXS_AA])
+        for nuc in lib.nuclides:
+            cachedNuc = cached[nuc.containerKey]
+            self.assertIs(nuc._base, cachedNuc._base)
+            self.assertTrue(np.array_equal(nuc.micros.total, cachedNuc.micros.total))
+
+        # the arrays are views of the cache, but writing to them does not change it
+        cached.nuclides[0].micros.total[:] = 0.0
+        reloaded = self.cache.readBinary(ISOTXS_AA)
+        self.assertTrue(isotxs.compare(lib, reloaded))
+
+    def test_keyedByContents(self):
+        copyPath = os.path.join(self.td.destination, "ISOAA")
+        shutil.copy(ISOTXS_AA, copyPath)
+        self.cache.readBinary(ISOTXS_AA)
+        cached = self.cache.readBinary(copyPath)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+        self.assertEqual(cached.isotxsMetadata.fileNames, [copyPath])
+
+        # the same file read as another kind of library is another entry
+        gammaLib = self.cache.readBinary(GAMISO_AA, gamiso)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 2))
+        self.assertTrue(gamiso.compare(gammaLib, self.cache.readBinary(GAMISO_AA, gamiso)))
+
+    def test_evictLeastRecentlyUsed(self):
+        self.cache.readBinary(ISOTXS_AA)
+        (entryPath, size, _mtime) = self.cache._getEntries()[0]
+        self.cache.maxBytes = size + 1
+
+        self.cache.readBinary(ISOTXS_AB)
+        entries = self.cache._getEntries()
+        self.assertEqual(len(entries), 1)
+        self.assertNotEqual(entries[0][0], entryPath)
+
+        self.cache.clear()
+        self.assertEqual(self.cache._getEntries(), [])
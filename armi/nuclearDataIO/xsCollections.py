@@ -39,6 +39,8 @@ Examples
 
 """
 
+import collections
+
 import numpy as np
 from scipy import sparse
 
@@ -316,6 +318,11 @@ class XSCollection:
                 equal = False
         return equal
 
+    def isEmpty(self):
+        """Whether none of the cross sections of this collection have been assigned."""
+        attributesToIgnore = ["source", HIGHORDER_SCATTER]
+        return all(v is None for k, v in self.__dict__.items() if k not in attributesToIgnore)
+
     def merge(self, other):
         """
         Merge the cross sections of two collections.
@@ -328,10 +335,9 @@ class XSCollection:
            ones in `attributesToIgnore` are None.
         3. Libraries are already merged if all attributes in the other library are None (This is nothing to merge!).
         """
-        attributesToIgnore = ["source", HIGHORDER_SCATTER]
-        if all(v is None for k, v in self.__dict__.items() if k not in attributesToIgnore):
+        if self.isEmpty():
             self.__dict__.update(other.__dict__)  # See note 2
-        elif all(v is None for k, v in other.__dict__.items() if k not in attributesToIgnore):
+        elif other.isEmpty():
             pass  # See note 3
         else:
             overlappingAttrs = set(k for k, v in self.__dict__.items() if v is not None and k != "source")
@@ -361,11 +367,147 @@ class MacroscopicCrossSectionCreator:
 
     def createMacrosOnBlocklist(self, microLibrary, blockList, nucNames=None, libType="micros"):
         """Create macroscopic cross sections for a list of blocks."""
-        for block in blockList:
-            block.macros = self.createMacrosFromMicros(microLibrary, block, nucNames, libType=libType)
+        for block, macros in zip(blockList, self.createMacrosForBlocks(microLibrary, blockList, nucNames, libType)):
+            block.macros = macros
 
         return blockList
 
+    def createMacrosForBlocks(self, microLibrary, blocks, nucNames=None, libType="micros"):
+        """
+        Creates macroscopic cross section sets for many blocks at once.
+
+        This gives the same macros as calling :py:meth:`createMacrosFromMicros` on each block, but the blocks that
+        share a cross section suffix are done together. Their number densities are gathered into a [block x nuclide]
+        matrix, so that each basic cross section of every block is one product with the stacked micros of the
+        nuclides, and each scatter matrix is one sparse product with the flattened nuclide matrices.
+
+        Parameters
+        ----------
+        microLibrary : xsCollection.XSCollection
+            Input micros
+
+        blocks : list of Block
+            Objects whose number densities should be used to generate macros
+
+        nucNames : list, optional
+            List of nuclides to include in the macros. Defaults to all in each block.
+
+        libType : str, optional
+            The block attribute containing the desired microscopic XS for these blocks:
+            either "micros" for neutron XS or "gammaXS" for gamma XS.
+
+        Returns
+        -------
+        macros : list of xsCollection.XSCollection
+            New XSCollections full of macroscopic cross sections, one for each block
+        """
+        self.microLibrary = microLibrary
+        self.ng = getattr(self.microLibrary, "numGroups" + _getLibTypeSuffix(libType))
+
+        blocksBySuffix = collections.defaultdict(list)
+        for block in blocks:
+            blocksBySuffix[block.getMicroSuffix()].append(block)
+
+        macrosByBlock = {}
+        for suffix, suffixBlocks in blocksBySuffix.items():
+            runLog.debug("Building macroscopic cross sections for {} blocks of {}".format(len(suffixBlocks), suffix))
+            self.xsSuffix = suffix
+            for block, macros in zip(suffixBlocks, self._createSuffixMacros(suffixBlocks, nucNames, libType)):
+                macrosByBlock[id(block)] = macros
+
+        return [macrosByBlock[id(block)] for block in blocks]
+
+    def _createSuffixMacros(self, blocks, nucNames, libType):
+        """Create the macros of blocks that share the cross section suffix ``self.xsSuffix``."""
+        blockDensities = []
+        for block in blocks:
+            blockNucNames = block.getNuclides() if nucNames is None else nucNames
+            blockDensities.append(
+                {
+                    nucName: nDens
+                    for nucName, nDens in zip(blockNucNames, block.getNuclideNumberDensities(blockNucNames))
+                    if nDens > self.minimumNuclideDensity
+                }
+            )
+
+        # the nuclides present in any block, in sorted order, to match computeMacroscopicGroupConstants
+        allNucNames = sorted({nucName for densities in blockDensities for nucName, nDens in densities.items() if nDens})
+        nucIndex = {nucName: i for i, nucName in enumerate(allNucNames)}
+        numberDensities = np.zeros((len(blocks), len(allNucNames)))
+        for row, densities in enumerate(blockDensities):
+            for nucName, nDens in densities.items():
+                if nDens:
+                    numberDensities[row, nucIndex[nucName]] = nDens
+
+        libNuclides = []
+        skippedNuclides = []
+        for nucName in allNucNames:
+            try:
+                libNuclides.append(self.microLibrary.getNuclide(nucName, self.xsSuffix))
+            except KeyError:
+                skippedNuclides.append(nucName)  # Nuclide does not exist in the library
+        if skippedNuclides:
+            msg = "The following nuclides are not in microscopic library {}: {}".format(
+                self.microLibrary, skippedNuclides
+            )
+            runLog.error(msg, single=True)
+            raise ValueError(msg)
+
+        allMacros = []
+        for block in blocks:
+            self.macros = XSCollection(parent=block)
+            self._initializeMacros()
+            allMacros.append(self.macros)
+
+        for reaction in BASIC_XS + TOTAL_XS:
+            constantName, multConstant = (FISSION_XS, NU) if reaction == NUSIGF else (reaction, None)
+            macroGroupConstants = _computeMacroscopicGroupConstantsForBlocks(
+                constantName, numberDensities, libNuclides, allNucNames, libType, multConstant
+            )
+            for row, macros in enumerate(allMacros):
+                macros[reaction] = None if macroGroupConstants is None else macroGroupConstants[row]
+
+        if self.buildScatterMatrix:
+            self._convertScatterMatricesForBlocks(allMacros, numberDensities, nucIndex, libType)
+
+        chis = computeBlockAverageChis(blocks, self.microLibrary)
+        for block, densities, macros, chi in zip(blocks, blockDensities, allMacros, chis):
+            self.block = block
+            self.densities = densities
+            self.macros = macros
+            self._computeAbsorptionXS()
+            self._computeDiffusionConstants()
+            self._buildTotalScatterMatrix()
+            self._computeRemovalXS()
+            macros.chi = chi
+
+        return allMacros
+
+    def _convertScatterMatricesForBlocks(self, allMacros, numberDensities, nucIndex, libType):
+        """
+        Build the macroscopic scatter matrices of many blocks.
+
+        Each nuclide matrix is flattened into one row of a sparse [nuclide x (group * group)] matrix, so the macros of
+        every block are the rows of a product with the [block x nuclide] number densities.
+        """
+        ng = self.ng
+        for matrixName in BASIC_SCAT_MATRIX:
+            rows = []
+            flatMatrices = []
+            for nuclide in self.microLibrary.getNuclides(self.xsSuffix):
+                matrix = getattr(getattr(nuclide, libType), matrixName)
+                if matrix is None or nuclide.name not in nucIndex:
+                    continue
+                rows.append(nucIndex[nuclide.name])
+                flatMatrices.append(sparse.csr_matrix(matrix).reshape((1, ng * ng)))
+
+            if not flatMatrices:
+                continue
+
+            macroMatrices = sparse.csr_matrix(numberDensities[:, rows]) @ sparse.vstack(flatMatrices, format="csr")
+            for row, macros in enumerate(allMacros):
+                macros[matrixName] = macroMatrices.getrow(row).reshape((ng, ng)).tocsr()
+
     def createMacrosFromMicros(self, microLibrary, block, nucNames=None, libType="micros"):
         """
         Creates a macroscopic cross section set based on a microscopic XS library using a block object.
@@ -561,6 +703,41 @@ def computeBlockAverageChi(b, isotxsLib):
         return np.zeros(numGroups)
 
 
+def computeBlockAverageChis(blocks, isotxsLib):
+    """
+    Return the block average total chi vectors of many blocks that share a cross section suffix.
+
+    This is :py:func:`computeBlockAverageChi` for many blocks at once; the fission source weighted sums over nuclides
+    are products of the [block x nuclide] number densities with the stacked nuclide chi vectors.
+    """
+    numGroups = isotxsLib.numGroups
+    if not blocks:
+        return np.zeros((0, numGroups))
+
+    nuclides = isotxsLib.getNuclides(blocks[0].getMicroSuffix())
+    nucIndex = {nucObj.name: i for i, nucObj in enumerate(nuclides)}
+    numberDensities = np.zeros((len(blocks), len(nuclides)))
+    for row, b in enumerate(blocks):
+        for nucName, nDens in b.getNumberDensities().items():
+            if nucName in nucIndex:
+                numberDensities[row, nucIndex[nucName]] = nDens
+
+    chis = [np.asarray(nucObj.micros.chi) for nucObj in nuclides]
+    if any(chi.shape != (numGroups,) for chi in chis):
+        # chi matrices do not stack; do the blocks one at a time
+        return [computeBlockAverageChi(b, isotxsLib) for b in blocks]
+
+    chis = np.array(chis).reshape(len(nuclides), numGroups)
+    nuFissionTotals = np.array([sum(nucObj.micros.neutronsPerFission * nucObj.micros.fission) for nucObj in nuclides])
+
+    numerators = numberDensities @ (chis * nuFissionTotals[:, np.newaxis])
+    denominators = numberDensities @ nuFissionTotals
+    averageChis = np.zeros((len(blocks), numGroups))
+    nonZero = denominators != 0.0
+    averageChis[nonZero] = numerators[nonZero] / denominators[nonZero, np.newaxis]
+    return averageChis
+
+
 def _getLibTypeSuffix(libType):
     if libType == "micros":
         libTypeSuffix = ""
@@ -858,6 +1035,31 @@ def computeMacroscopicGroupConstants(
     return macroGroupConstants
 
 
+def _computeMacroscopicGroupConstantsForBlocks(
+    constantName, numberDensities, libNuclides, nucNames, libType, multConstant=None
+):
+    """
+    Compute a macroscopic group constant of many blocks from their [block x nuclide] number densities.
+
+    This is :py:func:`computeMacroscopicGroupConstants` for many blocks at once. Returns a [block x group] array, or
+    None if there are no nuclides.
+    """
+    if not libNuclides:
+        return None
+
+    microGroupConstants = [
+        _getMicroGroupConstants(libNuclide, constantName, nucName, libType)
+        * _getXsMultiplier(libNuclide, multConstant, libType)
+        for libNuclide, nucName in zip(libNuclides, nucNames)
+    ]
+    shape = microGroupConstants[0].shape
+    microGroupConstants = [
+        micro if micro.shape == shape or micro.any() else np.zeros(shape) for micro in microGroupConstants
+    ]
+
+    return np.tensordot(numberDensities, np.array(microGroupConstants), axes=1)
+
+
 def _getXsMultiplier(libNuclide, multiplier, libType):
     if multiplier:
         try:
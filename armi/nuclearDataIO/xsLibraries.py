@@ -135,6 +135,7 @@ def mergeXSLibrariesInWorkingDirectory(
     xsLibrarySuffix="",
     mergeGammaLibs=False,
     alternateDirectory=None,
+    cache=None,
 ):
     """
     Merge neutron (ISOTXS) and gamma (GAMISO/PMATRX) library data into the provided library.
@@ -146,6 +147,11 @@ def mergeXSLibrariesInWorkingDirectory(
     it is needed by a non-fuel cross section, but if the convention is not followed then
     this could cause an issue.
 
+    The ISOTXS and GAMISO files are read lazily, so the cross sections of each nuclide are only read from the files
+    when they are first used, and are copied as they are if the merged library is written. The files must not change
+    while the merged library is in use. If a ``cache`` is given, the files are instead loaded from it whenever an
+    identical file has been read before.
+
     Parameters
     ----------
     lib : obj
@@ -163,10 +169,18 @@ def mergeXSLibrariesInWorkingDirectory(
     alternateDirectory : str, optional
         An alternate directory in which to search for files other than the working directory. The main purpose
         of this is for testing, but it could also be useful to users.
+
+    cache : armi.nuclearDataIO.xsLibraryCache.XSLibraryCache, optional
+        A cache of parsed libraries to read the ISOTXS, GAMISO, and PMATRX files through.
     """
     from armi import nuclearDataIO
     from armi.nuclearDataIO.cccc import gamiso, isotxs, pmatrx
 
+    def readLibrary(reader, fileName, **kwargs):
+        if cache is None:
+            return reader.readBinary(fileName, **kwargs)
+        return cache.readBinary(fileName, reader)
+
     baseDir = alternateDirectory or os.getcwd()
     globPath = os.path.join(baseDir, _ISOTXS_EXT + "*")
     xsLibFiles = getISOTXSLibrariesToMerge(xsLibrarySuffix, [iso for iso in glob.glob(globPath)])
@@ -189,7 +203,7 @@ def mergeXSLibrariesInWorkingDirectory(
             runLog.extra("Skipping merge of {} because data already exists in the library".format(xsLibFilePath))
             continue
 
-        neutronLibrary = isotxs.readBinary(xsLibFilePath)
+        neutronLibrary = readLibrary(isotxs, xsLibFilePath, lazy=True)
         neutronVelocities[xsID] = neutronLibrary.neutronVelocity
 
         dummyNuclidesInNeutron = [
@@ -206,7 +220,7 @@ def mergeXSLibrariesInWorkingDirectory(
             )
             isotxsDummyPath = isotxsLibraryPath
             isotxs.writeBinary(neutronLibrary, isotxsDummyPath)
-            neutronLibraryDummyData = isotxs.readBinary(isotxsDummyPath)
+            neutronLibraryDummyData = readLibrary(isotxs, isotxsDummyPath, lazy=True)
             librariesToMerge.append(neutronLibraryDummyData)
             dummyNuclidesInNeutron = referenceDummyNuclides
         else:
@@ -238,27 +252,27 @@ def mergeXSLibrariesInWorkingDirectory(
                 pmatrxLibraryPath = os.path.join(baseDir, nuclearDataIO.getExpectedPMATRXFileName(xsID=xsID))
 
             # GAMISO data
-            gammaLibrary = gamiso.readBinary(gamisoLibraryPath)
+            gammaLibrary = readLibrary(gamiso, gamisoLibraryPath, lazy=True)
             addedDummyData = gamiso.addDummyNuclidesToLibrary(
                 gammaLibrary, dummyNuclidesInNeutron
             )  # Add DUMMY nuclide data not produced by MC2-3
             if addedDummyData:
                 gamisoDummyPath = gamisoLibraryPath
                 gamiso.writeBinary(gammaLibrary, gamisoDummyPath)
-                gammaLibraryDummyData = gamiso.readBinary(gamisoDummyPath)
+                gammaLibraryDummyData = readLibrary(gamiso, gamisoDummyPath, lazy=True)
                 librariesToMerge.append(gammaLibraryDummyData)
             else:
                 librariesToMerge.append(gammaLibrary)
 
             # PMATRX data
-            pmatrxLibrary = pmatrx.readBinary(pmatrxLibraryPath)
+            pmatrxLibrary = readLibrary(pmatrx, pmatrxLibraryPath)
             addedDummyData = pmatrx.addDummyNuclidesToLibrary(
                 pmatrxLibrary, dummyNuclidesInNeutron
             )  # Add DUMMY nuclide data not produced by MC2-3
             if addedDummyData:
                 pmatrxDummyPath = pmatrxLibraryPath
                 pmatrx.writeBinary(pmatrxLibrary, pmatrxDummyPath)
-                pmatrxLibraryDummyData = pmatrx.readBinary(pmatrxDummyPath)
+                pmatrxLibraryDummyData = readLibrary(pmatrx, pmatrxDummyPath)
                 librariesToMerge.append(pmatrxLibraryDummyData)
             else:
                 librariesToMerge.append(pmatrxLibrary)
@@ -0,0 +1,322 @@
+# Copyright 2026 TerraPower, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+A local, content-addressed cache of parsed cross section libraries.
+
+Every process that reads an ``ISOTXS`` (or ``GAMISO``, ``PMATRX``, ...) file parses the same CCCC records from
+scratch. This cache stores each parsed library on disk, keyed by a hash of the file contents, the reader, and
+:py:data:`READER_VERSION`, so that any other process that reads an identical file loads the stored library instead.
+
+Each entry is two files:
+
+* ``<key>.npy``: one flat byte array holding the data of every numpy array in the library (micros, scatter
+  matrices, ...), each aligned to :py:data:`_ALIGNMENT` bytes.
+* ``<key>.pkl``: a pickle of everything else, in which each array is only a reference into the ``.npy`` file.
+
+Loading memory-maps the ``.npy`` file (copy-on-write), so the arrays are views of the file and are only paged in when
+they are used. The total size of the cache is bounded; the least recently used entries are evicted first.
+
+API usage
+---------
+Reading a library through the cache::
+
+    >>> cache = XSLibraryCache("/path/to/xsCache", maxSizeMB=1024)
+    >>> lib = cache.readBinary("ISOAA")
+    >>> gammaLib = cache.readBinary("AA.gamiso", gamiso)
+    >>> cache.hits, cache.misses
+
+Notes
+-----
+``READER_VERSION`` must be incremented whenever a change to the readers or to the library objects would make a
+previously stored library differ from a freshly read one.
+"""
+
+import hashlib
+import io
+import os
+import pickle
+
+import numpy as np
+
+from armi import runLog
+from armi.nucDirectory import nuclideBases
+
+READER_VERSION = 1
+
+_ALIGNMENT = 64
+_MIN_ARRAY_BYTES = 64
+_HASH_CHUNK_BYTES = 2**24
+_ARRAYS_EXT = ".npy"
+_SKELETON_EXT = ".pkl"
+_METADATA_ATTRS = ("isotxsMetadata", "gamisoMetadata", "pmatrxMetadata")
+
+
+class XSLibraryCache:
+    """
+    An on-disk cache of parsed cross section libraries.
+
+    Parameters
+    ----------
+    cacheDir : str
+        The directory the libraries are stored in. It is created when the first library is stored. Several processes
+        may share it.
+    maxSizeMB : float, optional
+        The maximum total size of the stored libraries. Once it is exceeded, the least recently used libraries are
+        deleted.
+
+    Attributes
+    ----------
+    hits : int
+        The number of libraries that were loaded from the cache.
+    misses : int
+        The number of libraries that were not in the cache and were read from their file.
+    """
+
+    def __init__(self, cacheDir, maxSizeMB=1024.0):
+        self.cacheDir = cacheDir
+        self.maxBytes = int(maxSizeMB * 1024**2)
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self):
+        return "<{} {} hits:{} misses:{}>".format(self.__class__.__name__, self.cacheDir, self.hits, self.misses)
+
+    def readBinary(self, fileName, reader=None):
+        """
+        Read a binary cross section library, from the cache if an identical file has been read before.
+
+        Parameters
+        ----------
+        fileName : str
+            The library file to read.
+        reader : module, optional
+            The module that reads the file with its ``readBinary`` function, e.g.
+            :py:mod:`~armi.nuclearDataIO.cccc.gamiso`. Defaults to :py:mod:`~armi.nuclearDataIO.cccc.isotxs`.
+
+        Returns
+        -------
+        lib : object
+            The library, as returned by ``reader.readBinary(fileName)``.
+        """
+        if reader is None:
+            from armi.nuclearDataIO.cccc import isotxs as reader
+
+        key = self._getKey(fileName, reader)
+        lib = self._load(key, fileName)
+        if lib is not None:
+            self.hits += 1
+            runLog.extra("Loaded cross section library `{}` from the cache in {}".format(fileName, self.cacheDir))
+            return lib
+
+        self.misses += 1
+        lib = reader.readBinary(fileName)
+        try:
+            self._store(key, lib)
+            self._evict(keep=key)
+        except OSError as ee:
+            runLog.warning("Could not store cross section library `{}` in {}: {}".format(fileName, self.cacheDir, ee))
+
+        return lib
+
+    def clear(self):
+        """Delete every library in the cache."""
+        for entryPath, _size, _mtime in self._getEntries():
+            _removeEntry(entryPath)
+
+    def _getKey(self, fileName, reader):
+        """Return a hash of the file contents, the reader, and the reader version."""
+        sha = hashlib.sha256()
+        sha.update("{}:{}:".format(reader.__name__, READER_VERSION).encode())
+        with open(fileName, "rb") as libFile:
+            for chunk in iter(lambda: libFile.read(_HASH_CHUNK_BYTES), b""):
+                sha.update(chunk)
+
+        return sha.hexdigest()
+
+    def _getEntryPath(self, key):
+        # first 2 helps with reducing the number of files in a folder
+        return os.path.join(self.cacheDir, key[:2], key[2:])
+
+    def _load(self, key, fileName):
+        """Load a library from the cache, or return None if it is not there."""
+        entryPath = self._getEntryPath(key)
+        if not os.path.exists(entryPath + _SKELETON_EXT):
+            return None
+
+        try:
+            arrays = np.load(entryPath + _ARRAYS_EXT, mmap_mode="c")
+            with open(entryPath + _SKELETON_EXT, "rb") as skeleton:
+                lib = _ArrayUnpickler(skeleton, arrays).load()
+        except (OSError, EOFError, ValueError, pickle.UnpicklingError) as ee:
+            runLog.warning("Removing unreadable cross section library `{}` from the cache: {}".format(entryPath, ee))
+            _removeEntry(entryPath)
+            return None
+
+        # mark the entry as recently used
+        os.utime(entryPath + _SKELETON_EXT)
+        _restoreReadState(lib, fileName)
+        return lib
+
+    def _store(self, key, lib):
+        """Write a library into the cache, replacing the files atomically so concurrent readers never see half."""
+        entryPath = self._getEntryPath(key)
+        os.makedirs(os.path.dirname(entryPath), exist_ok=True)
+        tmpSuffix = ".{}.tmp".format(os.getpid())
+
+        skeletonBytes, arrays, numBytes = _ArrayPickler.dumps(lib)
+        tmpArraysPath = entryPath + _ARRAYS_EXT + tmpSuffix
+        blob = np.lib.format.open_memmap(tmpArraysPath, mode="w+", dtype=np.uint8, shape=(numBytes,))
+        for offset, data in arrays:
+            blob[offset : offset + data.nbytes] = data.view(np.uint8)
+        blob.flush()
+        del blob
+        os.replace(tmpArraysPath, entryPath + _ARRAYS_EXT)
+
+        # the skeleton is written last, because its presence marks a complete entry
+        tmpSkeletonPath = entryPath + _SKELETON_EXT + tmpSuffix
+        with open(tmpSkeletonPath, "wb") as skeleton:
+            skeleton.write(skeletonBytes)
+        os.replace(tmpSkeletonPath, entryPath + _SKELETON_EXT)
+
+    def _getEntries(self):
+        """Return the path, total size, and last use time of every entry in the cache."""
+        entries = []
+        if not os.path.isdir(self.cacheDir):
+            return entries
+
+        for dirPath, _dirNames, fileNames in os.walk(self.cacheDir):
+            for fileName in fileNames:
+                if not fileName.endswith(_SKELETON_EXT):
+                    continue
+                entryPath = os.path.join(dirPath, fileName[: -len(_SKELETON_EXT)])
+                try:
+                    skeletonStat = os.stat(entryPath + _SKELETON_EXT)
+                    size = skeletonStat.st_size + os.path.getsize(entryPath + _ARRAYS_EXT)
+                except OSError:
+                    continue
+                entries.append((entryPath, size, skeletonStat.st_mtime))
+
+        return entries
+
+    def _evict(self, keep=None):
+        """Delete the least recently used entries until the cache fits in its maximum size."""
+        entries = sorted(self._getEntries(), key=lambda entry: entry[2])
+        totalBytes = sum(size for _entryPath, size, _mtime in entries)
+        keepPath = self._getEntryPath(keep) if keep else None
+        for entryPath, size, _mtime in entries:
+            if totalBytes <= self.maxBytes:
+                break
+            if entryPath == keepPath:
+                continue
+            if _removeEntry(entryPath):
+                runLog.extra("Evicted cross section library `{}` from the cache".format(entryPath))
+                totalBytes -= size
+
+
+def _removeEntry(entryPath):
+    """Delete the files of an entry, returning whether it succeeded (a memory-mapped file may be locked)."""
+    try:
+        # remove the skeleton first, so that the entry is never seen without its arrays
+        for ext in (_SKELETON_EXT, _ARRAYS_EXT):
+            if os.path.exists(entryPath + ext):
+                os.remove(entryPath + ext)
+    except OSError as ee:
+        runLog.debug("Could not remove cached cross section library `{}`: {}".format(entryPath, ee))
+        return False
+
+    return True
+
+
+def _restoreReadState(lib, fileName):
+    """
+    Redo the side effects of reading a library file that loading it from the cache skips.
+
+    Reading a nuclide can relabel its global nuclide base (see
+    :py:meth:`~armi.nuclearDataIO.xsNuclides.XSNuclide.updateBaseNuclide`), and the library records the name of the
+    file it was read from, which may differ from the file the cached copy was made from.
+    """
+    for nuc in getattr(lib, "nuclides", []):
+        nucBase = getattr(nuc, "_base", None)
+        if nucBase is not None and nucBase.label != nuc.nucLabel:
+            nuclideBases.changeLabel(nucBase, nuc.nucLabel)
+
+    for attrName in _METADATA_ATTRS:
+        metadata = getattr(lib, attrName, None)
+        if metadata is not None and metadata.fileNames:
+            metadata.fileNames = [fileName]
+
+
+class _ArrayPickler(pickle.Pickler):
+    """Pickle an object, but gather its numpy arrays into one aligned byte array instead of the pickle."""
+
+    def __init__(self, stream):
+        pickle.Pickler.__init__(self, stream, protocol=pickle.HIGHEST_PROTOCOL)
+        self.arrays = []
+        self.numBytes = 0
+        self._ids = {}
+
+    @classmethod
+    def dumps(cls, obj):
+        """
+        Pickle an object.
+
+        Returns
+        -------
+        skeletonBytes : bytes
+            The pickle, referring to the arrays by their location.
+        arrays : list of tuple
+            The byte offset and flat, contiguous data of every array.
+        numBytes : int
+            The total size of the byte array that holds all of the arrays.
+        """
+        stream = io.BytesIO()
+        pickler = cls(stream)
+        pickler.dump(obj)
+        # an empty file cannot be memory-mapped
+        return stream.getvalue(), pickler.arrays, max(pickler.numBytes, 1)
+
+    def persistent_id(self, obj):
+        if type(obj) is not np.ndarray or obj.dtype.hasobject or obj.nbytes < _MIN_ARRAY_BYTES:
+            return None
+
+        arrayId = self._ids.get(id(obj))
+        if arrayId is not None:
+            # arrays shared within the library stay shared
+            return arrayId[0]
+
+        order = "F" if obj.flags.f_contiguous and not obj.flags.c_contiguous else "C"
+        data = obj.ravel(order=order)
+        offset = -(-self.numBytes // _ALIGNMENT) * _ALIGNMENT
+        self.numBytes = offset + data.nbytes
+        self.arrays.append((offset, data))
+        pid = ("ndarray", offset, obj.dtype.str, obj.shape, order)
+        # keep the array alive so its id is not reused while pickling
+        self._ids[id(obj)] = (pid, obj)
+        return pid
+
+
+class _ArrayUnpickler(pickle.Unpickler):
+    """Unpickle an object pickled by :py:class:`_ArrayPickler`, with its arrays as views of the byte array."""
+
+    def __init__(self, stream, arrays):
+        pickle.Unpickler.__init__(self, stream)
+        self._arrays = arrays
+
+    def persistent_load(self, pid):
+        tag, offset, dtypeStr, shape, order = pid
+        if tag != "ndarray":
+            raise pickle.UnpicklingError("Unknown persistent id {}".format(pid))
+
+        return np.ndarray(shape, dtype=np.dtype(dtypeStr), buffer=self._arrays, offset=offset, order=order)
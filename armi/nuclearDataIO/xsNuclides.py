@@ -26,6 +26,8 @@ Warning
 "PU39AA").
 """
 
+import os
+
 from armi.nucDirectory import nuclideBases
 from armi.nuclearDataIO import nuclearFileMetadata, xsCollections, xsLibraries
 from armi.utils.customExceptions import warn_when_root
@@ -53,7 +55,9 @@ class XSNuclide(nuclideBases.NuclideWrapper):
         self.isotxsMetadata = nuclearFileMetadata.NuclideMetadata()
         self.gamisoMetadata = nuclearFileMetadata.NuclideMetadata()
         self.pmatrxMetadata = nuclearFileMetadata.NuclideMetadata()
-        # 5D and 7D records
+        # 5D and 7D records; for lazily read libraries, keys are "micros" or "gammaXS" and values are the location of
+        # the records that have not been read yet
+        self._pendingRecords = {}
         self.micros = xsCollections.XSCollection(parent=self)
         self.gammaXS = xsCollections.XSCollection(parent=self)
         self.neutronHeating = None
@@ -63,6 +67,69 @@ class XSNuclide(nuclideBases.NuclideWrapper):
         self.linearAnisotropicProduction = None
         self.nOrderProductionMatrix = {}
 
+    def __getstate__(self):
+        # the records of a lazily read library are only valid on this file system, so send the data itself
+        self.loadPendingRecords()
+        return self.__dict__
+
+    @property
+    def micros(self):
+        """The neutron cross sections, read from the library file on first access if it was read lazily."""
+        self._loadRecords("micros")
+        return self._micros
+
+    @micros.setter
+    def micros(self, value):
+        self._pendingRecords.pop("micros", None)
+        self._micros = value
+
+    @property
+    def gammaXS(self):
+        """The gamma cross sections, read from the library file on first access if it was read lazily."""
+        self._loadRecords("gammaXS")
+        return self._gammaXS
+
+    @gammaXS.setter
+    def gammaXS(self, value):
+        self._pendingRecords.pop("gammaXS", None)
+        self._gammaXS = value
+
+    def setPendingRecords(self, attrName, records):
+        """
+        Defer reading a set of cross sections until they are first accessed.
+
+        Parameters
+        ----------
+        attrName : str
+            The cross sections the records hold, either ``"micros"`` or ``"gammaXS"``.
+        records : object
+            The location of the records, with a ``load(nuclide)`` method that reads them into a nuclide, e.g.
+            :py:class:`~armi.nuclearDataIO.cccc.isotxs.CrossSectionRecords`.
+        """
+        self._pendingRecords[attrName] = records
+
+    def getPendingRecords(self, attrName):
+        """Return the records of a set of cross sections that have not been read yet, if there are any."""
+        return self._pendingRecords.get(attrName)
+
+    def loadPendingRecords(self, fileName=None):
+        """
+        Read all cross sections that have not been read yet.
+
+        Parameters
+        ----------
+        fileName : str, optional
+            Only read the cross sections that are in this file, e.g. before it is overwritten.
+        """
+        for attrName, records in list(self._pendingRecords.items()):
+            if fileName is None or os.path.abspath(records.fileName) == os.path.abspath(fileName):
+                self._loadRecords(attrName)
+
+    def _loadRecords(self, attrName):
+        records = self._pendingRecords.pop(attrName, None)
+        if records is not None:
+            records.load(self)
+
     def updateBaseNuclide(self):
         """
         Update which nuclide base this :py:class:`XSNuclide` points to.
@@ -173,8 +240,8 @@ class XSNuclide(nuclideBases.NuclideWrapper):
         self.isotxsMetadata = self.isotxsMetadata.merge(other.isotxsMetadata, self, other, "ISOTXS", AttributeError)
         self.gamisoMetadata = self.gamisoMetadata.merge(other.gamisoMetadata, self, other, "GAMISO", AttributeError)
         self.pmatrxMetadata = self.pmatrxMetadata.merge(other.pmatrxMetadata, self, other, "PMATRX", AttributeError)
-        self.micros.merge(other.micros)
-        self.gammaXS.merge(other.gammaXS)
+        self._mergeCrossSections(other, "micros")
+        self._mergeCrossSections(other, "gammaXS")
         self.neutronHeating = _mergeAttributes(self, other, "neutronHeating")
         self.neutronDamage = _mergeAttributes(self, other, "neutronDamage")
         self.gammaHeating = _mergeAttributes(self, other, "gammaHeating")
@@ -183,6 +250,25 @@ class XSNuclide(nuclideBases.NuclideWrapper):
         # this is lazy, but should work, because the n-order wouldn't be set without the others being set first.
         self.nOrderProductionMatrix = self.nOrderProductionMatrix or other.nOrderProductionMatrix
 
+    def _mergeCrossSections(self, other, attrName):
+        """
+        Merge one set of cross sections of two XSNuclides.
+
+        Records that have not been read yet are passed along as they are, so merging lazily read libraries does not
+        read any cross sections.
+        """
+        valuesName = "_" + attrName
+        otherRecords = other._pendingRecords.get(attrName)
+        if otherRecords is None and getattr(other, valuesName).isEmpty():
+            return
+
+        ownRecords = self._pendingRecords.get(attrName)
+        if otherRecords is not None and ownRecords is None and getattr(self, valuesName).isEmpty():
+            self._pendingRecords[attrName] = otherRecords
+            return
+
+        getattr(self, attrName).merge(getattr(other, attrName))
+
 
 def _mergeAttributes(this, other, attrName):
     """Function for merging XSNuclide attributes.
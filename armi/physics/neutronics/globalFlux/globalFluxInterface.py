@@ -16,6 +16,7 @@
 and/or photon flux.
 """
 
+import collections
 import math
 from typing import Dict, Optional
 
@@ -23,7 +24,7 @@ import numpy as np
 
 from armi import interfaces, runLog
 from armi.physics import constants, executers, neutronics
-from armi.physics.neutronics.globalFlux import RX_ABS_MICRO_LABELS, RX_PARAM_NAMES
+from armi.physics.neutronics.globalFlux import RX_PARAM_NAMES, reactionRates
 from armi.reactor import geometry, reactors
 from armi.reactor.blocks import Block
 from armi.reactor.converters import geometryConverters, uniformMesh
@@ -783,18 +784,23 @@ class GlobalFluxResultMapper(interfaces.OutputReader):
         if blockList is None:
             blockList = self.r.core.iterBlocks()
 
-        hasDPA = False
+        # blocks that use the same DPA cross sections are computed together
+        blocksByXs = collections.defaultdict(list)
+        xsById = {}
         for b in blockList:
             xs = self.getDpaXs(b)
-            hasDPA = True
-            flux = b.getMgFlux()  # n/cm^2/s
-            dpaPerSecond = computeDpaRate(flux, xs)
-            b.p.detailedDpaPeakRate = dpaPerSecond * self.getBurnupPeakingFactor(b)
-            b.p.detailedDpaRate = dpaPerSecond
+            xsById[id(xs)] = xs
+            blocksByXs[id(xs)].append(b)
 
-        if not hasDPA:
+        if not blocksByXs:
             return
 
+        for xsId, blocks in blocksByXs.items():
+            fluxes = [b.getMgFlux() for b in blocks]  # n/cm^2/s
+            for b, dpaPerSecond in zip(blocks, computeDpaRates(fluxes, xsById[xsId], blocks)):
+                b.p.detailedDpaPeakRate = dpaPerSecond * self.getBurnupPeakingFactor(b)
+                b.p.detailedDpaRate = dpaPerSecond
+
         peakRate = self.r.core.getMaxBlockParam("detailedDpaPeakRate", typeSpec=Flags.GRID_PLATE, absolute=False)
         self.r.core.p.peakGridDpaAt60Years = peakRate * 60.0 * units.SECONDS_PER_YEAR
 
@@ -887,20 +893,54 @@ def computeDpaRate(mgFlux, dpaXs, block=None):
     RuntimeError
        Negative dpa rate.
     """
-    if len(mgFlux) != len(dpaXs):
-        runLog.warning(
-            f"Multigroup flux of length {len(mgFlux)} is incompatible with DPA cross section of length {len(dpaXs)}; "
-            "DPA rate will be set do 0.0",
-            single=True,
-        )
-        return 0.0
+    return float(computeDpaRates([mgFlux], dpaXs, [block])[0])
+
+
+def computeDpaRates(mgFluxes, dpaXs, blocks=None) -> np.ndarray:
+    """
+    Compute the DPA rates incurred by exposure of many flux spectra to the same DPA cross section.
+
+    This is the vectorized form of :py:func:`computeDpaRate`; the rates are one matrix-vector product.
+
+    Parameters
+    ----------
+    mgFluxes : list of lists
+        multi-group neutron fluxes in #/cm^2/s
+    dpaXs : list
+        DPA cross section in barns to convolute with each flux to determine DPA rates
+    blocks : list of Block, optional
+        The blocks of each flux, used purely for logging.
+
+    Returns
+    -------
+    dpaPerSecond : np.ndarray
+        The DPA/s in this material due to each flux
+
+    Raises
+    ------
+    RuntimeError
+       Negative dpa rate.
+    """
+    dpaXs = np.asarray(dpaXs, dtype=float)
+    dpaRates = np.zeros(len(mgFluxes))
+    compatible = []
+    for i, mgFlux in enumerate(mgFluxes):
+        if len(mgFlux) != len(dpaXs):
+            runLog.warning(
+                f"Multigroup flux of length {len(mgFlux)} is incompatible with DPA cross section of length "
+                f"{len(dpaXs)}; DPA rate will be set do 0.0",
+                single=True,
+            )
+        else:
+            compatible.append(i)
 
-    displacements = 0.0
-    for flux, barns in zip(mgFlux, dpaXs):
-        displacements += flux * barns
+    if compatible:
+        fluxes = np.array([mgFluxes[i] for i in compatible], dtype=float)
+        dpaRates[compatible] = fluxes.dot(dpaXs) * units.CM2_PER_BARN
 
-    dpaPerSecond = displacements * units.CM2_PER_BARN
-    if dpaPerSecond < 0:
+    for i in np.flatnonzero(dpaRates < 0):
+        dpaPerSecond = dpaRates[i]
+        block = blocks[i] if blocks is not None else None
         forBlock = f" for block {block}" if block else ""
         runLog.warning(f"Negative DPA rate calculated to be {dpaPerSecond}{forBlock}, setting to zero.")
         # ensure physical meaning of dpaPerSecond, it is likely just slightly negative
@@ -908,9 +948,9 @@ def computeDpaRate(mgFlux, dpaXs, block=None):
             msg = f"Calculated DPA rate is substantially negative at {dpaPerSecond}{forBlock}."
             runLog.error(msg)
             raise RuntimeError(msg)
-        dpaPerSecond = 0.0
+        dpaRates[i] = 0.0
 
-    return dpaPerSecond
+    return dpaRates
 
 
 def calcReactionRates(obj, keff, lib):
@@ -965,48 +1005,37 @@ def calcReactionRates(obj, keff, lib):
     lib : XSLibrary
         Microscopic cross sections to use in computing the reaction rates.
     """
-    rate = {}
-    for simple in RX_PARAM_NAMES:
-        rate[simple] = 0.0
-
-    numberDensities = obj.getNumberDensities()
-
-    for nucName, numberDensity in numberDensities.items():
-        if numberDensity == 0.0:
-            continue
-        nucrate = {}
-        for simple in RX_PARAM_NAMES:
-            nucrate[simple] = 0.0
-
-        nucMc = lib.getNuclide(nucName, obj.getMicroSuffix())
-        micros = nucMc.micros
-
-        # absorption is fission + capture (no n2n here)
-        mgFlux = obj.getMgFlux()
-        for name in RX_ABS_MICRO_LABELS:
-            for g, (groupFlux, xs) in enumerate(zip(mgFlux, micros[name])):
-                dphi = numberDensity * groupFlux
-                nucrate["rateAbs"] += dphi * xs
-
-                if name != "fission":
-                    nucrate["rateCap"] += dphi * xs
-                else:
-                    nucrate["rateFis"] += dphi * xs
-                    # scale nu by keff.
-                    nucrate["rateProdFis"] += dphi * xs * micros.neutronsPerFission[g] / keff
-
-        for groupFlux, n2nXs in zip(mgFlux, micros.n2n):
-            # this n2n xs is reaction based. Multiply by 2.
-            dphi = numberDensity * groupFlux
-            nucrate["rateProdN2n"] += 2.0 * dphi * n2nXs
-
-        for simple in RX_PARAM_NAMES:
-            if nucrate[simple]:
-                rate[simple] += nucrate[simple]
-
-    for paramName, val in rate.items():
-        obj.p[paramName] = val  # put in #/cm^3/s
-
-    vFuel = obj.getComponentAreaFrac(Flags.FUEL) if rate["rateFis"] > 0.0 else 1.0
-    obj.p.fisDens = rate["rateFis"] / vFuel
-    obj.p.fisDensHom = rate["rateFis"]
+    calcReactionRatesForBlocks([obj], keff, lib)
+
+
+def calcReactionRatesForBlocks(objs, keff, lib):
+    """
+    Compute 1-group reaction rates for many objects (usually blocks) at once.
+
+    The objects are grouped by their cross section type, and the rates of each group are computed together with
+    :py:func:`~armi.physics.neutronics.globalFlux.reactionRates.computeReactionRates`. See
+    :py:func:`calcReactionRates` for the rates that are computed.
+
+    Parameters
+    ----------
+    objs : list of Block
+        The objects to compute reaction rates on. All of them must have a multi-group flux.
+    keff : float
+        The keff of the core.
+    lib : XSLibrary
+        Microscopic cross sections to use in computing the reaction rates.
+    """
+    objsBySuffix = collections.defaultdict(list)
+    for obj in objs:
+        objsBySuffix[obj.getMicroSuffix()].append(obj)
+
+    for suffix, suffixObjs in objsBySuffix.items():
+        rates = reactionRates.computeReactionRates(suffixObjs, keff, lambda nucName: lib.getNuclide(nucName, suffix))
+        for obj, objRates in zip(suffixObjs, rates):
+            rate = dict(zip(RX_PARAM_NAMES, objRates.tolist()))
+            for paramName, val in rate.items():
+                obj.p[paramName] = val  # put in #/cm^3/s
+
+            vFuel = obj.getComponentAreaFrac(Flags.FUEL) if rate["rateFis"] > 0.0 else 1.0
+            obj.p.fisDens = rate["rateFis"] / vFuel
+            obj.p.fisDensHom = rate["rateFis"]
@@ -0,0 +1,103 @@
+# Copyright 2026 TerraPower, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+r"""
+Compute the 1-group reaction rates of many objects at once.
+
+The reaction rates of an object are sums over nuclides and energy groups of :math:`N \sigma \phi`. Rather than
+looping over the nuclides of each object, the number densities of all objects are gathered into an [object x nuclide]
+matrix, the micros of the nuclides into a [reaction rate x nuclide x group] array, and the fluxes into an
+[object x group] matrix, so that the rates of every object come from a few matrix products.
+"""
+
+from typing import Callable, List, Sequence
+
+import numpy as np
+
+from armi.physics.neutronics.globalFlux import RX_ABS_MICRO_LABELS, RX_PARAM_NAMES
+
+
+def stackRateMicros(nucNames: Sequence[str], getNuclide: Callable) -> np.ndarray:
+    """
+    Stack the micros of some nuclides into a [reaction rate x nuclide x group] array.
+
+    The reaction rates are in the order of ``RX_PARAM_NAMES``. The production rate from fission is not yet divided by
+    keff.
+
+    Parameters
+    ----------
+    nucNames : list of str
+        Names of the nuclides, in the order of the rows of the array.
+    getNuclide : callable
+        Returns the library nuclide (an ``XSNuclide``) of a nuclide name.
+    """
+    rateMicros = []
+    for nucName in nucNames:
+        micros = getNuclide(nucName).micros
+        fission = np.asarray(micros["fission"], dtype=float)
+        # absorption is fission + capture (no n2n here)
+        capture = sum(np.asarray(micros[name], dtype=float) for name in RX_ABS_MICRO_LABELS if name != "fission")
+        byRate = {
+            "rateCap": capture,
+            "rateFis": fission,
+            # this n2n xs is reaction based. Multiply by 2.
+            "rateProdN2n": 2.0 * np.asarray(micros.n2n, dtype=float),
+            "rateProdFis": fission * micros.neutronsPerFission,
+            "rateAbs": capture + fission,
+        }
+        rateMicros.append([byRate[rateName] for rateName in RX_PARAM_NAMES])
+
+    return np.array(rateMicros).transpose(1, 0, 2)
+
+
+def computeReactionRates(objs: List, keff: float, getNuclide: Callable) -> np.ndarray:
+    """
+    Compute the 1-group reaction rates of some objects that share a set of microscopic cross sections.
+
+    Parameters
+    ----------
+    objs : list of Block
+        The objects to compute reaction rates of. All of them must have a multi-group flux.
+    keff : float
+        The keff of the core. This is required to get the neutron production rate correct
+        via the neutron balance statement (since nuSigF has a 1/keff term).
+    getNuclide : callable
+        Returns the library nuclide (an ``XSNuclide``) of a nuclide name.
+
+    Returns
+    -------
+    rates : np.ndarray
+        The [object x reaction rate] rates in #/cm^3/s, with the rates in the order of ``RX_PARAM_NAMES``.
+    """
+    densities = [obj.getNumberDensities() for obj in objs]
+    nucNames = sorted({nucName for nDens in densities for nucName, val in nDens.items() if val != 0.0})
+    rates = np.zeros((len(objs), len(RX_PARAM_NAMES)))
+    if not nucNames:
+        return rates
+
+    nucIndex = {nucName: i for i, nucName in enumerate(nucNames)}
+    numberDensities = np.zeros((len(objs), len(nucNames)))
+    for row, nDens in enumerate(densities):
+        for nucName, val in nDens.items():
+            if val != 0.0:
+                numberDensities[row, nucIndex[nucName]] = val
+
+    mgFlux = np.array([obj.getMgFlux() for obj in objs], dtype=float)
+    rateMicros = stackRateMicros(nucNames, getNuclide)
+
+    # [object x nuclide] . [nuclide x group] for each rate, then sum the groups against the flux of each object
+    rates = np.einsum("on,rng,og->or", numberDensities, rateMicros, mgFlux, optimize=True)
+    rates[:, RX_PARAM_NAMES.index("rateProdFis")] /= keff
+
+    return rates
@@ -20,7 +20,7 @@ import numpy as np
 
 from armi import settings
 from armi.nuclearDataIO.cccc import isotxs
-from armi.physics.neutronics.globalFlux import globalFluxInterface
+from armi.physics.neutronics.globalFlux import RX_ABS_MICRO_LABELS, RX_PARAM_NAMES, globalFluxInterface
 from armi.physics.neutronics.settings import (
     CONF_GRID_PLATE_DPA_XS_SET,
     CONF_XS_KERNEL,
@@ -183,6 +183,17 @@ class TestGFI(unittest.TestCase):
                 globalFluxInterface.computeDpaRate(flx, xs)
             self.assertIn("substantially negative", mock.getStdout())
 
+    def test_computeDpaRates(self):
+        xs = [1.0, 2.0, 3.0]
+        fluxes = [[0.5, 0.75, 2.0], [1.0, 2.0, 3.0, 4.0], [3.0, 0.0, 1.0]]
+        with mockRunLogs.BufferLog() as mock:
+            rates = globalFluxInterface.computeDpaRates(fluxes, xs)
+            self.assertIn("will be set do 0.0", mock.getStdout())
+
+        self.assertEqual(len(rates), 3)
+        for flux, rate in zip(fluxes, rates):
+            self.assertAlmostEqual(rate, globalFluxInterface.computeDpaRate(flux, xs))
+
     def test_interaction(self):
         """
         Ensure the basic interaction hooks work.
@@ -456,6 +467,35 @@ class TestGlobalFluxUtils(unittest.TestCase):
         self.assertEqual(b.p.fisDens, b.p.rateFis / vfrac)
         self.assertEqual(b.p.fisDensHom, b.p.rateFis)
 
+    def test_calcReactionRatesMatchesLoop(self):
+        """The matrix form of the reaction rates matches summing over each nuclide and group."""
+        b = buildComplexHexBlock()
+        applyDummyData(b)
+        keff = 1.01
+        lib = b.core.lib
+        globalFluxInterface.calcReactionRates(b, keff, lib)
+
+        expected = {name: 0.0 for name in RX_PARAM_NAMES}
+        mgFlux = b.getMgFlux()
+        for nucName, numberDensity in b.getNumberDensities().items():
+            if numberDensity == 0.0:
+                continue
+            micros = lib.getNuclide(nucName, b.getMicroSuffix()).micros
+            for name in RX_ABS_MICRO_LABELS:
+                for g, (groupFlux, xs) in enumerate(zip(mgFlux, micros[name])):
+                    dphi = numberDensity * groupFlux
+                    expected["rateAbs"] += dphi * xs
+                    if name != "fission":
+                        expected["rateCap"] += dphi * xs
+                    else:
+                        expected["rateFis"] += dphi * xs
+                        expected["rateProdFis"] += dphi * xs * micros.neutronsPerFission[g] / keff
+            for groupFlux, n2nXs in zip(mgFlux, micros.n2n):
+                expected["rateProdN2n"] += 2.0 * numberDensity * groupFlux * n2nXs
+
+        for name, val in expected.items():
+            self.assertAlmostEqual(b.p[name], val, delta=1e-10 * abs(val))
+
 
 def applyDummyFlux(r, ng=33):
     """Set arbitrary flux distribution on a Reactor."""
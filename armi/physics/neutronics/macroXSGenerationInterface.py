@@ -19,8 +19,18 @@ Converts microscopic cross sections to macroscopic cross sections by multiplying
 
     \Sigma_i = N_i \sigma_i
 
+When run in parallel, the blocks themselves are not sent to the workers by default. Each block is reduced to a compact
+payload of its name, cross section suffix, and the indices and number densities of its nuclides. The library is only
+broadcast when its content changes, and the macros come back packed into arrays.
 """
 
+import hashlib
+import pickle
+import weakref
+
+import numpy as np
+from scipy import sparse
+
 from armi import context, interfaces, mpiActions, runLog
 from armi.nuclearDataIO import xsCollections
 from armi.physics.neutronics.settings import CONF_MINIMUM_NUCLIDE_DENSITY
@@ -37,6 +47,7 @@ class MacroXSGenerator(mpiActions.MpiAction):
         buildScatterMatrix,
         libType,
         minimumNuclideDensity=0.0,
+        compactPayloads=True,
     ):
         mpiActions.MpiAction.__init__(self)
         self.buildScatterMatrix = buildScatterMatrix
@@ -44,6 +55,7 @@ class MacroXSGenerator(mpiActions.MpiAction):
         self.lib = lib
         self.blocks = blocks
         self.minimumNuclideDensity = minimumNuclideDensity
+        self.compactPayloads = compactPayloads
 
     def __reduce__(self):
         # Prevent blocks and lib from being broadcast by passing None to ctor. Although lib must be broadcast, we need
@@ -57,6 +69,7 @@ class MacroXSGenerator(mpiActions.MpiAction):
                 self.buildScatterMatrix,
                 self.libType,
                 self.minimumNuclideDensity,
+                self.compactPayloads,
             ),
         )
 
@@ -75,22 +88,48 @@ class MacroXSGenerator(mpiActions.MpiAction):
 
         mc = xsCollections.MacroscopicCrossSectionCreator(self.buildScatterMatrix, self.minimumNuclideDensity)
 
-        if context.MPI_SIZE > 1:
+        if context.MPI_SIZE > 1 and self.compactPayloads:
+            allMacros = self._buildMacrosFromPayloads(mc, lib, allBlocks)
+
+        elif context.MPI_SIZE > 1:
             myBlocks = self.scatterList(allBlocks)
 
             lib = context.MPI_COMM.bcast(lib, root=0)
 
-            myMacros = [mc.createMacrosFromMicros(lib, b, libType=self.libType) for b in myBlocks]
+            myMacros = mc.createMacrosForBlocks(lib, myBlocks, libType=self.libType)
 
             allMacros = self.gatherList(myMacros)
 
         else:
-            allMacros = [mc.createMacrosFromMicros(lib, b, libType=self.libType) for b in allBlocks]
+            allMacros = mc.createMacrosForBlocks(lib, allBlocks, libType=self.libType)
 
         if context.MPI_RANK == 0:
             for b, macro in zip(allBlocks, allMacros):
                 b.macros = macro
 
+    def _buildMacrosFromPayloads(self, mc, lib, allBlocks):
+        """Build macros on all ranks, sending compact block payloads and packed results rather than pickled objects."""
+        lib = _broadcastLibrary(lib)
+
+        if context.MPI_RANK == 0:
+            nucNames, payloads = packBlocks(allBlocks)
+        else:
+            nucNames, payloads = None, []
+        nucNames = context.MPI_COMM.bcast(nucNames, root=0)
+        myPayloads = self.scatterList(payloads)
+
+        myBlocks = [PayloadBlock(nucNames, *payload) for payload in myPayloads]
+        myMacros = mc.createMacrosForBlocks(lib, myBlocks, libType=self.libType)
+        allPacked = context.MPI_COMM.gather(packMacros(myMacros), root=0)
+
+        if context.MPI_RANK != 0:
+            return []
+
+        allMacros = []
+        for packed in allPacked:
+            allMacros.extend(unpackMacros(packed))
+        return allMacros
+
     @staticmethod
     def scatterList(lst):
         """Helper functions for mpi communication."""
@@ -111,6 +150,172 @@ class MacroXSGenerator(mpiActions.MpiAction):
         return globalList
 
 
+class PayloadBlock:
+    """
+    A stand-in for a block on a worker, with just enough of the Block interface to build macros.
+
+    Parameters
+    ----------
+    nucNames : list of str
+        The names of all nuclides in the payloads, which ``nucIndices`` refer to.
+    name : str
+        The name of the block the payload came from.
+    xsSuffix : str
+        The cross section suffix of the block.
+    nucIndices : np.ndarray
+        Indices into ``nucNames`` of the nuclides in the block.
+    densities : np.ndarray
+        Number densities of those nuclides, in atoms/bn-cm.
+    """
+
+    def __init__(self, nucNames, name, xsSuffix, nucIndices, densities):
+        self.name = name
+        self.xsSuffix = xsSuffix
+        self.densities = {nucNames[i]: nDens for i, nDens in zip(nucIndices.tolist(), densities.tolist())}
+
+    def __repr__(self):
+        return "<PayloadBlock {}>".format(self.name)
+
+    def __str__(self):
+        return self.name
+
+    def getMicroSuffix(self):
+        return self.xsSuffix
+
+    def getNuclides(self):
+        return list(self.densities)
+
+    def getNuclideNumberDensities(self, nucNames):
+        return [self.densities.get(nucName, 0.0) for nucName in nucNames]
+
+    def getNumberDensities(self):
+        return dict(self.densities)
+
+
+def packBlocks(blocks):
+    """
+    Reduce blocks to the compact payloads used to build their macros.
+
+    Returns the names of all nuclides in the blocks, and a (name, xsSuffix, nucIndices, densities) tuple for each
+    block, where the indices refer to the list of nuclide names.
+    """
+    blockDensities = [b.getNumberDensities() for b in blocks]
+    nucNames = sorted({nucName for densities in blockDensities for nucName in densities})
+    nucIndex = {nucName: i for i, nucName in enumerate(nucNames)}
+
+    payloads = []
+    for b, densities in zip(blocks, blockDensities):
+        nucIndices = np.array([nucIndex[nucName] for nucName in densities], dtype=np.int32)
+        payloads.append((str(b), b.getMicroSuffix(), nucIndices, np.array(list(densities.values()), dtype=float)))
+
+    return nucNames, payloads
+
+
+# the names of the cross sections set by MacroscopicCrossSectionCreator, by how they are packed
+_PACKED_VECTORS = (
+    xsCollections.BASIC_XS + xsCollections.DERIVED_XS + xsCollections.TOTAL_XS + ["chi", "diffusionConstants"]
+)
+_PACKED_MATRICES = xsCollections.BASIC_SCAT_MATRIX + ["totalScatter"]
+
+
+def packMacros(macrosList):
+    """
+    Pack the macros of many blocks into arrays.
+
+    Each vector cross section is stacked into one [block x group] array, and each scatter matrix into one sparse
+    [(block * group) x group] matrix, sent as its CSR arrays.
+    """
+    packed = {"sources": [macros.source for macros in macrosList]}
+    for xsName in _PACKED_VECTORS:
+        values = [macros[xsName] for macros in macrosList]
+        packed[xsName] = values if any(v is None for v in values) or not values else np.array(values)
+
+    for matrixName in _PACKED_MATRICES:
+        matrices = [macros[matrixName] for macros in macrosList]
+        if not matrices:
+            packed[matrixName] = None
+            continue
+        stacked = sparse.vstack(matrices, format="csr")
+        packed[matrixName] = (stacked.data, stacked.indices, stacked.indptr, stacked.shape, matrices[0].shape[0])
+
+    return packed
+
+
+def unpackMacros(packed):
+    """Rebuild the macros of each block from the arrays made by :py:func:`packMacros`."""
+    macrosList = []
+    for i, source in enumerate(packed["sources"]):
+        macros = xsCollections.XSCollection(parent=None)
+        macros.source = source
+        for xsName in _PACKED_VECTORS:
+            macros[xsName] = packed[xsName][i]
+        macrosList.append(macros)
+
+    for matrixName in _PACKED_MATRICES:
+        if packed[matrixName] is None:
+            continue
+        data, indices, indptr, shape, rows = packed[matrixName]
+        stacked = sparse.csr_matrix((data, indices, indptr), shape=shape)
+        for i, macros in enumerate(macrosList):
+            macros[matrixName] = stacked[i * rows : (i + 1) * rows]
+
+    return macrosList
+
+
+# libraries sent or received by this process, keyed by their content hash
+_libraryCache = {}
+
+# a weak reference to the library last hashed on the primary, with its fingerprint and content hash
+_lastHashed = (None, None, None)
+
+
+def _fingerprintLibrary(lib):
+    """
+    Summarize the content of a library cheaply, from its nuclides and file metadata.
+
+    This changes when a library is modified in place by adding, removing, or merging nuclides, so it stands in for the
+    content hash of a library that was already hashed.
+    """
+    metadata = [getattr(lib, name, None) for name in ("isotxsMetadata", "gamisoMetadata", "pmatrxMetadata")]
+    return tuple(lib.nuclideLabels), repr([list(m.items()) for m in metadata if m is not None])
+
+
+def _broadcastLibrary(lib):
+    """
+    Give every rank the library from the primary, sending it only if its content has changed since it was last sent.
+
+    Every worker has received every library that was sent, so they all hold the same cache; the primary only sends the
+    hash of a library they already have. The primary only pickles and hashes the library again if it is a different
+    object, or its fingerprint changed, since it was last hashed.
+    """
+    global _lastHashed
+
+    if context.MPI_RANK == 0:
+        libRef, fingerprint, libHash = _lastHashed
+        newFingerprint = _fingerprintLibrary(lib)
+        libBytes = None
+        if libRef is None or libRef() is not lib or fingerprint != newFingerprint:
+            libBytes = pickle.dumps(lib, protocol=pickle.HIGHEST_PROTOCOL)
+            libHash = hashlib.sha1(libBytes).hexdigest()
+            _lastHashed = (weakref.ref(lib), newFingerprint, libHash)
+
+        isNew = libHash not in _libraryCache
+        if isNew and libBytes is None:
+            libBytes = pickle.dumps(lib, protocol=pickle.HIGHEST_PROTOCOL)
+        _libraryCache.clear()
+        _libraryCache[libHash] = lib
+        context.MPI_COMM.bcast((libHash, libBytes if isNew else None), root=0)
+        return lib
+
+    libHash, libBytes = context.MPI_COMM.bcast(None, root=0)
+    if libBytes is not None:
+        runLog.debug("Received cross section library {}".format(libHash))
+        _libraryCache.clear()
+        _libraryCache[libHash] = pickle.loads(libBytes)
+
+    return _libraryCache[libHash]
+
+
 class MacroXSGenerationInterface(interfaces.Interface):
     """
     Builds macroscopic cross sections on all Blocks.
@@ -13,19 +13,39 @@
 # limitations under the License.
 """MacroXSGenerationInterface tests."""
 
+import pickle
 import unittest
 from collections import defaultdict
+from unittest.mock import MagicMock, patch
 
+import numpy as np
+
+from armi import context
 from armi.nuclearDataIO import isotxs
-from armi.nuclearDataIO.xsCollections import XSCollection
+from armi.nuclearDataIO.xsCollections import MacroscopicCrossSectionCreator, XSCollection
+from armi.physics.neutronics import macroXSGenerationInterface
 from armi.physics.neutronics.macroXSGenerationInterface import (
     MacroXSGenerationInterface,
+    PayloadBlock,
+    _broadcastLibrary,
+    packBlocks,
+    packMacros,
+    unpackMacros,
 )
 from armi.settings import Settings
 from armi.testing import TESTING_ROOT, loadTestReactor
 from armi.tests import ISOAA_PATH
 
 
+def _getMockLib():
+    """A nuclide library that gives the carbon cross sections for any nuclide it does not have."""
+    mockLib = isotxs.readBinary(ISOAA_PATH)
+    mockLib.__dict__["_nuclides"] = defaultdict(
+        lambda: mockLib.__dict__["_nuclides"]["CAA"], mockLib.__dict__["_nuclides"]
+    )
+    return mockLib
+
+
 class TestMacroXSGenerationInterface(unittest.TestCase):
     def test_macroXSGenerationInterfaceBasics(self):
         """Test the macroscopic XS generating interfaces.
@@ -47,10 +67,7 @@ class TestMacroXSGenerationInterface(unittest.TestCase):
         self.assertEqual(i.name, "macroXsGen")
 
         # Mock up a nuclide library
-        mockLib = isotxs.readBinary(ISOAA_PATH)
-        mockLib.__dict__["_nuclides"] = defaultdict(
-            lambda: mockLib.__dict__["_nuclides"]["CAA"], mockLib.__dict__["_nuclides"]
-        )
+        mockLib = _getMockLib()
 
         # This is the meat of it: build the macro XS
         self.assertIsNone(i.macrosLastBuiltAt)
@@ -61,3 +78,66 @@ class TestMacroXSGenerationInterface(unittest.TestCase):
         for b in r.core.iterBlocks():
             self.assertIsNotNone(b.macros)
             self.assertTrue(isinstance(b.macros, XSCollection))
+
+
+class TestCompactPayloads(unittest.TestCase):
+    def test_payloadRoundTrip(self):
+        """Macros built from compact block payloads and packed into arrays match those built from the blocks."""
+        _o, r = loadTestReactor(TESTING_ROOT, inputFileName="reactors/smallestTestReactor/armiRunSmallest.yaml")
+        blocks = r.core.getBlocks()
+        lib = _getMockLib()
+        mc = MacroscopicCrossSectionCreator(buildScatterMatrix=True, minimumNuclideDensity=1e-15)
+        expected = mc.createMacrosForBlocks(lib, blocks)
+
+        # what the primary sends, and what a worker sends back
+        nucNames, payloads = packBlocks(blocks)
+        payloads = pickle.loads(pickle.dumps(payloads))
+        payloadBlocks = [PayloadBlock(nucNames, *payload) for payload in payloads]
+        packed = pickle.loads(pickle.dumps(packMacros(mc.createMacrosForBlocks(lib, payloadBlocks))))
+        macrosList = unpackMacros(packed)
+
+        self.assertEqual(len(macrosList), len(blocks))
+        for b, macros, expectedMacros in zip(blocks, macrosList, expected):
+            self.assertEqual(macros.source, str(b))
+            for xsName in ["fission", "nuSigF", "absorption", "removal", "transport", "chi"]:
+                np.testing.assert_allclose(macros[xsName], expectedMacros[xsName])
+            np.testing.assert_allclose(macros.totalScatter.toarray(), expectedMacros.totalScatter.toarray())
+
+
+class TestBroadcastLibrary(unittest.TestCase):
+    """Tests that the primary only sends a library to the workers when its content changes."""
+
+    def setUp(self):
+        macroXSGenerationInterface._libraryCache.clear()
+        macroXSGenerationInterface._lastHashed = (None, None, None)
+        self.comm = MagicMock()
+
+    def tearDown(self):
+        macroXSGenerationInterface._libraryCache.clear()
+        macroXSGenerationInterface._lastHashed = (None, None, None)
+
+    def _broadcast(self, lib):
+        """Broadcast a library from the primary, and return the hash and pickled library that were sent."""
+        with patch.object(context, "MPI_COMM", self.comm), patch.object(context, "MPI_RANK", 0):
+            self.assertIs(_broadcastLibrary(lib), lib)
+        return self.comm.bcast.call_args.args[0]
+
+    def test_sendOnlyChanges(self):
+        lib = isotxs.readBinary(ISOAA_PATH)
+        libHash, libBytes = self._broadcast(lib)
+        self.assertIsNotNone(libBytes)
+        self.assertEqual(pickle.loads(libBytes).nuclideLabels, lib.nuclideLabels)
+
+        # the same library is not sent again
+        self.assertEqual(self._broadcast(lib), (libHash, None))
+
+    def test_changedInPlace(self):
+        lib = isotxs.readBinary(ISOAA_PATH)
+        libHash, _libBytes = self._broadcast(lib)
+
+        removed = lib.nuclideLabels[-1]
+        del lib[removed]
+        newHash, newBytes = self._broadcast(lib)
+        self.assertNotEqual(newHash, libHash)
+        self.assertIsNotNone(newBytes)
+        self.assertNotIn(removed, pickle.loads(newBytes).nuclideLabels)
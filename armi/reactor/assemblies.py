@@ -36,6 +36,56 @@ from armi.reactor.parameters import ParamLocation
 from armi.reactor.spentFuelPool import SpentFuelPool
 
 
+def _getElevationIndexGeneration():
+    """Return the generations that an :py:class:`_ElevationIndex` is valid for."""
+    return composites.getTreeGeneration(), composites.getElevationGeneration()
+
+
+class _ElevationIndex:
+    """
+    The bottom and top elevations of the blocks of an assembly, in arrays that can be searched with ``np.searchsorted``.
+
+    ``bottoms`` and ``tops`` stack up the block heights from zero, as :py:meth:`Assembly.getAxialMesh` does, and
+    ``zbottoms`` and ``ztops`` are the ``zbottom`` and ``ztop`` parameters of the blocks. A pair is None if it cannot be
+    searched, because a block has no value or the values are not in order; queries then check each block instead.
+
+    The index is only valid for the tree and elevation generations it was built at; see
+    :py:func:`~armi.reactor.composites.markTreeChanged`, which is called whenever blocks are added, removed, or
+    reordered, and :py:func:`~armi.reactor.composites.markElevationsChanged`, which is called whenever the ``height``,
+    ``zbottom``, or ``ztop`` of any block is set.
+    """
+
+    def __init__(self, assem):
+        self.generation = _getElevationIndexGeneration()
+
+        heights = np.array([b.getHeight() for b in assem], dtype=float)
+        if np.isnan(heights).any() or (heights < 0.0).any():
+            self.bottoms = self.tops = None
+        else:
+            self.tops = np.cumsum(heights)
+            self.bottoms = np.concatenate(([0.0], self.tops))[:-1]
+
+        zbottoms = np.array([b.p.zbottom for b in assem], dtype=float)
+        ztops = np.array([b.p.ztop for b in assem], dtype=float)
+        if self._isSorted(zbottoms) and self._isSorted(ztops):
+            self.zbottoms, self.ztops = zbottoms, ztops
+        else:
+            self.zbottoms = self.ztops = None
+
+    @staticmethod
+    def _isSorted(values):
+        return not np.isnan(values).any() and bool((values[1:] >= values[:-1]).all())
+
+    def findBlockIndices(self, elevations):
+        """Return the index of the block at each elevation (as ``Assembly.getBlockAtElevation`` finds it), or -1."""
+        elevations = np.asarray(elevations, dtype=float)
+        # the first block with a top above the elevation, or within a relative 1e-10 of it...
+        first = np.searchsorted(self.tops, elevations * (1.0 - 1e-10), side="right")
+        # ...as long as its bottom is below the elevation
+        end = np.searchsorted(self.bottoms, elevations, side="left")
+        return np.where(first < end, first, -1)
+
+
 class Assembly(composites.Composite):
     """
     A single assembly in a reactor made up of blocks built from the bottom up.
@@ -74,6 +124,7 @@ class Assembly(composites.Composite):
         self.p.assemNum = assemNum
         self.setType(typ)
         self._current = 0  # for iterating
+        self._elevationIndex = None
         self.p.buLimit = self.getMaxParam("buLimit")
         self.lastLocationLabel = self.LOAD_QUEUE
         self.p.orientation = np.array((0.0, 0.0, 0.0))
@@ -400,6 +451,12 @@ class Assembly(composites.Composite):
         armi.reactor.reactors.Reactor.findAllAxialMeshPoints : gets a global list of all of these,
         plus finer res.
         """
+        index = self._getElevationIndex()
+        if not zeroAtFuel and index.tops is not None:
+            if centers:
+                return (index.bottoms + (index.tops - index.bottoms) / 2.0).tolist()
+            return index.tops.tolist()
+
         bottom = 0.0
         meshVals = []
         fuelIndex = None
@@ -913,7 +970,16 @@ class Assembly(composites.Composite):
         targetBlock : block or None
             The block that exists at the specified height in the reactor. ``None``
             if a block was not found.
+
+        See Also
+        --------
+        getBlocksAtElevations : the same, for many elevations at once
         """
+        index = self._getElevationIndex()
+        if index.tops is not None:
+            i = int(index.findBlockIndices(elevation))
+            return self[i] if i >= 0 else None
+
         bottomOfBlock = 0.0
         for b in self:
             topOfBlock = bottomOfBlock + b.getHeight()
@@ -924,6 +990,34 @@ class Assembly(composites.Composite):
             bottomOfBlock = topOfBlock
         return None
 
+    def getBlocksAtElevations(self, elevations) -> list[Optional[blocks.Block]]:
+        """
+        Returns the blocks at many axial elevations (given in cm).
+
+        Parameters
+        ----------
+        elevations : array of float
+            The elevations of interest (cm)
+
+        Returns
+        -------
+        list of block or None
+            The block at each elevation, as :py:meth:`getBlockAtElevation` would find it.
+        """
+        index = self._getElevationIndex()
+        if index.tops is None:
+            return [self.getBlockAtElevation(z) for z in elevations]
+
+        return [self[i] if i >= 0 else None for i in index.findBlockIndices(elevations).tolist()]
+
+    def _getElevationIndex(self) -> _ElevationIndex:
+        """Return the elevations of the blocks, finding them again if the blocks have changed since last time."""
+        index = self._elevationIndex
+        if index is None or index.generation != _getElevationIndexGeneration():
+            index = self._elevationIndex = _ElevationIndex(self)
+
+        return index
+
     def getBIndexFromZIndex(self, zIndex):
         """
         Returns the ARMI block axial index corresponding to a DIF3D node axial index.
@@ -979,8 +1073,17 @@ class Assembly(composites.Composite):
         [(Block1, 25.0), (Block2, 5.0)]
 
         """
+        index = self._getElevationIndex()
+        if index.ztops is not None:
+            # only the blocks with a top above zLower and a bottom below zUpper can overlap the window
+            start = int(np.searchsorted(index.ztops, zLower, side="left"))
+            end = int(np.searchsorted(index.zbottoms, zUpper, side="right"))
+            candidates = self[start:end]
+        else:
+            candidates = self
+
         blocksHere = []
-        for b in self:
+        for b in candidates:
             if b.p.ztop >= zLower and b.p.zbottom <= zUpper:
                 # at least some of this block overlaps the window of interest
                 top = min(b.p.ztop, zUpper)
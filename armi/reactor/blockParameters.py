@@ -16,13 +16,25 @@
 
 from armi import runLog
 from armi.physics.neutronics import crossSectionGroupManager
-from armi.reactor import parameters
+from armi.reactor import composites, parameters
 from armi.reactor.parameters import ParamLocation
 from armi.reactor.parameters.parameterDefinitions import isNumpyArray
 from armi.utils import units
 from armi.utils.units import ASCII_LETTER_A, ASCII_LETTER_Z, ASCII_LETTER_a
 
 
+def _axialBoundarySetter(paramName):
+    """Make a setter for a parameter that the elevations of the blocks in an assembly depend on."""
+    fieldName = "_p_" + paramName
+
+    def setter(self, value):
+        # so that assemblies find their block elevations again; see Assembly.getBlockAtElevation
+        composites.markElevationsChanged()
+        setattr(self, fieldName, value)
+
+    return setter
+
+
 def getBlockParameterDefinitions():
     pDefs = parameters.ParameterDefinitionCollection()
 
@@ -236,6 +248,7 @@ def getBlockParameterDefinitions():
             "zbottom",
             units=units.CM,
             description="Axial position of the bottom of this block",
+            setter=_axialBoundarySetter("zbottom"),
             categories=[parameters.Category.retainOnReplacement],
         )
 
@@ -243,6 +256,7 @@ def getBlockParameterDefinitions():
             "ztop",
             units=units.CM,
             description="Axial position of the top of this block",
+            setter=_axialBoundarySetter("ztop"),
             categories=[parameters.Category.retainOnReplacement],
         )
 
@@ -303,6 +317,7 @@ def getBlockParameterDefinitions():
             units=units.CM,
             description="the block height",
             default=None,
+            setter=_axialBoundarySetter("height"),
             categories=[parameters.Category.retainOnReplacement],
         )
 
@@ -152,8 +152,7 @@ class Block(composites.Composite):
     def core(self):
         from armi.reactor.reactors import Core
 
-        c = self.getAncestor(lambda c: isinstance(c, Core))
-        return c
+        return self.getAncestorOfClass(Core)
 
     def makeName(self, assemNum, axialIndex):
         """
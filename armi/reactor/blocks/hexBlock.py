@@ -269,7 +269,7 @@ class HexBlock(Block):
         rotationMatrix = np.array([[math.cos(radians), -math.sin(radians)], [math.sin(radians), math.cos(radians)]])
         for c in self:
             if isinstance(c.spatialLocator, grids.MultiIndexLocation):
-                newLocations = list(map(locationRotator, c.spatialLocator))
+                newLocations = self._rotateLocations(list(c.spatialLocator), rotNum)
                 c.spatialLocator = grids.MultiIndexLocation(self.spatialGrid)
                 c.spatialLocator.extend(newLocations)
             elif isinstance(c.spatialLocator, grids.CoordinateLocation):
@@ -284,6 +284,14 @@ class HexBlock(Block):
                 runLog.error(msg)
                 raise TypeError(msg)
 
+    def _rotateLocations(self, locations, rotNum: int):
+        """Rotate many index locations in the spatial grid at once."""
+        if not all(loc.grid is self.spatialGrid for loc in locations):
+            return [self.spatialGrid.rotateIndex(loc, rotations=rotNum) for loc in locations]
+
+        indices = self.spatialGrid.rotateIndexArray([(loc.i, loc.j, loc.k) for loc in locations], rotNum)
+        return [grids.IndexLocation(i, j, k, self.spatialGrid) for i, j, k in indices.tolist()]
+
     def _rotateBoundaryParameters(self, rotNum: int):
         """Rotate any parameters defined on the corners or edge of bounding hexagon.
 
@@ -64,6 +64,7 @@ The blueprints system was built to enable round trip translations between
 text representations of input and objects in the code.
 """
 
+import contextlib
 import copy
 import io
 import math
@@ -90,6 +91,7 @@ from armi.physics.neutronics.settings import CONF_LOADING_FILE
 from armi.reactor import assemblies
 from armi.reactor.blueprints import isotopicOptions
 from armi.reactor.blueprints.assemblyBlueprint import AssemblyKeyedList
+from armi.reactor.blueprints.assemblyTemplate import AssemblyTemplate
 from armi.reactor.blueprints.blockBlueprint import BlockKeyedList
 from armi.reactor.blueprints.componentBlueprint import (
     ComponentGroups,
@@ -204,6 +206,7 @@ class Blueprints(yamlize.Object, metaclass=_BlueprintsPluginCollector):
         self.assemblies = {}
         self._prepped = False
         self._assembliesBySpecifier = {}
+        self._assemblyTemplates = None
 
         # Better for performance since these are used for lookups
         self.allNuclidesInProblem = ordered_set.OrderedSet()
@@ -218,6 +221,7 @@ class Blueprints(yamlize.Object, metaclass=_BlueprintsPluginCollector):
         # of a Blueprints object and initializes it with valuesconstructAssemusing setattr.
         self._assembliesBySpecifier = {}
         self._prepped = False
+        self._assemblyTemplates = None
         self.systemDesigns = Systems()
         self.assemDesigns = AssemblyKeyedList()
         self.blockDesigns = BlockKeyedList()
@@ -252,9 +256,10 @@ class Blueprints(yamlize.Object, metaclass=_BlueprintsPluginCollector):
 
         Notes
         -----
-        There is some possibility for "compiling" the logic with closures to make constructing an
-        assembly / block / component faster. At this point is is pretty much irrelevant because we
-        are currently just deepcopying already constructed assemblies.
+        The new assembly is a copy of an already constructed assembly. Inside of
+        :py:meth:`useAssemblyTemplates` it is stamped out from an
+        :py:class:`~armi.reactor.blueprints.assemblyTemplate.AssemblyTemplate`, otherwise it is a
+        deepcopy.
 
         Currently, this method is backward compatible with other code in ARMI and generates the
         `.assemblies` attribute (the BOL assemblies). Eventually, this should be removed.
@@ -268,7 +273,13 @@ class Blueprints(yamlize.Object, metaclass=_BlueprintsPluginCollector):
         else:
             raise ValueError("Must supply assembly name or specifier to construct")
 
-        a = copy.deepcopy(assem)
+        if self._assemblyTemplates is None:
+            a = copy.deepcopy(assem)
+        else:
+            template = self._assemblyTemplates.get(id(assem))
+            if template is None:
+                template = self._assemblyTemplates[id(assem)] = AssemblyTemplate(assem)
+            a = template.construct()
         # since a deepcopy has the same assembly numbers and block id's, we need to make it unique
         a.makeUnique()
 
@@ -276,6 +287,27 @@ class Blueprints(yamlize.Object, metaclass=_BlueprintsPluginCollector):
             a.rotate(math.radians(orientation))
         return a
 
+    @contextlib.contextmanager
+    def useAssemblyTemplates(self):
+        """
+        Construct assemblies from templates of the BOL assemblies, rather than deepcopies of them.
+
+        Stamping an assembly out of a template is much faster than deep copying it, which matters
+        when filling a core with hundreds of assemblies. A template records its BOL assembly as it
+        is when the first copy is made, so the BOL assemblies must not be changed inside of this
+        context. The templates are discarded on exit.
+        """
+        if self._assemblyTemplates is not None:
+            # already in use by an outer context
+            yield
+            return
+
+        self._assemblyTemplates = {}
+        try:
+            yield
+        finally:
+            self._assemblyTemplates = None
+
     def _prepConstruction(self, cs):
         """
         Initialize a bunch of information within a Blueprints object such as assigning assembly and block type numbers,
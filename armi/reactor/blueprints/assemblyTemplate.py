@@ -0,0 +1,145 @@
+# Copyright 2026 TerraPower, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Templates that copies of the assemblies built from blueprints are stamped out from.
+
+Filling a core used to ``copy.deepcopy`` a pre-built assembly for every grid position. Deep copying walks the whole
+assembly (blocks, components, materials, parameter collections, grids) in pure Python, once per copy. An
+:py:class:`AssemblyTemplate` pickles the assembly once instead, and each copy is unpickled from those bytes, which
+rebuilds the same structure in C.
+
+A copy from a template is the same as a deep copy:
+
+* Every parameter collection is built straight from its values with a new serial number, as
+  ``ParameterCollection.__deepcopy__`` does, rather than being defaulted and then set through the parameter setters, as
+  unpickling normally does.
+* The objects a deep copy shares with the original are shared with the template's assembly too, instead of being
+  pickled: nuclide bases (which a deep copy looks up by name), the ``macros`` and lumped fission products of blocks
+  (see ``Block.__deepcopy__``), and the callable attributes of materials (see ``Material.__deepcopy__``).
+"""
+
+import copy
+import io
+import pickle
+
+from armi import runLog
+from armi.nucDirectory.nuclideBases import INuclide
+from armi.reactor.parameters.parameterCollections import ParameterCollection
+
+
+class AssemblyTemplate:
+    """
+    A pickled assembly that copies of it are made from.
+
+    The template records the assembly as it is when the template is made, so later changes to the assembly are not
+    seen by the copies.
+
+    Parameters
+    ----------
+    assem : Assembly
+        The assembly to make copies of.
+    """
+
+    def __init__(self, assem):
+        self.assem = assem
+        self._shared = _getSharedObjects(assem)
+        try:
+            self._data = _TemplatePickler.dumps(assem, self._shared)
+        except (pickle.PicklingError, TypeError, AttributeError) as ee:
+            runLog.debug(f"Copies of {assem} will be deep copies, since it could not be pickled: {ee}")
+            self._data = None
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} of {self.assem}>"
+
+    def construct(self):
+        """
+        Make a new copy of the assembly.
+
+        Returns
+        -------
+        Assembly
+            The same as ``copy.deepcopy(assem)``. It has the same assembly number and block names as the template's
+            assembly; see :py:meth:`Assembly.makeUnique <armi.reactor.assemblies.Assembly.makeUnique>`.
+        """
+        if self._data is None:
+            return copy.deepcopy(self.assem)
+
+        return _TemplateUnpickler(io.BytesIO(self._data), self._shared).load()
+
+
+def _getSharedObjects(assem):
+    """Return the objects in an assembly that a deep copy of it does not copy."""
+    shared = []
+    for b in assem:
+        shared.append(b.macros)
+        shared.append(b._lumpedFissionProducts)
+    for c in assem.iterComponents():
+        shared.extend(val for val in c.material.__dict__.values() if callable(val))
+
+    sharedIds = set()
+    uniqueShared = []
+    for obj in shared:
+        if obj is not None and id(obj) not in sharedIds:
+            sharedIds.add(id(obj))
+            uniqueShared.append(obj)
+
+    return uniqueShared
+
+
+def _newParameterCollection(armiObjectClass, state):
+    """Make a parameter collection with the given values and a new serial number, like a deep copy of one."""
+    return armiObjectClass.paramCollectionType(_state=state)
+
+
+class _TemplatePickler(pickle.Pickler):
+    """Pickle an assembly, leaving out the objects that copies of it share with it."""
+
+    def __init__(self, stream, shared):
+        pickle.Pickler.__init__(self, stream, protocol=pickle.HIGHEST_PROTOCOL)
+        self._shared = shared
+        self._sharedIndices = {id(obj): ii for ii, obj in enumerate(shared)}
+
+    @classmethod
+    def dumps(cls, obj, shared):
+        """Pickle an object, adding any nuclide bases it refers to to the shared objects."""
+        stream = io.BytesIO()
+        cls(stream, shared).dump(obj)
+        return stream.getvalue()
+
+    def persistent_id(self, obj):
+        index = self._sharedIndices.get(id(obj))
+        if index is None and isinstance(obj, INuclide):
+            index = self._sharedIndices[id(obj)] = len(self._shared)
+            self._shared.append(obj)
+
+        return index
+
+    def reducer_override(self, obj):
+        if isinstance(obj, ParameterCollection) and type(obj)._ArmiObject is not None:
+            return _newParameterCollection, (type(obj)._ArmiObject, obj.__getstate__())
+
+        return NotImplemented
+
+
+class _TemplateUnpickler(pickle.Unpickler):
+    """Unpickle an assembly pickled by :py:class:`_TemplatePickler`, reattaching the objects it shares."""
+
+    def __init__(self, stream, shared):
+        pickle.Unpickler.__init__(self, stream)
+        self._shared = shared
+
+    def persistent_load(self, pid):
+        return self._shared[pid]
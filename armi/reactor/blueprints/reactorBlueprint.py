@@ -195,29 +195,30 @@ class SystemBlueprint(yamlize.Object):
 
         runLog.header(f"=========== Adding Composites to {container} ===========")
         badLocations = set()
-        for locationInfo, aTypeID in gridContents.items():
-            # handle the hex-grid special case, where the user enters (ring, pos)
-            i, j = locationInfo
-            if isinstance(container, Core) and container.geomType == geometry.GeomType.HEX:
-                loc = container.spatialGrid.indicesToRingPos(i, j)
-            else:
-                loc = locationInfo
-
-            # correctly rotate the Composite
-            if orientationBOL is None or loc not in orientationBOL:
-                orientation = 0.0
-            else:
-                orientation = orientationBOL[loc]
-
-            # create a new Composite to add to the grid
-            newAssembly = bp.constructAssem(cs, specifier=aTypeID, orientation=orientation)
-
-            # add the Composite to the grid
-            posi = container.spatialGrid[i, j, 0]
-            try:
-                container.add(newAssembly, posi)
-            except LookupError:
-                badLocations.add(posi)
+        with bp.useAssemblyTemplates():
+            for locationInfo, aTypeID in gridContents.items():
+                # handle the hex-grid special case, where the user enters (ring, pos)
+                i, j = locationInfo
+                if isinstance(container, Core) and container.geomType == geometry.GeomType.HEX:
+                    loc = container.spatialGrid.indicesToRingPos(i, j)
+                else:
+                    loc = locationInfo
+
+                # correctly rotate the Composite
+                if orientationBOL is None or loc not in orientationBOL:
+                    orientation = 0.0
+                else:
+                    orientation = orientationBOL[loc]
+
+                # create a new Composite to add to the grid
+                newAssembly = bp.constructAssem(cs, specifier=aTypeID, orientation=orientation)
+
+                # add the Composite to the grid
+                posi = container.spatialGrid[i, j, 0]
+                try:
+                    container.add(newAssembly, posi)
+                except LookupError:
+                    badLocations.add(posi)
 
         if badLocations:
             raise ValueError(f"Attempted to add objects to non-existent locations on the grid: {badLocations}.")
@@ -18,6 +18,7 @@ import io
 import os
 import pathlib
 import shutil
+import timeit
 import unittest
 
 import yamlize
@@ -123,6 +124,50 @@ class TestBlueprints(unittest.TestCase):
         self.assertEqual(aDesign.name, "igniter fuel")
         self.assertEqual(aDesign.specifier, "IC")
 
+    def test_constructAssemFromTemplate(self):
+        copied = self.blueprints.constructAssem(self.cs, name="igniter fuel")
+        bolAssem = self.blueprints.assemblies["igniter fuel"]
+        with self.blueprints.useAssemblyTemplates():
+            a1 = self.blueprints.constructAssem(self.cs, name="igniter fuel")
+            a2 = self.blueprints.constructAssem(self.cs, specifier="IC")
+        self.assertIsNone(self.blueprints._assemblyTemplates)
+
+        self.assertEqual(len(self.blueprints.assemblies["igniter fuel"]), len(a1))
+        self.assertAlmostEqual(copied.getMass(), a1.getMass())
+        self.assertNotEqual(a1.p.assemNum, a2.p.assemNum)
+        self.assertNotEqual(a1.p.serialNum, a2.p.serialNum)
+        for bolBlock, b1, b2, bCopied in zip(bolAssem, a1, a2, copied):
+            self.assertIs(b1.parent, a1)
+            self.assertEqual(b1.getType(), bCopied.getType())
+            self.assertEqual(b1.getNumberDensities(), bCopied.getNumberDensities())
+            self.assertEqual(len({bolBlock.p.serialNum, b1.p.serialNum, b2.p.serialNum}), 3)
+            self.assertIs(b1.macros, bolBlock.macros)
+            for bolComp, c1, c2 in zip(bolBlock, b1, b2):
+                self.assertIs(c1.parent, b1)
+                self.assertIs(c1.material.parent, c1)
+                self.assertIsNot(c1.material, c2.material)
+                self.assertAlmostEqual(c1.getArea(), bolComp.getArea())
+
+    def test_constructAssemBenchmark(self):
+        """Compare the time to stamp assemblies out of a template with the time to deepcopy them."""
+        numAssems = 20
+        deepcopyTime = timeit.timeit(
+            lambda: self.blueprints.constructAssem(self.cs, name="igniter fuel"), number=numAssems
+        )
+        with self.blueprints.useAssemblyTemplates():
+            # the first assembly makes the template
+            self.blueprints.constructAssem(self.cs, name="igniter fuel")
+            templateTime = timeit.timeit(
+                lambda: self.blueprints.constructAssem(self.cs, name="igniter fuel"), number=numAssems
+            )
+
+        self.assertLess(
+            templateTime,
+            deepcopyTime,
+            msg=f"Constructing {numAssems} assemblies from a template took {templateTime:.3f} s, and by deepcopy "
+            f"{deepcopyTime:.3f} s.",
+        )
+
     def test_specialIsotopicVectors(self):
         mox = self.blueprints.customIsotopics["MOX"]
         allNucsInProblem = set(self.blueprints.allNuclidesInProblem)
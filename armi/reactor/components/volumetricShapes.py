@@ -66,7 +66,7 @@ class Sphere(ShapedComponent):
 
         if Tc is not None:
             raise NotImplementedError(f"Cannot calculate area at specified temperature: {Tc}")
-        block = self.getAncestor(lambda c: isinstance(c, Block))
+        block = self.getAncestorOfClass(Block)
         return self.getComponentVolume(cold) / block.getHeight()
 
     def getComponentVolume(self, cold=False):
@@ -54,7 +54,7 @@ from armi.nucDirectory import nucDir, nuclideBases
 from armi.physics.neutronics.fissionProductModel import fissionProductModel
 from armi.reactor import grids, parameters
 from armi.reactor.flags import Flags, TypeSpec
-from armi.reactor.parameters import resolveCollections
+from armi.reactor.parameters import parameterSync, resolveCollections
 from armi.utils import densityTools, tabulate, units
 from armi.utils.densityTools import calculateNumberDensity
 from armi.utils.flags import auto
@@ -190,6 +190,58 @@ class FlagSerializer(parameters.Serializer):
         return out
 
 
+# Incremented whenever any composite gains, loses, or reorders its children, or the flags of any object change. A
+# ``CompositeIndex`` (or the elevation index of an assembly) is only valid for the generation it was built at.
+_treeGeneration = 0
+
+
+def markTreeChanged():
+    """
+    Invalidate every :py:class:`CompositeIndex`, and the elevation indices of assemblies.
+
+    This is called by the methods of :py:class:`Composite` that change its children and when flags are set. Code that
+    changes the ``_children`` of a composite directly must call it too.
+    """
+    global _treeGeneration
+    _treeGeneration += 1
+
+
+def getTreeGeneration() -> int:
+    """Return a number that changes whenever :py:func:`markTreeChanged` is called."""
+    return _treeGeneration
+
+
+# Incremented whenever the height or axial bounds of any block change. The elevation index of an assembly is only valid
+# for the generation it was built at. This is kept apart from the tree generation so that setting block heights, which
+# happens often, does not invalidate every ``CompositeIndex``.
+_elevationGeneration = 0
+
+
+def markElevationsChanged():
+    """
+    Invalidate the elevation indices of assemblies.
+
+    This is called when the ``height``, ``zbottom``, or ``ztop`` of a block is set.
+    """
+    global _elevationGeneration
+    _elevationGeneration += 1
+
+
+def getElevationGeneration() -> int:
+    """Return a number that changes whenever :py:func:`markElevationsChanged` is called."""
+    return _elevationGeneration
+
+
+# Incremented whenever the parent of any object changes. The ancestors an object has cached (see
+# ``ArmiObject.getAncestorOfClass``) are only valid for the generation they were found at.
+_parentGeneration = 0
+
+
+def _setFlags(p, value):
+    markTreeChanged()
+    p._p_flags = value
+
+
 def _defineBaseParameters():
     """
     Return parameter definitions that all ArmiObjects must have to function properly.
@@ -226,7 +278,7 @@ def _defineBaseParameters():
             location=parameters.ParamLocation.AVERAGE,
             saveToDB=True,
             default=Flags(0),
-            setter=parameters.NoDefault,
+            setter=_setFlags,
             categories=set(),
             serializer=FlagSerializer,
         )
@@ -328,6 +380,8 @@ class ArmiObject(metaclass=CompositeModelType):
     def __init__(self, name):
         self.name = name
         self.parent = None
+        # (parent generation, d[class] = ancestor); see getAncestorOfClass
+        self._ancestorCache = None
         self.cached = {}
         self._backupCache = None
         self.p = self.paramCollectionType()
@@ -382,7 +436,8 @@ class ArmiObject(metaclass=CompositeModelType):
         needs to be reassigned in ``__setstate__``.
         """
         state = self.__dict__.copy()
-        state["parent"] = None
+        state["_parent"] = None
+        state["_ancestorCache"] = None
 
         if "r" in state:
             raise RuntimeError("An ArmiObject should never contain the entire Reactor.")
@@ -413,6 +468,17 @@ class ArmiObject(metaclass=CompositeModelType):
         for c in self:
             c.parent = self
 
+    @property
+    def parent(self) -> Optional["Composite"]:
+        """The composite this object is a child of, if any."""
+        return self._parent
+
+    @parent.setter
+    def parent(self, parent: Optional["Composite"]):
+        global _parentGeneration
+        _parentGeneration += 1
+        self._parent = parent
+
     def __repr__(self):
         return f"<{self.__class__.__name__}: {self.name}>"
 
@@ -441,7 +507,7 @@ class ArmiObject(metaclass=CompositeModelType):
     def nuclideBases(self):
         from armi.reactor.reactors import Reactor
 
-        r = self.getAncestor(lambda c: isinstance(c, Reactor))
+        r = self.getAncestorOfClass(Reactor)
         if r:
             return r.nuclideBases
         else:
@@ -1349,6 +1415,35 @@ class ArmiObject(metaclass=CompositeModelType):
         else:
             return self.parent.getAncestor(fn)
 
+    def getAncestorOfClass(self, cls: Type["ArmiObject"]) -> Optional["ArmiObject"]:
+        """
+        Return the first ancestor that is an instance of a class, such as the assembly, core, or reactor of an object.
+
+        This is the same as ``getAncestor(lambda c: isinstance(c, cls))``, but each object remembers its ancestors
+        until the parent of any object changes, so repeated lookups are O(1).
+
+        Parameters
+        ----------
+        cls : type
+            The class of the ancestor. This object itself is returned if it is an instance of it.
+        """
+        cache = self._ancestorCache
+        if cache is None or cache[0] != _parentGeneration:
+            cache = self._ancestorCache = (_parentGeneration, {})
+
+        ancestors = cache[1]
+        try:
+            return ancestors[cls]
+        except KeyError:
+            if isinstance(self, cls):
+                ancestor = self
+            elif self.parent is None:
+                ancestor = None
+            else:
+                ancestor = self.parent.getAncestorOfClass(cls)
+            ancestors[cls] = ancestor
+            return ancestor
+
     def getAncestorAndDistance(self, fn, _distance=0) -> Optional[Tuple["ArmiObject", int]]:
         """
         Return the first ancestor that satisfies the supplied predicate, along with how
@@ -1638,6 +1733,12 @@ class ArmiObject(metaclass=CompositeModelType):
         else:
             coreMult = 1.0
 
+        if not (volumeIntegrated or calcBasedOnFullObj):
+            objs = [a for a in objs if a.hasFlags(typeSpec)]
+            values = parameters.getColumnValues([a.p for a in objs], param)
+            if values is not None:
+                return float(values.sum()) * coreMult
+
         for a in objs:
             if not a.hasFlags(typeSpec):
                 continue
@@ -1832,6 +1933,9 @@ class ArmiObject(metaclass=CompositeModelType):
 
     def getChildParamValues(self, param):
         """Get the child parameter values in a numpy array."""
+        values = parameters.getColumnValues([child.p for child in self], param)
+        if values is not None:
+            return values
         return np.array([child.p[param] for child in self])
 
     def isFuel(self):
@@ -2436,6 +2540,7 @@ class Composite(ArmiObject):
         """Sort the children of this object."""
         # sort the top-level children of this Composite
         self._children.sort()
+        markTreeChanged()
 
         # recursively sort the children below it.
         for c in self._children:
@@ -2449,6 +2554,7 @@ class Composite(ArmiObject):
     def append(self, obj):
         """Append a child to this object."""
         self._children.append(obj)
+        markTreeChanged()
 
     def extend(self, seq):
         """Add a list of children to this object."""
@@ -2461,12 +2567,14 @@ class Composite(ArmiObject):
             raise RuntimeError(f"Cannot add {obj} because it has already been added to {self}.")
         obj.parent = self
         self._children.append(obj)
+        markTreeChanged()
 
     def remove(self, obj):
         """Remove a particular child."""
         obj.parent = None
         obj.spatialLocator = obj.spatialLocator.detachedCopy()
         self._children.remove(obj)
+        markTreeChanged()
 
     def moveTo(self, locator):
         """Move to specific location in parent. Often in a grid."""
@@ -2483,6 +2591,7 @@ class Composite(ArmiObject):
             raise RuntimeError(f"Cannot insert {obj} because it has already been added to {self}.")
         obj.parent = self
         self._children.insert(index, obj)
+        markTreeChanged()
 
     def removeAll(self):
         """Remove all children."""
@@ -2751,17 +2860,17 @@ class Composite(ArmiObject):
             self.iterChildrenWithMaterials(deep=True),
         )
         allComps = [c for c in genItems if hasattr(c, "p")]
-        sendBuf = [c.p.getSyncData() for c in allComps]
         runLog.debug(f"syncMpiState has {len(allComps)} comps")
 
         try:
             context.MPI_COMM.barrier()  # sync up
             allGatherTime = -timeit.default_timer()
-            allSyncData = context.MPI_COMM.allgather(sendBuf)
+            allSyncData, bytesPerRank = parameterSync.allgatherSyncData(context.MPI_COMM, [c.p for c in allComps])
             allGatherTime += timeit.default_timer()
         except:
             msg = ["Failure while trying to allgather."]
-            for ci, compData in enumerate(sendBuf):
+            for ci, comp in enumerate(allComps):
+                compData = comp.p.getSyncData()
                 if compData is not None:
                     msg += [f"sendBuf[{ci}]: {compData}"]
             runLog.error("\n".join(msg))
@@ -2805,6 +2914,7 @@ class Composite(ArmiObject):
         runLog.extra(
             f"Synchronized reactor over MPI in {timeit.default_timer() - startTime:.4f} seconds"
             f", {allGatherTime:.4f} seconds in MPI allgather. count:{syncCount}"
+            f", bytes sent per rank (max/total): {max(bytesPerRank)}/{sum(bytesPerRank)}"
         )
 
         return syncCount
@@ -3006,8 +3116,8 @@ class Composite(ArmiObject):
         try:
             return self._getReactionRateDict(
                 nucName,
-                self.getAncestor(lambda c: isinstance(c, Core)).lib,
-                self.getAncestor(lambda x: isinstance(x, Block)).getMicroSuffix(),
+                self.getAncestorOfClass(Core).lib,
+                self.getAncestorOfClass(Block).getMicroSuffix(),
                 self.getIntegratedMgFlux(),
                 nDensity,
             )
@@ -3194,6 +3304,83 @@ class StateRetainer:
             func(paramDef)
 
 
+class CompositeIndex:
+    """
+    The results of flag queries over a set of descendants of a composite, kept until the composite tree changes.
+
+    Filtering the descendants of a composite by their flags walks the whole tree and checks the flags of every object,
+    on every query, even though the same few queries (e.g. all of the fuel blocks in the core) are made over and over
+    between changes to the tree. An index gathers the descendants once, and keeps the result of each query, so that
+    asking again only costs a copy of the result. Anything that adds, removes, or reorders children anywhere, or sets
+    any flags, calls :py:func:`markTreeChanged`, after which the index is rebuilt the next time it is used.
+
+    Parameters
+    ----------
+    iterDescendants : callable
+        Returns an iterator over the indexed descendants, in the order queries should return them.
+    getSignature : callable, optional
+        Returns a sequence of objects that the order of the descendants also depends on, and that can change without
+        the tree changing (e.g. the spatial locators of assemblies, if they are sorted by location). The index is
+        rebuilt whenever any of them is replaced by a different object.
+    """
+
+    # queries are only ever for a handful of type specs, so this is only a guard against unbounded growth
+    _MAX_QUERIES = 64
+
+    def __init__(self, iterDescendants: Callable[[], Iterator[ArmiObject]], getSignature=None):
+        self._iterDescendants = iterDescendants
+        self._getSignature = getSignature
+        self._generation = None
+        self._signature = ()
+        self._descendants = []
+        self._queries = {}
+
+    def _update(self):
+        signature = () if self._getSignature is None else tuple(self._getSignature())
+        if (
+            self._generation == _treeGeneration
+            and len(signature) == len(self._signature)
+            and all(map(operator.is_, signature, self._signature))
+        ):
+            return
+
+        self._descendants = list(self._iterDescendants())
+        self._queries = {}
+        self._generation = _treeGeneration
+        self._signature = signature
+
+    def get(self, typeSpec: TypeSpec = None, exact=False) -> list[ArmiObject]:
+        """
+        Return the indexed descendants with the given flags.
+
+        Parameters
+        ----------
+        typeSpec : TypeSpec, optional
+            The flags to filter by, as in :py:meth:`ArmiObject.hasFlags`.
+        exact : bool, optional
+            Whether the flags must match exactly, as in :py:meth:`ArmiObject.hasFlags`.
+
+        Returns
+        -------
+        list of ArmiObject
+            A new list of the matching descendants, in the order of the descendants.
+        """
+        self._update()
+        if not typeSpec:
+            return [] if exact else list(self._descendants)
+
+        if not isinstance(typeSpec, (Flags, str)):
+            typeSpec = tuple(typeSpec)
+        key = (typeSpec, exact)
+        matches = self._queries.get(key)
+        if matches is None:
+            if len(self._queries) >= self._MAX_QUERIES:
+                self._queries.clear()
+            matches = self._queries[key] = [d for d in self._descendants if d.hasFlags(typeSpec, exact)]
+
+        return list(matches)
+
+
 def gatherMaterialsByVolume(objects: List[ArmiObject], typeSpec: TypeSpec = None, exact=False):
     """
     Compute the total volume of each material in a set of objects and give samples.
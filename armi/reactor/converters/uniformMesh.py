@@ -61,7 +61,7 @@ from timeit import default_timer as timer
 import numpy as np
 
 from armi import runLog
-from armi.physics.neutronics.globalFlux import RX_ABS_MICRO_LABELS, RX_PARAM_NAMES
+from armi.physics.neutronics.globalFlux import RX_PARAM_NAMES, reactionRates
 from armi.reactor import grids, parameters
 from armi.reactor.converters.geometryConverters import GeometryConverter
 from armi.reactor.flags import Flags
@@ -868,7 +868,7 @@ class UniformMeshGeometryConverter(GeometryConverter):
                     "was provided to setAssemblyStateFromOverlaps(). Reaction rates calculated "
                     "will reflect the intended result without new parameter values being mapped in."
                 )
-            core = sourceAssembly.getAncestor(lambda c: isinstance(c, Core))
+            core = sourceAssembly.getAncestorOfClass(Core)
             if core is not None:
                 UniformMeshGeometryConverter._calculateReactionRates(
                     lib=core.lib, keff=core.p.keff, assem=destinationAssembly
@@ -1069,6 +1069,7 @@ class UniformMeshGeometryConverter(GeometryConverter):
         """
         from armi.physics.neutronics.globalFlux import globalFluxInterface
 
+        blocks = []
         for b in assem:
             # Checks if the block has a multi-group flux defined and if it
             # does not then this will skip the reaction rate calculation. This
@@ -1078,7 +1079,9 @@ class UniformMeshGeometryConverter(GeometryConverter):
                 b.getMgFlux()
             except TypeError:
                 continue
-            globalFluxInterface.calcReactionRates(b, keff, lib)
+            blocks.append(b)
+
+        globalFluxInterface.calcReactionRatesForBlocks(blocks, keff, lib)
 
     @staticmethod
     def _calcReactionRatesBlockList(objList, keff, xsNucDict):
@@ -1114,40 +1117,17 @@ class UniformMeshGeometryConverter(GeometryConverter):
             from the cross section library, which contain the microscopic cross section
             data for a given nuclide in the current cross section group.
         """
+        objsWithFlux = []
         for obj in objList:
-            rate = collections.defaultdict(float)
-
-            numberDensities = obj.getNumberDensities()
             try:
-                mgFlux = np.array(obj.getMgFlux())
+                obj.getMgFlux()
             except TypeError:
                 continue
+            objsWithFlux.append(obj)
 
-            for nucName, numberDensity in numberDensities.items():
-                if numberDensity == 0.0:
-                    continue
-                nucRate = collections.defaultdict(float)
-
-                micros = xsNucDict[nucName].micros
-
-                # absorption is fission + capture (no n2n here)
-                for name in RX_ABS_MICRO_LABELS:
-                    volumetricRR = numberDensity * mgFlux.dot(micros[name])
-                    nucRate["rateAbs"] += volumetricRR
-                    if name != "fission":
-                        nucRate["rateCap"] += volumetricRR
-                    else:
-                        nucRate["rateFis"] += volumetricRR
-                        # scale nu by keff.
-                        nusigmaF = micros["fission"] * micros.neutronsPerFission
-                        nucRate["rateProdFis"] += numberDensity * mgFlux.dot(nusigmaF) / keff
-
-                nucRate["rateProdN2n"] += 2.0 * numberDensity * mgFlux.dot(micros.n2n)
-
-                for rx in RX_PARAM_NAMES:
-                    if nucRate[rx]:
-                        rate[rx] += nucRate[rx]
-
+        rates = reactionRates.computeReactionRates(objsWithFlux, keff, xsNucDict.__getitem__)
+        for obj, objRates in zip(objsWithFlux, rates):
+            rate = dict(zip(RX_PARAM_NAMES, objRates.tolist()))
             for paramName in RX_PARAM_NAMES:
                 obj.p[paramName] = rate[paramName]  # put in #/cm^3/s
 
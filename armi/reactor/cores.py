@@ -24,13 +24,14 @@ import copy
 import itertools
 import os
 import time
-from typing import Callable, Iterator, Optional
+from typing import TYPE_CHECKING, Callable, Iterator, Optional
 
 import numpy as np
 from ruamel.yaml import YAML
 
 from armi import getPluginManagerOrFail, nuclearDataIO, runLog
 from armi.nuclearDataIO import xsLibraries
+from armi.nuclearDataIO.xsLibraryCache import XSLibraryCache
 from armi.reactor import (
     assemblies,
     blocks,
@@ -52,6 +53,8 @@ from armi.settings.fwSettings.globalSettings import (
     CONF_NON_UNIFORM_ASSEM_FLAGS,
     CONF_STATIONARY_BLOCK_FLAGS,
     CONF_TRACK_ASSEMS,
+    CONF_XS_LIBRARY_CACHE_LOCATION,
+    CONF_XS_LIBRARY_CACHE_MAX_SIZE,
     CONF_ZONE_DEFINITIONS,
     CONF_ZONES_FILE,
 )
@@ -59,6 +62,86 @@ from armi.utils import createFormattedStrWithDelimiter, tabulate, units
 from armi.utils.iterables import Sequence
 from armi.utils.mathematics import average1DWithinTolerance
 
+if TYPE_CHECKING:
+    from armi.reactor.components.component import Component
+
+
+class _NeighborTable:
+    """
+    The neighboring locations of a set of locations in a core grid, as CSR-style integer arrays.
+
+    Every location the table knows of is a slot, ``locations[slot]``. The neighbors of the location with indices
+    ``ijk``, in the order of :py:meth:`getNeighboringCellIndices
+    <armi.reactor.grids.StructuredGrid.getNeighboringCellIndices>`, are the slots
+    ``neighbors[offsets[row]:offsets[row + 1]]`` where ``row = rows[ijk]``. For a 1/3 core with periodic boundaries,
+    row ``slot`` of ``equivalents`` holds the slots of the symmetric equivalents of each slot, padded with -1.
+
+    The table only depends on the grid and its symmetry, not on which assemblies are where, so moving assemblies
+    around does not change it. It is rebuilt by :py:meth:`Core._getNeighborTable` when the grid or its symmetry
+    change, or when the neighbors of a location it has no row for are needed.
+
+    Parameters
+    ----------
+    grid : Grid
+        The spatial grid of the core.
+    indices : iterable of tuple
+        The (i, j, k) indices of the locations to find the neighbors of.
+    """
+
+    def __init__(self, grid, indices):
+        self.grid = grid
+        self.symmetry = grid.symmetry
+        self.locations = []
+        self.rows = {}
+        slots = {}
+
+        def getSlot(ijk):
+            slot = slots.get(ijk)
+            if slot is None:
+                slot = slots[ijk] = len(self.locations)
+                self.locations.append(grid[ijk])
+            return slot
+
+        offsets = [0]
+        neighbors = []
+        for ijk in indices:
+            if ijk in self.rows:
+                continue
+            self.rows[ijk] = len(offsets) - 1
+            getSlot(ijk)
+            neighbors.extend(getSlot(ijkN) for ijkN in grid.getNeighboringCellIndices(*ijk))
+            offsets.append(len(neighbors))
+
+        self.offsets = np.array(offsets, dtype=int)
+        self.neighbors = np.array(neighbors, dtype=int)
+
+        self.hasEquivalents = (
+            self.symmetry.domain == geometry.DomainType.THIRD_CORE
+            and self.symmetry.boundary == geometry.BoundaryType.PERIODIC
+        )
+        equivalents = []
+        if self.hasEquivalents:
+            # only the neighbors are ever replaced by their equivalents, and the equivalents are in the k=0 plane
+            for slot in range(len(self.locations)):
+                equivalents.append([getSlot((i, j, 0)) for i, j in grid.getSymmetricEquivalents(self.locations[slot])])
+        width = max((len(slotEquivalents) for slotEquivalents in equivalents), default=0)
+        self.equivalents = np.full((len(self.locations), width), -1, dtype=int)
+        for slot, slotEquivalents in enumerate(equivalents):
+            self.equivalents[slot, : len(slotEquivalents)] = slotEquivalents
+
+    def isValidFor(self, grid) -> bool:
+        """Whether the table was built for this grid, with its current symmetry."""
+        return grid is self.grid and grid.symmetry == self.symmetry
+
+    def getNeighborSlots(self, ijk):
+        """Return the slots of the neighbors of the location with the given indices."""
+        row = self.rows[ijk]
+        return self.neighbors[self.offsets[row] : self.offsets[row + 1]]
+
+    def getEquivalentLocations(self, slot):
+        """Return the locations of the symmetric equivalents of a slot."""
+        return [self.locations[equivalent] for equivalent in self.equivalents[slot] if equivalent >= 0]
+
 
 class Core(composites.Composite):
     """
@@ -95,6 +178,7 @@ class Core(composites.Composite):
         self.xsIndex = {}
         self.p.numMoves = 0
         self._lib = None  # placeholder for ISOTXS object
+        self._xsLibraryCache = None
         self.locParams = {}  # location-based parameters
         # overridden in case.py to include pre-reactor time.
         self.timeOfStart = time.time()
@@ -113,6 +197,10 @@ class Core(composites.Composite):
         self._minMeshSizeRatio = 0.15
         self._detailedAxialExpansion = False
 
+        # whether flag queries over the core are answered from cached results; see _buildIndices
+        self.useCompositeIndex = True
+        self._buildIndices()
+
     def setOptionsFromCs(self, cs):
         from armi.physics.fuelCycle.settings import (
             CONF_CIRCULAR_RING_MODE,
@@ -127,16 +215,47 @@ class Core(composites.Composite):
         self._circularRingPitch = cs[CONF_CIRCULAR_RING_PITCH]
         self._minMeshSizeRatio = cs[CONF_MIN_MESH_SIZE_RATIO]
         self._detailedAxialExpansion = cs[CONF_DETAILED_AXIAL_EXPANSION]
+        if cs[CONF_XS_LIBRARY_CACHE_LOCATION]:
+            self._xsLibraryCache = XSLibraryCache(
+                cs[CONF_XS_LIBRARY_CACHE_LOCATION], maxSizeMB=cs[CONF_XS_LIBRARY_CACHE_MAX_SIZE]
+            )
 
     def __getstate__(self):
         """Applies a settings and parent to the core and components."""
         state = composites.Composite.__getstate__(self)
+        for name in self._INDEX_NAMES:
+            state.pop(name, None)
         return state
 
     def __setstate__(self, state):
         composites.Composite.__setstate__(self, state)
+        self._buildIndices()
         self.regenAssemblyLists()
 
+    _INDEX_NAMES = ("_assemblyIndex", "_blockIndex", "_sortedBlockIndex", "_componentIndex", "_neighborTable")
+
+    def _buildIndices(self):
+        """
+        Make the indices that flag queries over the assemblies, blocks, and components of the core are answered from.
+
+        Each index caches the results of queries until the composite tree changes; see
+        :py:class:`~armi.reactor.composites.CompositeIndex`. The blocks are indexed twice: in the order of the
+        assemblies in the core, for :py:meth:`iterBlocks`, and in the order of the sorted assemblies, for
+        :py:meth:`getBlocks`. Since the latter depends on the locations of the assemblies, it is also rebuilt when any
+        assembly is moved.
+
+        The table of the neighbors of each location, which :py:meth:`findNeighbors` uses, is built when it is first
+        needed; see :py:meth:`_getNeighborTable`.
+        """
+        self._assemblyIndex = composites.CompositeIndex(self.__iter__)
+        self._blockIndex = composites.CompositeIndex(lambda: (b for a in self for b in a))
+        self._sortedBlockIndex = composites.CompositeIndex(
+            lambda: (b for a in sorted(self) for b in a),
+            getSignature=lambda: (a.spatialLocator for a in self),
+        )
+        self._componentIndex = composites.CompositeIndex(lambda: (c for a in self for c in a.iterComponents()))
+        self._neighborTable = None
+
     def __deepcopy__(self, memo):
         memo[id(self)] = newC = self.__class__.__new__(self.__class__)
         newC.__setstate__(copy.deepcopy(self.__getstate__(), memo))
@@ -219,6 +338,8 @@ class Core(composites.Composite):
         - Otherwise, an ``ISOTXS`` file will be searched for in the working directory, opened as ``ISOTXS`` object and
           returned. If possible, it will find the correct file for the current cycle and timeNode.
         - Finally, if no ``ISOTXS`` file exists in the working directory, a None value will be returned.
+
+        Files are read through the cross section library cache if the ``xsLibraryCacheLocation`` setting is set.
         """
         # determine the current cycle and timeNode
         cycle = None
@@ -232,13 +353,13 @@ class Core(composites.Composite):
         if self._lib is None and os.path.exists(isotxsFileName):
             # try to find the file for this specific cycle/node
             runLog.info(f"Loading microscopic cross section library `{isotxsFileName}` at {cycle}/{node}")
-            self._lib = nuclearDataIO.isotxs.readBinary(isotxsFileName)
+            self._lib = self._readLib(isotxsFileName)
         elif self._lib is None:
             # try to find any local file, not labeled by cycle/node
             isotxsFileName = nuclearDataIO.getExpectedISOTXSFileName()
             if os.path.exists(isotxsFileName):
                 runLog.info(f"Loading microscopic cross section library `{isotxsFileName}`")
-                self._lib = nuclearDataIO.isotxs.readBinary(isotxsFileName)
+                self._lib = self._readLib(isotxsFileName)
 
         return self._lib
 
@@ -248,6 +369,12 @@ class Core(composites.Composite):
         runLog.extra(f"Updating cross section library on {self}.\nInitial: {self._lib}\nUpdated: {value}.")
         self._lib = value
 
+    def _readLib(self, isotxsFileName):
+        if self._xsLibraryCache is None:
+            return nuclearDataIO.isotxs.readBinary(isotxsFileName)
+
+        return self._xsLibraryCache.readBinary(isotxsFileName)
+
     def hasLib(self):
         """Check if the microscopic cross section library is set.
 
@@ -289,6 +416,7 @@ class Core(composites.Composite):
         """Sorts the reactor assemblies by ring and position."""
         sortKey = lambda a: a.spatialLocator.getRingPos()
         self._children = sorted(self._children, key=sortKey)
+        composites.markTreeChanged()
 
     def summarizeReactorStats(self):
         """Writes a summary of the reactor to check the mass and volume of all of the blocks."""
@@ -811,6 +939,13 @@ class Core(composites.Composite):
         # filter based on geomType
         if self.geomType == geometry.GeomType.CARTESIAN:  # a ring in cartesian is basically a square.
             assems.select(lambda a: any(xy == ring for xy in abs(a.spatialLocator.indices[:2])))
+        elif self.geomType == geometry.GeomType.HEX:
+            candidates = list(assems)
+            if candidates:
+                indices = np.array([a.spatialLocator.getCompleteIndices() for a in candidates])
+                rings, _positions = self.spatialGrid.indicesToRingPosArray(indices[:, 0], indices[:, 1])
+                candidates = [a for a, inRing in zip(candidates, (rings == ring).tolist()) if inRing]
+            assems = Sequence(candidates)
         else:
             assems.select(lambda a: (a.spatialLocator.getRingPos()[0] == ring))
 
@@ -889,8 +1024,14 @@ class Core(composites.Composite):
 
         circularRingDict = collections.defaultdict(set)
 
-        for a in self:
-            dist = a.spatialLocator.distanceTo(refLocation)
+        assems = list(self)
+        if not assems:
+            return circularRingDict
+
+        # the assemblies and the reference are all in the core grid, so their distance is that of their coordinates
+        coords = self.spatialGrid.getCoordinates(np.array([a.spatialLocator.indices for a in assems]))
+        distances = np.linalg.norm(coords - self.spatialGrid.getCoordinates(refLocation.indices), axis=1)
+        for a, dist in zip(assems, distances.tolist()):
             # To reduce numerical sensitivity, round distance to 6 decimal places
             # before truncating.
             index = int(round(dist * pitchFactor, 6)) or 1  # 1 is the smallest ring.
@@ -1099,6 +1240,9 @@ class Core(composites.Composite):
         * :meth:`iterBlocks`: iterator over blocks with limited filtering.
         * :meth:`getAssemblies` : locates the assemblies in the search
         """
+        if not kwargs and self.useCompositeIndex:
+            return self._sortedBlockIndex.get(bType)
+
         blocks = [b for a in self.getAssemblies(**kwargs) for b in a]
         if bType:
             blocks = [b for b in blocks if b.hasFlags(bType)]
@@ -1589,30 +1733,25 @@ class Core(composites.Composite):
         --------
         grids.Grid.getSymmetricEquivalents
         """
-        neighborIndices = self.spatialGrid.getNeighboringCellIndices(*a.spatialLocator.getCompleteIndices())
-
-        dupReflectors = (
-            self.symmetry.domain == geometry.DomainType.THIRD_CORE
-            and self.symmetry.boundary == geometry.BoundaryType.PERIODIC
-            and duplicateAssembliesOnReflectiveBoundary
-        )
+        ijk = a.spatialLocator.getCompleteIndices()
+        table = self._getNeighborTable([ijk])
+        dupReflectors = table.hasEquivalents and duplicateAssembliesOnReflectiveBoundary
 
         neighbors = []
-        for iN, jN, kN in neighborIndices:
-            neighborLoc = self.spatialGrid[iN, jN, kN]
-            neighbor = self.childrenByLocator.get(neighborLoc)
+        for slot in table.getNeighborSlots(ijk):
+            neighbor = self.childrenByLocator.get(table.locations[slot])
             if neighbor is not None:
                 neighbors.append(neighbor)
             elif showBlanks:
                 if dupReflectors:
-                    symmetricAssem = self._getReflectiveDuplicateAssembly(neighborLoc)
+                    symmetricAssem = self._getReflectiveDuplicateAssembly(table.getEquivalentLocations(slot))
                     neighbors.append(symmetricAssem)
                 else:
                     neighbors.append(None)
 
         return neighbors
 
-    def _getReflectiveDuplicateAssembly(self, neighborLoc):
+    def _getReflectiveDuplicateAssembly(self, symmetricLocations):
         """
         Return duplicate assemblies across symmetry line.
 
@@ -1622,9 +1761,7 @@ class Core(composites.Composite):
         If an existing symmetric identical has NOT been found, return a None (it's empty).
         """
         duplicates = []
-        otherTwoLocations = self.spatialGrid.getSymmetricEquivalents(neighborLoc)
-        for i, j in otherTwoLocations:
-            neighborLocation2 = self.spatialGrid[i, j, 0]
+        for neighborLocation2 in symmetricLocations:
             duplicateAssem = self.childrenByLocator.get(neighborLocation2)
             if duplicateAssem is not None:
                 duplicates.append(duplicateAssem)
@@ -1637,6 +1774,132 @@ class Core(composites.Composite):
             raise ValueError("Too many neighbors found!")
         return None
 
+    def _getNeighborTable(self, indices) -> _NeighborTable:
+        """
+        Return the table of neighboring locations, rebuilding it if it cannot give the neighbors of these locations.
+
+        The table is rebuilt when the grid or its symmetry has changed (e.g. by :py:meth:`growToFullCore`), or when
+        any of the locations is new to it (e.g. an assembly was added or moved to a location that was empty). The new
+        table has rows for all the locations of the old one, all the assemblies in the core, and the given locations.
+
+        Parameters
+        ----------
+        indices : list of tuple
+            The (i, j, k) indices of the locations whose neighbors are needed.
+        """
+        table = self._neighborTable
+        if table is not None and table.isValidFor(self.spatialGrid) and all(ijk in table.rows for ijk in indices):
+            return table
+
+        allIndices = list(table.rows) if table is not None and table.isValidFor(self.spatialGrid) else []
+        allIndices.extend(a.spatialLocator.getCompleteIndices() for a in self)
+        allIndices.extend(indices)
+        self._neighborTable = _NeighborTable(self.spatialGrid, allIndices)
+        return self._neighborTable
+
+    def _getNeighborAssemblyIndices(self, duplicateAssembliesOnReflectiveBoundary=False):
+        """
+        Return the neighbors of all the assemblies in the core, as indices into ``list(self)``.
+
+        These are the neighbors that :py:meth:`findNeighbors` returns with ``showBlanks=True``, without the ``None`` of
+        the empty locations. Without ``duplicateAssembliesOnReflectiveBoundary`` that is the same as
+        ``showBlanks=False``; with it, an empty location across the periodic boundaries of a 1/3 core is filled with
+        its symmetric identical, as :py:meth:`findNeighbors` only does when it shows blanks.
+
+        Returns
+        -------
+        owners : np.ndarray
+            The index of the assembly each neighbor is a neighbor of, in ascending order.
+        neighbors : np.ndarray
+            The index of each neighbor, in the order of :py:meth:`findNeighbors` for each assembly.
+        """
+        assems = list(self)
+        indices = [a.spatialLocator.getCompleteIndices() for a in assems]
+        table = self._getNeighborTable(indices)
+
+        # the assembly in each slot, or -1 if it is empty
+        occupants = np.full(len(table.locations), -1, dtype=int)
+        assemIndices = {id(a): ii for ii, a in enumerate(assems)}
+        for slot, loc in enumerate(table.locations):
+            a = self.childrenByLocator.get(loc)
+            if a is not None:
+                occupants[slot] = assemIndices.get(id(a), -1)
+
+        rows = np.array([table.rows[ijk] for ijk in indices], dtype=int)
+        starts = table.offsets[rows]
+        counts = table.offsets[rows + 1] - starts
+        owners = np.repeat(np.arange(len(assems)), counts)
+        # the position of each neighbor in table.neighbors, gathering the rows of the assemblies one after another
+        entries = np.arange(counts.sum()) + np.repeat(starts - (np.cumsum(counts) - counts), counts)
+        neighborSlots = table.neighbors[entries]
+        neighbors = occupants[neighborSlots]
+
+        if table.hasEquivalents and duplicateAssembliesOnReflectiveBoundary and table.equivalents.shape[1]:
+            # fill the blanks with their symmetric identicals, as findNeighbors does with showBlanks
+            blanks = np.flatnonzero(neighbors < 0)
+            equivalentSlots = table.equivalents[neighborSlots[blanks]]
+            duplicates = np.where(equivalentSlots >= 0, occupants[equivalentSlots], -1)
+            if ((duplicates >= 0).sum(axis=1) > 1).any():
+                raise ValueError("Too many neighbors found!")
+            neighbors[blanks] = duplicates.max(axis=1)
+
+        found = neighbors >= 0
+        return owners[found], neighbors[found]
+
+    def calcNeighborParamTotals(self, param, duplicateAssembliesOnReflectiveBoundary=False):
+        """
+        Sum a parameter over the neighbors of each assembly in the core.
+
+        Parameters
+        ----------
+        param : str
+            Name of the assembly parameter to sum.
+        duplicateAssembliesOnReflectiveBoundary : bool, optional
+            Whether the empty neighboring locations across the periodic boundaries of a 1/3 core count their symmetric
+            identicals, as :py:meth:`findNeighbors` does with ``showBlanks=True``. Otherwise, the neighbors are those of
+            :py:meth:`findNeighbors` with ``showBlanks=False``.
+
+        Returns
+        -------
+        np.ndarray
+            The sum of the parameter over the neighbors of each assembly, in the order of ``list(self)``. A neighbor
+            that appears more than once in :py:meth:`findNeighbors` is counted as many times.
+        """
+        totals, _counts = self._calcNeighborParamTotals(param, duplicateAssembliesOnReflectiveBoundary)
+        return totals
+
+    def calcNeighborParamAverages(self, param, duplicateAssembliesOnReflectiveBoundary=False):
+        """
+        Average a parameter over the neighbors of each assembly in the core.
+
+        Parameters
+        ----------
+        param : str
+            Name of the assembly parameter to average.
+        duplicateAssembliesOnReflectiveBoundary : bool, optional
+            Whether the empty neighboring locations across the periodic boundaries of a 1/3 core count their symmetric
+            identicals, as :py:meth:`findNeighbors` does with ``showBlanks=True``. Otherwise, the neighbors are those of
+            :py:meth:`findNeighbors` with ``showBlanks=False``.
+
+        Returns
+        -------
+        np.ndarray
+            The average of the parameter over the neighbors of each assembly, in the order of ``list(self)``. It is NaN
+            for an assembly without neighbors.
+        """
+        totals, counts = self._calcNeighborParamTotals(param, duplicateAssembliesOnReflectiveBoundary)
+        averages = np.full(len(totals), np.nan)
+        np.divide(totals, counts, out=averages, where=counts > 0)
+        return averages
+
+    def _calcNeighborParamTotals(self, param, duplicateAssembliesOnReflectiveBoundary):
+        """Return the sum of a parameter over the neighbors of each assembly, and the number of neighbors."""
+        owners, neighbors = self._getNeighborAssemblyIndices(duplicateAssembliesOnReflectiveBoundary)
+        values = self.getChildParamValues(param)
+        totals = np.bincount(owners, weights=values[neighbors], minlength=len(self))
+        counts = np.bincount(owners, minlength=len(self))
+        return totals, counts
+
     def setMoveList(self, cycle, oldLoc, newLoc, enrichList, assemblyType, ringPosCycle=None):
         """Tracks the movements in terms of locations and enrichments."""
         from armi.physics.fuelCycle.fuelHandlers import AssemblyMove
@@ -2307,6 +2570,10 @@ class Core(composites.Composite):
         Assumes your composite tree is structured ``Core`` -> ``Assembly`` -> ``Block``. If this is not the case,
         consider using :meth:`iterChildren`.
         """
+        if self.useCompositeIndex:
+            blocks = self._blockIndex.get(typeSpec, exact) if typeSpec is not None else self._blockIndex.get()
+            return iter(blocks) if predicate is None else filter(predicate, blocks)
+
         if typeSpec is not None:
             typeChecker = lambda b: b.hasFlags(typeSpec, exact=exact)
         else:
@@ -2318,3 +2585,17 @@ class Core(composites.Composite):
             blockChecker = typeChecker
 
         return self.iterChildren(generationNum=2, predicate=blockChecker)
+
+    def iterChildrenWithFlags(self, typeSpec: flags.TypeSpec, exactMatch=False) -> Iterator[assemblies.Assembly]:
+        """Produce an iterator of the assemblies in the core that have the given flags."""
+        if self.useCompositeIndex:
+            return iter(self._assemblyIndex.get(typeSpec, exactMatch))
+
+        return composites.Composite.iterChildrenWithFlags(self, typeSpec, exactMatch)
+
+    def iterComponents(self, typeSpec: Optional[flags.TypeSpec] = None, exact: bool = False) -> Iterator["Component"]:
+        """Produce an iterator of the components in the core that have the given flags."""
+        if self.useCompositeIndex:
+            return iter(self._componentIndex.get(typeSpec, exact))
+
+        return composites.Composite.iterComponents(self, typeSpec, exact)
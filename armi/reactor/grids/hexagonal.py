@@ -214,6 +214,41 @@ class HexGrid(StructuredGrid):
         positionBase = 1 + edge * (ring - 1)
         return ring, positionBase + offset
 
+    @staticmethod
+    def indicesToRingPosArray(i, j) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Convert arrays of spatialLocator indices to arrays of ring/position.
+
+        This is the array form of :py:meth:`indicesToRingPos`, for converting many locations at once.
+
+        Parameters
+        ----------
+        i : array of int
+            The i indices.
+        j : array of int
+            The j indices, in the same shape as ``i``.
+
+        Returns
+        -------
+        (np.ndarray, np.ndarray) : The rings and the positions of the locations.
+        """
+        i = np.asarray(i, dtype=int)
+        j = np.asarray(j, dtype=int)
+        # the edges are tested in the same order as indicesToRingPos, so the first that matches wins
+        onEdge = [
+            (i > 0) & (j >= 0),
+            (i <= 0) & (j > -i),
+            (i < 0) & (j > 0),
+            i < 0,
+            (i >= 0) & (j < -i),
+        ]
+        edge = np.select(onEdge, [0, 1, 2, 3, 4], default=5)
+        ring = np.select(onEdge, [i + j + 1, j + 1, -i + 1, -i - j + 1, -j + 1], default=i + 1)
+        offset = np.select(onEdge, [j, -i, -j - i, -j, i], default=i + j)
+
+        positionBase = 1 + edge * (ring - 1)
+        return ring, positionBase + offset
+
     @staticmethod
     def getMinimumRings(n: int) -> int:
         """
@@ -359,6 +394,40 @@ class HexGrid(StructuredGrid):
         i, j, _edge = HexGrid._indicesAndEdgeFromRingAndPos(ring, pos)
         return i, j
 
+    @staticmethod
+    def getIndicesFromRingAndPosArray(rings, positions) -> Tuple[np.ndarray, np.ndarray]:
+        """Given arrays of rings and positions, return the arrays of (I,J) coordinates in the hex grid.
+
+        This is the array form of :py:meth:`getIndicesFromRingAndPos`, for converting many locations at once.
+
+        Parameters
+        ----------
+        rings : array of int
+            Starting with 1 (not zero), the rings of the grid cells.
+        positions : array of int
+            Starting with 1 (not zero), the positions of the grid cells in their rings, in the same shape as ``rings``.
+
+        Returns
+        -------
+        (np.ndarray, np.ndarray) : I coordinates, J coordinates
+        """
+        # The inputs start counting at 1, but the grid starts counting at zero.
+        ring = np.asarray(rings, dtype=int) - 1
+        pos = np.asarray(positions, dtype=int) - 1
+
+        if ((ring == 0) & (pos != 0)).any():
+            raise ValueError(f"Positions in center ring must be 1, not {positions}")
+
+        # in the center ring, the edge and offset are 0, which gives (0, 0) from the first edge
+        edge, offset = np.divmod(pos, np.maximum(ring, 1))
+        if ((edge < 0) | (edge > 5)).any():
+            raise ValueError(f"Some edges in {edge} are invalid. From rings {rings}, positions {positions}")
+
+        onEdge = [edge == 0, edge == 1, edge == 2, edge == 3, edge == 4]
+        i = np.select(onEdge, [ring - offset, -offset, -ring, offset - ring, offset], default=ring)
+        j = np.select(onEdge, [offset, ring, ring - offset, -offset, -ring], default=offset - ring)
+        return i, j
+
     def getRingPos(self, indices: IJKType) -> Tuple[int, int]:
         """
         Get 1-based ring and position from normal indices.
@@ -440,6 +509,49 @@ class HexGrid(StructuredGrid):
         identicals = [(-i - j, i), (j, -i - j)]
         return identicals
 
+    def getSymmetricEquivalentsArray(self, i, j) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Retrieve the equivalent indices of many locations at once.
+
+        This is the array form of :py:meth:`getSymmetricEquivalents`. Since the center has no equivalents, and the
+        other locations of a 1/3 core have two, the equivalents of all of the locations are returned in one flat array,
+        along with the location each one is an equivalent of.
+
+        Parameters
+        ----------
+        i : array of int
+            The i indices.
+        j : array of int
+            The j indices, in the same shape as ``i``.
+
+        Returns
+        -------
+        owners : np.ndarray
+            The index into the flattened ``i`` and ``j`` of the location each equivalent is an equivalent of, in
+            ascending order.
+        i : np.ndarray
+            The i indices of the equivalents, in the order ``getSymmetricEquivalents`` returns them for each location.
+        j : np.ndarray
+            The j indices of the equivalents.
+        """
+        i = np.asarray(i, dtype=int).ravel()
+        j = np.asarray(j, dtype=int).ravel()
+        if (
+            self.symmetry.domain == geometry.DomainType.THIRD_CORE
+            and self.symmetry.boundary == geometry.BoundaryType.PERIODIC
+        ):
+            owners = np.flatnonzero((i != 0) | (j != 0))
+            i, j = i[owners], j[owners]
+            # each location is rotated by 120 degrees twice, counterclockwise
+            equivalentsI = np.stack([-i - j, j], axis=1).ravel()
+            equivalentsJ = np.stack([i, -i - j], axis=1).ravel()
+            return np.repeat(owners, 2), equivalentsI, equivalentsJ
+        elif self.symmetry.domain == geometry.DomainType.FULL_CORE:
+            empty = np.array([], dtype=int)
+            return empty, empty, empty
+        else:
+            raise NotImplementedError(f"Unhandled symmetry condition for HexGrid: {self.symmetry}")
+
     def triangleCoords(self, indices: IJKType) -> np.ndarray:
         """
         Return 6 coordinate pairs representing the centers of the 6 triangles in a hexagon centered here.
@@ -537,24 +649,22 @@ class HexGrid(StructuredGrid):
         # first, roughly calculate how many rings need to be created to cover nLocs worth of assemblies
         nLocs = int(nLocs)
 
-        # next, generate a list of locations and corresponding distances
-        locList = []
-        for ring in range(1, hexagon.numRingsToHoldNumCells(nLocs) + 1):
-            positions = self.getPositionsInRing(ring)
-            for position in range(1, positions + 1):
-                i, j = self.getIndicesFromRingAndPos(ring, position)
-                locList.append(self[(i, j, 0)])
+        # next, generate the indices of every location in those rings, and their distances
+        ringNumbers = np.arange(1, hexagon.numRingsToHoldNumCells(nLocs) + 1)
+        numPositions = np.where(ringNumbers == 1, 1, (ringNumbers - 1) * 6)
+        rings = np.repeat(ringNumbers, numPositions)
+        positions = np.arange(len(rings)) - np.repeat(np.cumsum(numPositions) - numPositions, numPositions) + 1
+        i, j = self.getIndicesFromRingAndPosArray(rings, positions)
+        coords = self.getCoordinates(np.stack([i, j, np.zeros_like(i)], axis=1))
+        parentLocation = self[(0, 0, 0)].parentLocation
+        if parentLocation:
+            coords = coords + parentLocation.getGlobalCoordinates()
 
         # round to avoid differences due to floating point math
-        locList.sort(
-            key=lambda loc: (
-                round(np.linalg.norm(loc.getGlobalCoordinates()), 6),
-                loc.i,
-                loc.j,
-            )
-        )
+        distances = np.round(np.linalg.norm(coords, axis=1), 6)
+        order = np.lexsort((j, i, distances))[:nLocs]
 
-        return locList[:nLocs]
+        return [self[(ii, jj, 0)] for ii, jj in zip(i[order].tolist(), j[order].tolist())]
 
     def rotateIndex(self, loc: IndexLocation, rotations: int) -> IndexLocation:
         """Find the new location of an index after some number of CCW rotations.
@@ -607,6 +717,38 @@ class HexGrid(StructuredGrid):
             return IndexLocation(newI, newJ, k, loc.grid)
         raise TypeError(f"Refusing to rotate an index {loc} from a grid {loc.grid} that is not consistent with {self}")
 
+    @staticmethod
+    def rotateIndexArray(indices, rotations: int) -> np.ndarray:
+        """Find the new indices of many locations after some number of CCW rotations.
+
+        This is the array form of :py:meth:`rotateIndex`, for rotating many locations at once. Since it only has the
+        indices, it is up to the caller to make sure they are indices in a grid that is consistent with this one.
+
+        Parameters
+        ----------
+        indices : array of int
+            ``(N, 3)`` or ``(N, 2)`` array of the (i, j, k) or (i, j) indices to rotate.
+        rotations : int
+            Number of counter clockwise rotations
+
+        Returns
+        -------
+        np.ndarray
+            The rotated indices, in the same shape. The k indices are not changed.
+        """
+        indices = np.array(indices, dtype=int)
+        if not indices.size:
+            return indices
+        i, j = indices[:, 0], indices[:, 1]
+        # the "cubic" coordinates (q, r, s) of rotateIndex, shifted by the number of rotations
+        cubic = (i, j, -(i + j))
+        sign = -1 if rotations % 2 else 1
+        newI = sign * cubic[rotations % 3]
+        newJ = sign * cubic[(rotations + 1) % 3]
+        indices[:, 0] = newI
+        indices[:, 1] = newJ
+        return indices
+
     def _roughlyEqual(self, other) -> bool:
         """Check that two hex grids are nearly identical.
 
@@ -302,10 +302,32 @@ class StructuredGrid(Grid):
             finding the mid-point along one axis is just taking the upper and lower bounds and dividing by two. And this
             is done for all axes. There are no more complicated situations where we need to find the centroid of a
             octagon on a rectangular mesh, or the like.
+
+        ``indices`` may also be an ``(N, 3)`` array of the indices of many mesh cells, in which case an ``(N, 3)``
+        array of their coordinates is returned.
         """
         indices = np.array(indices)
+        if indices.ndim > 1:
+            return self._getCoordinatesArray(indices)
         return self._evaluateMesh(indices, self._centroidBySteps, self._centroidByBounds)
 
+    def _getCoordinatesArray(self, indices) -> np.ndarray:
+        """The array form of ``getCoordinates``, for an ``(N, 3)`` array of indices."""
+        result = np.zeros(indices.shape)
+        stepDims = list(self._stepDims[0])
+        if stepDims:
+            result[:, stepDims] = self._centroidBySteps(indices[:, stepDims].T).T
+
+        for ii in self._boundDims[0]:
+            index = indices[:, ii]
+            if (index < 0).any():
+                # avoid wrap-around
+                raise IndexError("Bounds-defined indices may not be negative.")
+            bounds = np.asarray(self._bounds[ii])
+            result[:, ii] = (bounds[index + 1] + bounds[index]) / 2.0
+
+        return result + self._offset
+
     def getCellBase(self, indices) -> np.ndarray:
         """Get the mesh base (lower left) of this mesh cell in cm."""
         indices = np.array(indices)
@@ -351,6 +351,12 @@ class TestHexGrid(unittest.TestCase):
         assert_allclose(grid.getCoordinates((1, 0, 0)), iDirection)
         assert_allclose(grid.getCoordinates((0, 1, 0)), jDirection)
 
+    def test_getCoordinatesArray(self):
+        for cornersUp in [True, False]:
+            grid = grids.HexGrid.fromPitch(1.0, numRings=3, cornersUp=cornersUp)
+            indices = np.array([(i, j, 0) for i in range(-3, 4) for j in range(-3, 4)])
+            assert_allclose(grid.getCoordinates(indices), [grid.getCoordinates(ijk) for ijk in indices])
+
     def test_getLocalCoordinatesHex(self):
         """Test getLocalCoordinates() is different for corners up vs flats up hex grids."""
         grid0 = grids.HexGrid.fromPitch(1.0, cornersUp=True)
@@ -437,6 +443,21 @@ class TestHexGrid(unittest.TestCase):
             self.assertEqual(indices, grid.getIndicesFromRingAndPos(*ringPos))
             self.assertEqual(ringPos, grid.getRingPos(indices))
 
+    def test_ringPosArrays(self):
+        """Test that the array forms of the ring/position conversions match the scalar ones."""
+        grid = grids.HexGrid.fromPitch(1.0)
+        indices = [(i, j) for i in range(-8, 9) for j in range(-8, 9)]
+        iArray, jArray = np.array(indices).T
+
+        rings, positions = grid.indicesToRingPosArray(iArray, jArray)
+        self.assertEqual(list(zip(rings.tolist(), positions.tolist())), [grid.getRingPos(ij) for ij in indices])
+
+        newI, newJ = grid.getIndicesFromRingAndPosArray(rings, positions)
+        self.assertEqual(list(zip(newI.tolist(), newJ.tolist())), indices)
+
+        with self.assertRaises(ValueError):
+            grid.getIndicesFromRingAndPosArray([1, 2], [2, 1])
+
     def test_label(self):
         grid = grids.HexGrid.fromPitch(1.0)
         indices = grid.getIndicesFromRingAndPos(12, 5)
@@ -478,6 +499,19 @@ class TestHexGrid(unittest.TestCase):
         symmetrics = g.getSymmetricEquivalents(g.getIndicesFromRingAndPos(5, 3))
         self.assertEqual([(5, 11), (5, 19)], [g.getRingPos(indices) for indices in symmetrics])
 
+    def test_symmetricEquivalentsArray(self):
+        """Test that the array form of the symmetric equivalents matches the scalar one."""
+        indices = [(0, 0), (3, -2), (2, 1), (-1, 4), (1, 0)]
+        iArray, jArray = np.array(indices).T
+        for symmetry in ["third core periodic", "full core"]:
+            g = grids.HexGrid.fromPitch(1.0, symmetry=symmetry)
+            owners, equivalentsI, equivalentsJ = g.getSymmetricEquivalentsArray(iArray, jArray)
+            expected = [(n, equivalent) for n, ij in enumerate(indices) for equivalent in g.getSymmetricEquivalents(ij)]
+            self.assertEqual(
+                list(zip(owners.tolist(), zip(equivalentsI.tolist(), equivalentsJ.tolist()))),
+                expected,
+            )
+
     def test_thirdAndFullSymmetry(self):
         """Test that we can construct a full and a 1/3 core grid.
 
@@ -792,6 +826,17 @@ class TestHexGrid(unittest.TestCase):
         finishXY = finish.getLocalCoordinates()[:2]
         np.testing.assert_allclose(finishXY, expected, atol=1e-8)
 
+    def test_rotatedIndexArray(self):
+        """Test that rotating many indices at once matches rotating them one at a time."""
+        g = grids.HexGrid.fromPitch(1.0, numRings=3)
+        locations = [g[(i, j, k)] for i in range(-3, 4) for j in range(-3, 4) for k in range(2)]
+        indices = np.array([loc.indices for loc in locations])
+        for rotations in range(-7, 8):
+            rotated = g.rotateIndexArray(indices, rotations)
+            self.assertEqual(rotated.tolist(), [g.rotateIndex(loc, rotations).indices.tolist() for loc in locations])
+
+        self.assertEqual(g.rotateIndexArray([], 1).size, 0)
+
     def test_inconsistentRotationGrids(self):
         """Test that only locations in consistent grids are rotatable."""
         base = grids.HexGrid.fromPitch(1, cornersUp=False)
@@ -841,6 +886,15 @@ class TestBoundsDefinedGrid(unittest.TestCase):
         grid = MockStructuredGrid(bounds=([0, 1, 2, 3, 4], [0, 10, 20, 50], [0, 20, 60, 90]))
         assert_allclose(grid.getCellBase((1, 1, 1)), (1.0, 10.0, 20.0))
 
+    def test_positionsArray(self):
+        grid = MockStructuredGrid(bounds=([0, 1, 2, 3, 4], [0, 10, 20, 50], [0, 20, 60, 90]))
+        assert_allclose(grid.getCoordinates([(1, 1, 1), (0, 2, 0)]), [(1.5, 15.0, 40.0), (0.5, 35.0, 10.0)])
+
+        grid = MockStructuredGrid(unitSteps=((1.0, 0.0), (0.0, 1.0)), bounds=(None, None, [0, 20, 60, 90]))
+        assert_allclose(grid.getCoordinates([(1, 1, 1), (-1, 2, 2)]), [(1, 1, 40.0), (-1, 2, 75.0)])
+        with self.assertRaises(IndexError):
+            grid.getCoordinates([(1, 1, 1), (1, 1, -1)])
+
     def test_positionsMixedDefinition(self):
         grid = MockStructuredGrid(unitSteps=((1.0, 0.0), (0.0, 1.0)), bounds=(None, None, [0, 20, 60, 90]))
         assert_allclose(grid.getCoordinates((1, 1, 1)), (1, 1, 40.0))
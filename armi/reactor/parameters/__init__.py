@@ -147,6 +147,15 @@ laid out below.  Namely that pains be taken to minimize memory consumption, prop
 be used to control data access, and that it be relatively difficult to introduce
 programming errors related to improperly-defined or colliding parameters.
 
+Columnar Storage
+================
+For very large models, :py:func:`~armi.reactor.parameters.parameterCollections.enableColumnarStorage` can be called
+right after ``armi.configure()`` to switch ``ParameterCollection`` classes over to storing their scalar (``float``,
+``int`` and ``bool``) parameter values in one numpy column per parameter, shared by all instances of the class. Access
+through ``p.name`` and ``p["name"]`` is unchanged, and
+:py:func:`~armi.reactor.parameters.parameterCollections.getColumnValues` can read a parameter for many objects at once.
+See :py:mod:`~armi.reactor.parameters.parameterColumns` for details.
+
 Design Considerations
 =====================
 
@@ -207,6 +216,8 @@ from armi.reactor.parameters.parameterCollections import (
     ParameterCollection,
     applyAllParameters,
     collectPluginParameters,
+    enableColumnarStorage,
+    getColumnValues,
 )
 from armi.reactor.parameters.parameterDefinitions import (
     ALL_DEFINITIONS,
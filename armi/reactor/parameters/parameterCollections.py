@@ -20,7 +20,7 @@ from typing import Any, Callable, Iterator, List, Optional, Set
 import numpy as np
 
 from armi import runLog
-from armi.reactor.parameters import exceptions, parameterDefinitions
+from armi.reactor.parameters import exceptions, parameterColumns, parameterDefinitions
 from armi.reactor.parameters.parameterDefinitions import (
     NEVER,
     SINCE_ANYTHING,
@@ -76,6 +76,8 @@ class _ParameterCollectionType(type):
         attrs["pDefs"] = attrs.get("pDefs") or None
         attrs["_ArmiObject"] = None
         attrs["_allFields"] = []
+        attrs["_columnStore"] = None
+        attrs["_instantiated"] = False
 
         return type.__new__(mcl, name, bases, attrs)
 
@@ -115,6 +117,11 @@ class ParameterCollection(metaclass=_ParameterCollectionType):
     pDefs: parameterDefinitions.ParameterDefinitionCollection = _getBaseParameterDefinitions()
     _allFields: List[str] = []
 
+    _columnStore: Optional[parameterColumns.ParameterColumnStore] = None
+    """Shared column storage for scalar parameter values, if columnar storage has been enabled for this class."""
+
+    _instantiated: bool = False
+
     _ArmiObject = None
     """The ArmiObject class that this ParameterCollection belongs to.
 
@@ -142,10 +149,6 @@ class ParameterCollection(metaclass=_ParameterCollectionType):
             should come from a call to __getstate__(). This should only be used
             internally to this model.
         """
-        # add a hook to make this readOnly
-        self._slots.add("readOnly")
-        self.readOnly = False
-
         if self.pDefs is None or not self.pDefs.locked:
             type(self).applyParameters()
 
@@ -155,6 +158,16 @@ class ParameterCollection(metaclass=_ParameterCollectionType):
             "somewhere.".format(type(self))
         )
 
+        store = self._columnStore
+        if store is not None:
+            object.__setattr__(self, "_row", store.allocate())
+        if not self._instantiated:
+            type(self)._instantiated = True
+
+        # add a hook to make this readOnly
+        self._slots.add("readOnly")
+        self.readOnly = False
+
         self._backup = None
         # used by the history tracker when a parameter key is a tuple (name, timestep)
         self._hist = {}
@@ -164,9 +177,15 @@ class ParameterCollection(metaclass=_ParameterCollectionType):
         if _state is None:
             for pDef in self.paramDefs:
                 setattr(self, pDef.fieldName, pDef.default)
-        else:
+        elif store is None:
             for key, val in zip(self._allFields, _state):
                 self.__dict__[key] = val
+        else:
+            for key, val in zip(self._allFields, _state):
+                if key in store:
+                    store.set(key, self._row, val)
+                else:
+                    self.__dict__[key] = val
 
         self.assigned = NEVER
 
@@ -254,6 +273,42 @@ class ParameterCollection(metaclass=_ParameterCollectionType):
         cls._slots = set(cls._allFields).union({pd.name for pd in cls.pDefs})
         cls._slots.add("readOnly")
 
+        # collections derived from a column-backed collection must be column-backed too, otherwise they would inherit
+        # the base class's column descriptors without a row of their own
+        if any(getattr(base, "_columnStore", None) is not None for base in cls.__bases__):
+            cls._enableColumnarStorage()
+
+    @classmethod
+    def _enableColumnarStorage(cls):
+        """
+        Switch this class over to storing its scalar parameter values in shared numpy columns.
+
+        See Also
+        --------
+        enableColumnarStorage
+        armi.reactor.parameters.parameterColumns
+        """
+        if cls._columnStore is not None:
+            return
+
+        if cls._instantiated:
+            raise RuntimeError(
+                "Cannot enable columnar parameter storage for {} after it has been instantiated.".format(cls.__name__)
+            )
+
+        cls.applyParameters()
+        columnTypes = {}
+        for pd in cls.pDefs:
+            pyType = parameterColumns.columnTypeFor(pd.default)
+            if pyType is not None:
+                columnTypes[pd.fieldName] = pyType
+
+        store = cls._columnStore = parameterColumns.ParameterColumnStore(columnTypes)
+        for fieldName in columnTypes:
+            setattr(cls, fieldName, parameterColumns.ColumnField(fieldName, store))
+        cls._slots = cls._slots.union({"_row"})
+        cls.__del__ = _releaseColumnRow
+
     def __repr__(self):
         return "<{} assigned:{}>".format(self.__class__.__name__, self.assigned)
 
@@ -498,6 +553,55 @@ class ParameterCollection(metaclass=_ParameterCollectionType):
         return filter(f, self.paramDefs)
 
 
+def _releaseColumnRow(pc):
+    """Finalizer for column-backed ParameterCollections; hands the instance's row back to the store."""
+    row = pc.__dict__.get("_row")
+    if row is not None:
+        pc._columnStore.release(row)
+
+
+def getColumnValues(paramCollections: List[ParameterCollection], name: str) -> Optional[np.ndarray]:
+    """
+    Read one scalar parameter from many ParameterCollections as a single array, if they are column-backed.
+
+    This is the bulk counterpart to ``[pc[name] for pc in paramCollections]``. It only succeeds when all of the
+    collections are of the same column-backed type, the parameter is stored in a column, and none of the requested
+    values are held outside of the column (e.g. ``None``). Otherwise ``None`` is returned and the caller should fall
+    back to reading the values one by one.
+    """
+    if not paramCollections:
+        return None
+
+    pcType = type(paramCollections[0])
+    store = pcType._columnStore
+    fieldName = "_p_" + name
+    if store is None or fieldName not in store:
+        return None
+
+    rows = []
+    for pc in paramCollections:
+        if type(pc) is not pcType:
+            return None
+        rows.append(pc._row)
+
+    return store.gather(fieldName, rows)
+
+
+def enableColumnarStorage(klass=None):
+    """
+    Store the scalar parameters of a ParameterCollection class, and all classes derived from it, in numpy columns.
+
+    This must be called before any instance of the affected classes is created, typically right after
+    ``armi.configure()``. Parameter access through ``p.name`` or ``p["name"]`` is unchanged, but the values of every
+    ``float``, ``int`` and ``bool`` parameter live in one contiguous array per class, which saves memory on large
+    models and allows bulk reads through :py:func:`getColumnValues`.
+    """
+    klass = klass or ParameterCollection
+    klass._enableColumnarStorage()
+    for derived in klass.__subclasses__():
+        enableColumnarStorage(derived)
+
+
 def collectPluginParameters(pm):
     """Apply parameters from plugins to their respective object classes."""
     for pluginParamDefnCollections in pm.hook.defineParameters():
@@ -0,0 +1,177 @@
+# Copyright 2026 TerraPower, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Optional columnar storage for the scalar values held by ``ParameterCollection`` instances.
+
+By default every ``ParameterCollection`` instance keeps its parameter values in its own ``__dict__``. For models with
+hundreds of thousands of composites, this costs a Python object and a dictionary slot per parameter per object, and
+any core-wide reduction over a parameter turns into a walk over Python attributes. When columnar storage is enabled
+for a ``ParameterCollection`` class (see :py:func:`~armi.reactor.parameters.parameterCollections.enableColumnarStorage`)
+each scalar parameter whose default is a ``float``, ``int`` or ``bool`` is instead stored in one contiguous numpy
+column that is shared by every instance of the class, with one row per instance.
+
+The hidden ``"_p_" + paramName`` fields become data descriptors (:py:class:`ColumnField`) that read and write the
+instance's row in the column, so ``p.name``, ``p["name"]``, custom setters, pickling and deep copies keep working
+unchanged. Values that do not match the column type exactly (``None``, arrays, a ``float`` assigned to an ``int``
+parameter, etc.) are kept in a small per-column overflow dictionary, so no value ever changes type by being stored.
+"""
+
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+
+_COLUMN_TYPES = {float: np.float64, int: np.int64, bool: np.bool_}
+
+
+class _Missing:
+    """Marker for a field that has been deleted from an instance."""
+
+
+def columnTypeFor(default) -> Optional[type]:
+    """Return the Python type a parameter with this default would be stored as in a column, or None."""
+    pyType = type(default)
+    return pyType if pyType in _COLUMN_TYPES else None
+
+
+class ParameterColumnStore:
+    """
+    Contiguous numpy columns holding scalar parameter values, with one row per ``ParameterCollection`` instance.
+
+    Rows are handed out by :py:meth:`allocate` when an instance is created and returned to a free list by
+    :py:meth:`release` when it is garbage collected. The columns grow geometrically, so any array returned by
+    :py:meth:`column` is only valid until the next row is allocated.
+    """
+
+    _INITIAL_CAPACITY = 64
+
+    def __init__(self, columnTypes: Dict[str, type]):
+        self._pyTypes = dict(columnTypes)
+        self._capacity = self._INITIAL_CAPACITY
+        self._columns = {
+            fieldName: np.zeros(self._capacity, dtype=_COLUMN_TYPES[pyType])
+            for fieldName, pyType in columnTypes.items()
+        }
+        self._overflow = {fieldName: {} for fieldName in columnTypes}
+        self._freeRows = []
+        self._numRows = 0
+
+    def __contains__(self, fieldName):
+        return fieldName in self._columns
+
+    def __len__(self):
+        """Number of rows currently in use."""
+        return self._numRows - len(self._freeRows)
+
+    @property
+    def fieldNames(self):
+        return list(self._columns)
+
+    @property
+    def nbytes(self) -> int:
+        """Number of bytes held by the column arrays."""
+        return sum(col.nbytes for col in self._columns.values())
+
+    def allocate(self) -> int:
+        """Reserve a row for a new ``ParameterCollection`` instance."""
+        if self._freeRows:
+            return self._freeRows.pop()
+
+        row = self._numRows
+        if row == self._capacity:
+            self._capacity *= 2
+            for fieldName, col in self._columns.items():
+                newCol = np.zeros(self._capacity, dtype=col.dtype)
+                newCol[:row] = col
+                self._columns[fieldName] = newCol
+        self._numRows += 1
+        return row
+
+    def release(self, row: int):
+        """Return a row to the free list, dropping any overflow values it held."""
+        for overflow in self._overflow.values():
+            if overflow:
+                overflow.pop(row, None)
+        self._freeRows.append(row)
+
+    def get(self, fieldName: str, row: int):
+        overflow = self._overflow[fieldName]
+        if overflow and row in overflow:
+            value = overflow[row]
+            if value is _Missing:
+                raise AttributeError(fieldName)
+            return value
+        return self._columns[fieldName].item(row)
+
+    def set(self, fieldName: str, row: int, value):
+        overflow = self._overflow[fieldName]
+        if type(value) is self._pyTypes[fieldName]:
+            self._columns[fieldName][row] = value
+            if overflow:
+                overflow.pop(row, None)
+        else:
+            overflow[row] = value
+
+    def delete(self, fieldName: str, row: int):
+        # raises AttributeError if the field is already gone, mirroring ``delattr``
+        self.get(fieldName, row)
+        self._overflow[fieldName][row] = _Missing
+
+    def column(self, fieldName: str) -> np.ndarray:
+        """
+        Return the raw column for a field, one entry per allocated row.
+
+        Entries for released rows, and for rows whose value is held in the overflow, are meaningless. Use
+        :py:meth:`gather` to safely collect values for specific rows.
+        """
+        return self._columns[fieldName][: self._numRows]
+
+    def gather(self, fieldName: str, rows: Iterable[int]) -> Optional[np.ndarray]:
+        """
+        Return the values of a field for the requested rows as a new array.
+
+        Returns None if any of the requested rows hold an overflow value, since those cannot be represented in the
+        column's dtype; callers should then fall back to reading the values one at a time.
+        """
+        rows = np.asarray(rows, dtype=np.intp)
+        overflow = self._overflow[fieldName]
+        if overflow and not overflow.keys().isdisjoint(rows.tolist()):
+            return None
+        return self._columns[fieldName][rows]
+
+
+class ColumnField:
+    """
+    Data descriptor standing in for a ``"_p_" + paramName`` field of a column-backed ``ParameterCollection``.
+
+    This is what lets ``getattr``/``setattr``/``delattr`` on the hidden parameter fields, which the rest of the
+    parameter system relies on, read and write the instance's row of a :py:class:`ParameterColumnStore`.
+    """
+
+    __slots__ = ("fieldName", "store")
+
+    def __init__(self, fieldName: str, store: ParameterColumnStore):
+        self.fieldName = fieldName
+        self.store = store
+
+    def __get__(self, obj, cls=None):
+        if obj is None:
+            return self
+        return self.store.get(self.fieldName, obj._row)
+
+    def __set__(self, obj, value):
+        self.store.set(self.fieldName, obj._row, value)
+
+    def __delete__(self, obj):
+        self.store.delete(self.fieldName, obj._row)
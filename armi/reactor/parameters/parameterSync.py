@@ -0,0 +1,200 @@
+# Copyright 2026 TerraPower, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Binary wire format for synchronizing changed parameter values across MPI ranks.
+
+``Composite.syncMpiState`` needs every rank to learn which parameters every other rank changed
+``SINCE_LAST_DISTRIBUTE_STATE``. Sending one dictionary per composite through a pickling ``allgather`` makes the cost
+scale with the number of composites in the model, rather than with the number of changes. Instead, the changed scalar
+values (``float``, ``int`` and ``bool``) are packed into a structured numpy array of (object index, parameter id, kind,
+value) records and exchanged with a single buffer-based ``Allgatherv``. Only values that have no scalar numeric
+representation (arrays, strings, ``None``, etc.) are pickled, together with the small table that maps parameter ids
+back to names, and that pickle travels in the same byte buffer.
+"""
+
+import pickle
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+SYNC_RECORD_DTYPE = np.dtype([("obj", np.int64), ("param", np.int32), ("kind", np.uint8), ("value", np.int64)])
+"""One changed scalar parameter. Float values are stored bit-for-bit in the ``value`` field."""
+
+_FLOAT = 0
+_INT = 1
+_BOOL = 2
+
+_SCALAR_KINDS = {
+    float: _FLOAT,
+    np.float64: _FLOAT,
+    int: _INT,
+    np.int64: _INT,
+    bool: _BOOL,
+    np.bool_: _BOOL,
+}
+
+_INT64_MIN = np.iinfo(np.int64).min
+_INT64_MAX = np.iinfo(np.int64).max
+
+
+class SyncPacket:
+    """
+    The parameters one rank changed since the last distribute, ready to go over the wire.
+
+    Attributes
+    ----------
+    numObjects : int
+        Number of parameter collections that were packed; every rank must agree on this.
+    records : np.ndarray
+        Structured array of ``SYNC_RECORD_DTYPE`` holding the scalar values.
+    paramNames : list of str
+        Parameter names, indexed by the ``param`` field of the records.
+    pickled : list of tuple
+        ``(objectIndex, paramName, value)`` for values that could not be packed into records.
+    """
+
+    def __init__(self, numObjects: int, records: np.ndarray, paramNames: List[str], pickled: List[Tuple]):
+        self.numObjects = numObjects
+        self.records = records
+        self.paramNames = paramNames
+        self.pickled = pickled
+
+    def toBytes(self) -> Tuple[np.ndarray, int]:
+        """Serialize to one uint8 buffer; also return the number of bytes taken up by the packed records."""
+        recordBytes = self.records.view(np.uint8)
+        blob = pickle.dumps((self.paramNames, self.pickled), protocol=pickle.HIGHEST_PROTOCOL)
+        return np.concatenate([recordBytes, np.frombuffer(blob, dtype=np.uint8)]), len(recordBytes)
+
+    @classmethod
+    def fromBytes(cls, numObjects: int, buffer: np.ndarray, numRecordBytes: int) -> "SyncPacket":
+        """Rebuild a packet from a buffer produced by :py:meth:`toBytes`."""
+        records = np.frombuffer(buffer[:numRecordBytes].tobytes(), dtype=SYNC_RECORD_DTYPE)
+        paramNames, pickled = pickle.loads(buffer[numRecordBytes:].tobytes())
+        return cls(numObjects, records, paramNames, pickled)
+
+    def unpack(self) -> List[Optional[dict]]:
+        """
+        Expand the packet into one sync dictionary per object, as ``ParameterCollection.getSyncData`` would give.
+
+        Objects without any changed parameters get ``None``.
+        """
+        syncData = [None] * self.numObjects
+        rawValues = np.ascontiguousarray(self.records["value"])
+        records = zip(
+            self.records["obj"].tolist(),
+            self.records["param"].tolist(),
+            self.records["kind"].tolist(),
+            rawValues.view(np.float64).tolist(),
+            rawValues.tolist(),
+        )
+        for objIndex, paramId, kind, floatValue, intValue in records:
+            if kind == _FLOAT:
+                value = floatValue
+            elif kind == _BOOL:
+                value = bool(intValue)
+            else:
+                value = intValue
+            _addSyncValue(syncData, objIndex, self.paramNames[paramId], value)
+
+        for objIndex, name, value in self.pickled:
+            _addSyncValue(syncData, objIndex, name, value)
+
+        return syncData
+
+
+def _addSyncValue(syncData, objIndex, name, value):
+    objData = syncData[objIndex]
+    if objData is None:
+        objData = syncData[objIndex] = {}
+    objData[name] = value
+
+
+def packSyncData(paramCollections: Sequence) -> SyncPacket:
+    """Collect the changed parameters of many ``ParameterCollection`` objects into a :py:class:`SyncPacket`."""
+    objIndices = []
+    paramIds = []
+    kinds = []
+    floatPositions = []
+    floatValues = []
+    intPositions = []
+    intValues = []
+    nameIds = {}
+    pickled = []
+
+    for objIndex, pc in enumerate(paramCollections):
+        syncData = pc.getSyncData()
+        if not syncData:
+            continue
+
+        for name, value in syncData.items():
+            kind = _SCALAR_KINDS.get(type(value))
+            if kind == _INT and not _INT64_MIN <= value <= _INT64_MAX:
+                kind = None
+            if kind is None:
+                pickled.append((objIndex, name, value))
+                continue
+
+            if kind == _FLOAT:
+                floatPositions.append(len(objIndices))
+                floatValues.append(value)
+            else:
+                intPositions.append(len(objIndices))
+                intValues.append(value)
+            objIndices.append(objIndex)
+            paramIds.append(nameIds.setdefault(name, len(nameIds)))
+            kinds.append(kind)
+
+    records = np.zeros(len(objIndices), dtype=SYNC_RECORD_DTYPE)
+    records["obj"] = objIndices
+    records["param"] = paramIds
+    records["kind"] = kinds
+    values = records["value"]
+    values[floatPositions] = np.array(floatValues, dtype=np.float64).view(np.int64)
+    values[intPositions] = np.array(intValues, dtype=np.int64)
+
+    return SyncPacket(len(paramCollections), records, list(nameIds), pickled)
+
+
+def allgatherSyncData(comm, paramCollections: Sequence) -> Tuple[List[List[Optional[dict]]], List[int]]:
+    """
+    Exchange the changed parameters of ``paramCollections`` with all ranks of ``comm``.
+
+    Returns
+    -------
+    allSyncData : list
+        One entry per rank, each being a list with one sync dictionary (or ``None``) per parameter collection,
+        exactly like ``[pc.getSyncData() for pc in paramCollections]`` evaluated on that rank.
+    bytesPerRank : list of int
+        The number of bytes each rank contributed to the exchange.
+
+    Notes
+    -----
+    Each rank contributes a single buffer, so the MPI limit of ``2**31 - 1`` elements per message applies to the
+    changes made by a single rank.
+    """
+    sendBuf, numRecordBytes = packSyncData(paramCollections).toBytes()
+    sizes = comm.allgather((len(paramCollections), len(sendBuf), numRecordBytes))
+
+    counts = [size[1] for size in sizes]
+    displacements = np.cumsum([0] + counts[:-1]).tolist()
+    recvBuf = np.empty(sum(counts), dtype=np.uint8)
+    comm.Allgatherv(sendBuf, [recvBuf, counts, displacements])
+
+    allSyncData = []
+    for (numObjects, count, rankRecordBytes), start in zip(sizes, displacements):
+        packet = SyncPacket.fromBytes(numObjects, recvBuf[start : start + count], rankRecordBytes)
+        allSyncData.append(packet.unpack())
+
+    return allSyncData, counts
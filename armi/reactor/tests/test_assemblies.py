@@ -26,7 +26,7 @@ from numpy.testing import assert_allclose
 
 from armi import settings, testing
 from armi.physics.neutronics.settings import CONF_LOADING_FILE, CONF_XS_KERNEL
-from armi.reactor import blocks, blueprints, components, geometry, parameters, reactors
+from armi.reactor import blocks, blueprints, components, composites, geometry, parameters, reactors
 from armi.reactor.assemblies import Flags, HexAssembly, copy, grids, runLog
 from armi.reactor.parameters import ParamLocation
 from armi.testing import TESTING_ROOT, buildEmptyHexAssembly, getEmptyHexReactor, loadTestReactor, mockRunLogs
@@ -328,6 +328,16 @@ class TestAssemblyReadOnly(unittest.TestCase):
         self.assertEqual(len(blocksAndHeights), len(self.assembly))
         self.assertAlmostEqual(sum([height for _b, height in blocksAndHeights]), self.assembly.getHeight())
 
+    def test_getBlockAtElevation(self):
+        # assembly should have 3 blocks of 10 cm in it
+        b0, b1, b2 = self.assembly
+        elevations = [-1.0, 0.0, 5.0, 10.0, 10.0 + 1e-12, 10.5, 29.0, 30.0, 30.5]
+        expected = [None, None, b0, b0, b0, b1, b2, b2, None]
+        for z, b in zip(elevations, expected):
+            self.assertIs(self.assembly.getBlockAtElevation(z), b, msg=f"at {z} cm")
+        self.assertEqual(self.assembly.getBlocksAtElevations(elevations), expected)
+        self.assertEqual(self.assembly.getBlocksAtElevations(np.array(elevations)), expected)
+
     def test_hasContinuousCoolantChannel(self):
         self.assertFalse(self.assembly.hasContinuousCoolantChannel())
         modifiedAssem = self.assembly
@@ -544,6 +554,24 @@ class TestAssembly(unittest.TestCase):
         places = 6
         self.assertAlmostEqual(cur, ref, places=places)
 
+    def test_elevationsFollowBlockChanges(self):
+        b0, b1, b2 = self.assembly
+        self.assertIs(self.assembly.getBlockAtElevation(15.0), b1)
+
+        # the elevations are found again when a block height changes, without invalidating the flag indices
+        treeGeneration = composites.getTreeGeneration()
+        b0.setHeight(5.0)
+        self.assertEqual(composites.getTreeGeneration(), treeGeneration)
+        self.assertEqual(self.assembly.getAxialMesh(), [5.0, 15.0, 25.0])
+        self.assertEqual(self.assembly.getAxialMesh(centers=True), [2.5, 10.0, 20.0])
+        self.assertIs(self.assembly.getBlockAtElevation(7.0), b1)
+        self.assertIsNone(self.assembly.getBlockAtElevation(27.0))
+        self.assertEqual(self.assembly.getBlocksBetweenElevations(0.0, 6.0), [(b0, 5.0), (b1, 1.0)])
+
+        # ...and when a block is removed
+        self.assembly.remove(b0)
+        self.assertEqual(self.assembly.getBlocksAtElevations([5.0, 15.0, 25.0]), [b1, b2, None])
+
     def test_getFissileMass(self):
         for b in self.assembly:
             b.p.massHmBOL = b.getHMMass()
@@ -1854,6 +1854,9 @@ class TestMaterialAdjustments(unittest.TestCase):
             def getAncestor(self, fn):
                 return self.reactor
 
+            def getAncestorOfClass(self, cls):
+                return self.reactor
+
         self.fuel.parent = FakeBlock()
 
     def test_setMassFrac(self):
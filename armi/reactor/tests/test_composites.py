@@ -25,7 +25,7 @@ from armi.nucDirectory.nuclideBases import NuclideBase, NuclideBases
 from armi.physics.neutronics.fissionProductModel.tests.test_lumpedFissionProduct import (
     getDummyLFPFile,
 )
-from armi.reactor import assemblies, components, composites, grids, parameters
+from armi.reactor import assemblies, blocks, components, composites, cores, grids, parameters, reactors
 from armi.reactor.blueprints import assemblyBlueprint
 from armi.reactor.components import basicShapes
 from armi.reactor.flags import Flags, TypeSpec
@@ -612,6 +612,31 @@ class TestCompositePattern(unittest.TestCase):
         for c in self.container:
             self.assertIs(c.parent, self.container)
 
+    def test_getAncestorOfClass(self):
+        b = self.container.parent
+        core = b.parent.parent
+        self.assertIs(self.thirdGen.getAncestorOfClass(DummyLeaf), self.thirdGen)
+        self.assertIs(self.thirdGen.getAncestorOfClass(blocks.Block), b)
+        self.assertIs(self.thirdGen.getAncestorOfClass(assemblies.Assembly), b.parent)
+        self.assertIs(self.thirdGen.getAncestorOfClass(cores.Core), core)
+        self.assertIs(self.thirdGen.getAncestorOfClass(reactors.Reactor), core.parent)
+        for cls in (DummyComposite, blocks.Block, cores.Core, reactors.Reactor, components.Component):
+            expected = self.thirdGen.getAncestor(lambda c: isinstance(c, cls))
+            self.assertIs(self.thirdGen.getAncestorOfClass(cls), expected)
+
+        # moving a subtree invalidates the ancestors cached below it
+        self.container.remove(self.cladChild)
+        self.assertIsNone(self.thirdGen.getAncestorOfClass(cores.Core))
+        self.assertIs(self.thirdGen.getAncestorOfClass(DummyComposite), self.secondGen)
+        self.container.add(self.cladChild)
+        self.assertIs(self.thirdGen.getAncestorOfClass(cores.Core), core)
+
+        # copies do not keep the ancestors of the original
+        copied = deepcopy(self.secondGen)
+        self.assertIsNone(copied.getAncestorOfClass(cores.Core))
+        self.assertIsNone(copied[0].getAncestorOfClass(cores.Core))
+        self.assertIs(copied[0].getAncestorOfClass(DummyComposite), copied)
+
 
 class TestCompositeTree(unittest.TestCase):
     blueprintYaml = """
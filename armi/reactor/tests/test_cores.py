@@ -13,12 +13,14 @@
 # limitations under the License.
 import itertools
 import random
+import timeit
 import typing
 import unittest
 from unittest import mock
 from unittest.mock import patch
 
 from armi.nuclearDataIO.xsLibraries import IsotxsLibrary
+from armi.reactor import geometry
 from armi.reactor.assemblies import HexAssembly
 from armi.reactor.blocks import Block
 from armi.reactor.flags import Flags
@@ -177,3 +179,158 @@ class TestHexCore(unittest.TestCase):
     def test_getFirstAssembly(self):
         a = self.core.getFirstAssembly()
         self.assertIsInstance(a, HexAssembly)
+
+
+class TestCompositeIndex(unittest.TestCase):
+    """Tests that flag queries answered from the indices of the core match walking the composite tree."""
+
+    def setUp(self):
+        self.core = loadTestReactor()[1].core
+
+    def _withoutIndex(self, query):
+        self.core.useCompositeIndex = False
+        try:
+            return query()
+        finally:
+            self.core.useCompositeIndex = True
+
+    def _queries(self, spec, exact=False):
+        return [
+            lambda: self.core.getBlocks(spec),
+            lambda: list(self.core.iterBlocks(spec, exact=exact)),
+            lambda: list(self.core.iterBlocks(spec, exact=exact, predicate=lambda b: b.p.z > 50.0)),
+            lambda: self.core.getChildrenWithFlags(spec, exact),
+            lambda: self.core.getComponents(spec, exact),
+        ]
+
+    def assertIndexMatchesScan(self, spec, exact=False):
+        for query in self._queries(spec, exact):
+            indexed = query()
+            scanned = self._withoutIndex(query)
+            self.assertEqual(len(indexed), len(scanned))
+            for actual, expected in zip(indexed, scanned):
+                self.assertIs(actual, expected)
+
+    def test_indexMatchesScan(self):
+        specs = (None, Flags.FUEL, Flags.CONTROL, [Flags.FUEL, Flags.SHIELD], Flags.CLAD, Flags.FUEL | Flags.CLAD)
+        for spec in specs:
+            self.assertIndexMatchesScan(spec)
+            self.assertIndexMatchesScan(spec, exact=True)
+
+        # the results are copies, so changing them does not change the index
+        self.core.getBlocks(Flags.FUEL).clear()
+        self.assertIndexMatchesScan(Flags.FUEL)
+
+    def test_indexFollowsChanges(self):
+        fuelBlocks = self.core.getBlocks(Flags.FUEL)
+        self.assertTrue(fuelBlocks)
+
+        # changing the flags of a block
+        b = fuelBlocks[0]
+        b.setType("shield", Flags.SHIELD)
+        self.assertNotIn(b, self.core.getBlocks(Flags.FUEL))
+        self.assertIn(b, self.core.getBlocks(Flags.SHIELD))
+        self.assertIndexMatchesScan(Flags.FUEL)
+
+        # removing an assembly
+        a = self.core.getChildrenWithFlags(Flags.FUEL)[-1]
+        self.core.removeAssembly(a, discharge=False)
+        self.assertNotIn(a, self.core.getChildrenWithFlags(Flags.FUEL))
+        self.assertNotIn(a[0], self.core.iterBlocks())
+        self.assertIndexMatchesScan(Flags.FUEL)
+
+        # shuffling two assemblies reorders the sorted blocks
+        a1, a2 = self.core.getChildrenWithFlags(Flags.FUEL)[:2]
+        loc1, loc2 = a1.spatialLocator, a2.spatialLocator
+        a1.moveTo(loc2)
+        a2.moveTo(loc1)
+        self.assertIndexMatchesScan(Flags.FUEL)
+
+    def test_indexBenchmark(self):
+        """Compare the time of repeated flag queries answered from the indices with the time of walking the tree."""
+        numQueries = 20
+        queries = self._queries(Flags.FUEL)
+        # build the indices and fill the caches
+        for query in queries:
+            query()
+
+        runQueries = lambda: [query() for query in queries]
+        indexedTime = timeit.timeit(runQueries, number=numQueries)
+        scannedTime = self._withoutIndex(lambda: timeit.timeit(runQueries, number=numQueries))
+
+        self.assertLess(
+            indexedTime,
+            scannedTime,
+            msg=f"{numQueries} rounds of flag queries took {indexedTime:.3f} s from the indices, and "
+            f"{scannedTime:.3f} s by walking the tree.",
+        )
+
+
+class TestNeighborTable(unittest.TestCase):
+    """Tests that the neighbors found from the neighbor table of the core match computing them per call."""
+
+    def setUp(self):
+        self.o, r = loadTestReactor()
+        self.core = r.core
+
+    def _findNeighborsByScan(self, a, showBlanks, duplicate):
+        """The neighbors of an assembly, computed from the grid on each call."""
+        grid = self.core.spatialGrid
+        neighbors = []
+        for ijk in grid.getNeighboringCellIndices(*a.spatialLocator.getCompleteIndices()):
+            neighbor = self.core.childrenByLocator.get(grid[ijk])
+            if neighbor is None and showBlanks and duplicate and grid.symmetry.domain == geometry.DomainType.THIRD_CORE:
+                equivalents = grid.getSymmetricEquivalents(ijk)
+                duplicates = [self.core.childrenByLocator.get(grid[i, j, 0]) for i, j in equivalents]
+                duplicates = [d for d in duplicates if d is not None]
+                neighbor = duplicates[0] if duplicates else None
+            if neighbor is not None or showBlanks:
+                neighbors.append(neighbor)
+        return neighbors
+
+    def assertTableMatchesScan(self):
+        for a in self.core:
+            for showBlanks, duplicate in itertools.product([True, False], repeat=2):
+                neighbors = self.core.findNeighbors(a, showBlanks, duplicate)
+                expected = self._findNeighborsByScan(a, showBlanks, duplicate)
+                self.assertEqual(len(neighbors), len(expected))
+                for actual, neighbor in zip(neighbors, expected):
+                    self.assertIs(actual, neighbor)
+
+    def test_tableMatchesScan(self):
+        self.assertEqual(self.core.symmetry.domain, geometry.DomainType.THIRD_CORE)
+        self.assertTableMatchesScan()
+
+    def test_neighborParams(self):
+        for ii, a in enumerate(self.core):
+            a.p.chargeTime = float(ii)
+
+        for duplicate in (False, True):
+            totals = self.core.calcNeighborParamTotals("chargeTime", duplicate)
+            averages = self.core.calcNeighborParamAverages("chargeTime", duplicate)
+            self.assertEqual(len(totals), len(self.core))
+            for ii, a in enumerate(self.core):
+                # duplicates only fill the blanks that findNeighbors shows
+                neighbors = [n for n in self.core.findNeighbors(a, True, duplicate) if n is not None]
+                if not duplicate:
+                    self.assertEqual(neighbors, self.core.findNeighbors(a, False))
+                values = [n.p.chargeTime for n in neighbors]
+                self.assertAlmostEqual(totals[ii], sum(values))
+                self.assertAlmostEqual(averages[ii], sum(values) / len(values))
+
+    def test_tableFollowsChanges(self):
+        self.assertTableMatchesScan()
+
+        # growing to full core changes the symmetry, and adds assemblies
+        self.core.growToFullCore(self.o.cs)
+        self.assertEqual(self.core.symmetry.domain, geometry.DomainType.FULL_CORE)
+        self.assertTableMatchesScan()
+
+        # moving an assembly to a location that was empty
+        a = self.core.getAssemblies()[-1]
+        a.moveTo(self.core.spatialGrid.getLocatorFromRingAndPos(self.core.getNumRings() + 1, 1))
+        self.assertTableMatchesScan()
+
+        # removing an assembly
+        self.core.removeAssembly(self.core.getAssemblies()[-2], discharge=False)
+        self.assertTableMatchesScan()
@@ -19,7 +19,11 @@ import unittest
 from glob import glob
 from shutil import copyfile
 
+import numpy as np
+from numpy.testing import assert_allclose
+
 from armi.reactor import parameters
+from armi.reactor.parameters import parameterSync
 from armi.reactor.reactorParameters import makeParametersReadOnly
 from armi.testing import TESTING_ROOT, loadTestReactor
 from armi.utils.directoryChangers import TemporaryDirectoryChanger
@@ -103,7 +107,7 @@ class TestParameter(unittest.TestCase):
         """
         Test the ability to add a serializer to a parameter instantiation line. It assumes that if this parameter is not
         None, that the pack and unpack methods will be called during storage to and reading from the database. See
-        database._writeParams for an example use of this functionality.
+        database._packParams for an example use of this functionality.
 
         .. test:: Custom parameter serializer
             :id: T_ARMI_PARAM_SERIALIZE
@@ -506,6 +510,215 @@ class TestParameter(unittest.TestCase):
             pcc.whatever = 33
 
 
+class TestColumnarStorage(unittest.TestCase):
+    """Tests for ParameterCollections that keep their scalar values in shared numpy columns."""
+
+    def setUp(self):
+        class MockPC(parameters.ParameterCollection):
+            pDefs = parameters.ParameterDefinitionCollection()
+            with pDefs.createBuilder() as pb:
+                pb.defParam("power", "W", "power", "location", default=0.0)
+                pb.defParam("count", "", "count", "location", default=0)
+                pb.defParam("isOn", "", "a bool", "location", default=False)
+                pb.defParam("label", "", "a string", "location", default="none")
+
+                def setDoubled(self, value):
+                    self._p_doubled = value
+                    self._p_power = value / 2.0
+
+                pb.defParam("doubled", "W", "twice the power", "location", default=0.0, setter=setDoubled)
+
+        class MockPCChild(MockPC):
+            pDefs = parameters.ParameterDefinitionCollection()
+            with pDefs.createBuilder() as pb:
+                pb.defParam("extra", "", "extra", "location", default=1.0)
+
+        parameters.enableColumnarStorage(MockPC)
+        self.MockPC = MockPC
+        self.MockPCChild = MockPCChild
+
+    def test_storesScalarsInColumns(self):
+        store = self.MockPC._columnStore
+        self.assertEqual({"_p_power", "_p_count", "_p_isOn", "_p_doubled"}, set(store.fieldNames))
+        self.assertNotIn("_p_label", store)
+
+        pcs = [self.MockPC() for _ in range(200)]
+        self.assertEqual(200, len(store))
+        for i, pc in enumerate(pcs):
+            pc.power = float(i)
+            pc["count"] = i
+
+        self.assertEqual(7.0, pcs[7].power)
+        self.assertIs(type(pcs[7].power), float)
+        self.assertIs(type(pcs[7].count), int)
+        self.assertIs(type(pcs[7].isOn), bool)
+        self.assertEqual("none", pcs[7].label)
+        self.assertNotIn("_p_power", pcs[7].__dict__)
+        self.assertEqual(float(pcs[9].serialNum), float(pcs[9]["serialNum"]))
+
+        # custom setters write through to the columns too
+        pcs[3].doubled = 10.0
+        self.assertEqual(5.0, pcs[3].power)
+
+    def test_overflowValues(self):
+        pc = self.MockPC()
+        pc.power = None
+        self.assertIsNone(pc.power)
+        pc.count = 2.5
+        self.assertEqual(2.5, pc.count)
+        pc.power = np.float32(3.0)
+        self.assertIs(type(pc.power), np.float32)
+        pc.power = 4.0
+        self.assertIs(type(pc.power), float)
+
+        del pc["power"]
+        self.assertNotIn("power", pc)
+        self.assertEqual(0.0, pc.power)  # back to the default
+        pc.power = 1.0
+        self.assertIn("power", pc)
+
+    def test_copyAndState(self):
+        pc = self.MockPC()
+        pc.power = 12.0
+        pc.label = "fuel"
+        pc.isOn = True
+
+        pc2 = copy.deepcopy(pc)
+        self.assertNotEqual(pc._row, pc2._row)
+        self.assertEqual(12.0, pc2.power)
+        self.assertEqual("fuel", pc2.label)
+        self.assertTrue(pc2.isOn)
+        pc2.power = 1.0
+        self.assertEqual(12.0, pc.power)
+
+        pc3 = self.MockPC()
+        pc3.__setstate__(pc.__getstate__())
+        self.assertEqual(12.0, pc3.power)
+
+    def test_rowsAreReused(self):
+        store = self.MockPC._columnStore
+        pc = self.MockPC()
+        pc.power = 99.0
+        row = pc._row
+        numRows = len(store)
+        del pc
+        self.assertEqual(numRows - 1, len(store))
+        pc = self.MockPC()
+        self.assertEqual(row, pc._row)
+        self.assertEqual(0.0, pc.power)
+
+    def test_subclassesGetOwnColumns(self):
+        self.assertIsNot(self.MockPC._columnStore, self.MockPCChild._columnStore)
+        child = self.MockPCChild()
+        child.power = 3.0
+        child.extra = 4.0
+        self.assertEqual(3.0, child.power)
+        self.assertIn("_p_power", self.MockPCChild._columnStore)
+        self.assertIn("_p_extra", self.MockPCChild._columnStore)
+
+    def test_getColumnValues(self):
+        pcs = [self.MockPC() for _ in range(10)]
+        for i, pc in enumerate(pcs):
+            pc.power = i * 2.0
+
+        assert_allclose(np.arange(10) * 2.0, parameters.getColumnValues(pcs, "power"))
+        self.assertIsNone(parameters.getColumnValues(pcs, "label"))
+        self.assertIsNone(parameters.getColumnValues([], "power"))
+        self.assertIsNone(parameters.getColumnValues(pcs + [self.MockPCChild()], "power"))
+
+        pcs[4].power = None
+        self.assertIsNone(parameters.getColumnValues(pcs, "power"))
+
+    def test_cannotEnableAfterInstantiation(self):
+        class MockPC(parameters.ParameterCollection):
+            pDefs = parameters.ParameterDefinitionCollection()
+            with pDefs.createBuilder() as pb:
+                pb.defParam("power", "W", "power", "location", default=0.0)
+
+        _pc = MockPC()
+        with self.assertRaises(RuntimeError):
+            parameters.enableColumnarStorage(MockPC)
+
+
+class MockComm:
+    """Stand-in for an MPI communicator where every "rank" contributes exactly the same data."""
+
+    def __init__(self, size):
+        self.size = size
+
+    def allgather(self, obj):
+        return [obj] * self.size
+
+    def Allgatherv(self, sendBuf, recv):
+        recvBuf, counts, displacements = recv
+        for count, start in zip(counts, displacements):
+            recvBuf[start : start + count] = sendBuf
+
+
+class TestParameterSync(unittest.TestCase):
+    """Tests for the binary format used to synchronize parameters over MPI."""
+
+    def setUp(self):
+        class MockPC(parameters.ParameterCollection):
+            pDefs = parameters.ParameterDefinitionCollection()
+            with pDefs.createBuilder() as pb:
+                pb.defParam("power", "W", "power", "location", default=0.0)
+                pb.defParam("count", "", "count", "location", default=0)
+                pb.defParam("isOn", "", "a bool", "location", default=False)
+                pb.defParam("label", "", "a string", "location", default="none")
+                pb.defParam("flux", "", "an array", "location", default=None)
+
+        self.pcs = [MockPC() for _ in range(6)]
+        for pc in self.pcs:
+            pc.assigned &= ~parameters.SINCE_LAST_DISTRIBUTE_STATE
+        MockPC.pDefs.resetAssignmentFlag(parameters.SINCE_LAST_DISTRIBUTE_STATE)
+
+        self.pcs[1].power = 1.5e13
+        self.pcs[1].count = 2**40
+        self.pcs[2].isOn = True
+        self.pcs[2].label = "fuel"
+        self.pcs[4].flux = np.array([1.0, 2.0])
+        self.pcs[4].count = 2**70
+        self.pcs[5].power = np.float64(-0.1)
+
+    def test_packRoundTrip(self):
+        # every changed collection reports every parameter that was changed anywhere: power, count, isOn on 4 objects
+        # are packed, except for the count too big for an int64
+        packet = parameterSync.packSyncData(self.pcs)
+        self.assertEqual(11, len(packet.records))
+        self.assertEqual(9, len(packet.pickled))
+
+        buffer, numRecordBytes = packet.toBytes()
+        self.assertEqual(11 * parameterSync.SYNC_RECORD_DTYPE.itemsize, numRecordBytes)
+        syncData = parameterSync.SyncPacket.fromBytes(len(self.pcs), buffer, numRecordBytes).unpack()
+        expected = [pc.getSyncData() for pc in self.pcs]
+
+        self.assertEqual(len(expected), len(syncData))
+        for ref, data in zip(expected, syncData):
+            if not ref:
+                self.assertIsNone(data)
+                continue
+            self.assertEqual(set(ref), set(data))
+            for name, value in ref.items():
+                if isinstance(value, np.ndarray):
+                    assert_allclose(value, data[name])
+                else:
+                    self.assertEqual(value, data[name])
+                    self.assertEqual(type(value) is bool, type(data[name]) is bool)
+
+    def test_allgatherSyncData(self):
+        allSyncData, bytesPerRank = parameterSync.allgatherSyncData(MockComm(3), self.pcs)
+        self.assertEqual(3, len(allSyncData))
+        self.assertEqual(1, len(set(bytesPerRank)))
+        for rankData in allSyncData:
+            self.assertEqual(1.5e13, rankData[1]["power"])
+            self.assertEqual(2**40, rankData[1]["count"])
+            self.assertIs(True, rankData[2]["isOn"])
+            self.assertEqual("fuel", rankData[2]["label"])
+            self.assertEqual(-0.1, rankData[5]["power"])
+            self.assertIsNone(rankData[0])
+
+
 class ParamCollectionWhere(unittest.TestCase):
     """Tests for ParameterCollection.where."""
 
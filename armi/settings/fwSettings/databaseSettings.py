@@ -14,6 +14,8 @@
 
 """Settings related to the ARMI database."""
 
+import voluptuous as vol
+
 from armi.settings import setting
 
 CONF_DB = "db"
@@ -21,6 +23,15 @@ CONF_RELOAD_DB_NAME = "reloadDBName"
 CONF_LOAD_FROM_DB_EVERY_NODE = "loadFromDBEveryNode"
 CONF_SYNC_AFTER_WRITE = "syncDbAfterWrite"
 CONF_FORCE_DB_PARAMS = "forceDbParams"
+CONF_DB_COMPRESSION = "dbCompression"
+CONF_DB_COMPRESSION_LEVEL = "dbCompressionLevel"
+CONF_DB_SHUFFLE = "dbShuffle"
+CONF_DB_CHUNK_ROWS = "dbChunkRows"
+CONF_DB_AUTO_COMPRESS_MIN_BYTES = "dbAutoCompressMinBytes"
+CONF_DB_STORAGE_OVERRIDES = "dbStorageOverrides"
+CONF_DB_BACKGROUND_WRITE = "dbBackgroundWrite"
+CONF_DB_WRITE_QUEUE_SIZE = "dbWriteQueueSize"
+CONF_DB_HISTORY_INDEX = "dbHistoryIndex"
 
 
 def defineSettings():
@@ -63,5 +74,85 @@ def defineSettings():
                 "status. This is only honored if the DatabaseInterface is used."
             ),
         ),
+        setting.Setting(
+            CONF_DB_COMPRESSION,
+            default="gzip",
+            label="Database Compression",
+            description=(
+                "Compression filter applied to parameter datasets in the database. The `auto` option writes small "
+                "datasets uncompressed and gzips the larger ones."
+            ),
+            options=["gzip", "lzf", "none", "auto"],
+        ),
+        setting.Setting(
+            CONF_DB_COMPRESSION_LEVEL,
+            default=4,
+            label="Database gzip Level",
+            description="gzip compression level (0-9) for database parameter datasets.",
+            schema=vol.All(vol.Coerce(int), vol.Range(min=0, max=9)),
+        ),
+        setting.Setting(
+            CONF_DB_SHUFFLE,
+            default=False,
+            label="Database Shuffle Filter",
+            description="Apply the HDF5 byte-shuffle filter ahead of compression, which often improves ratios on "
+            "floating point data.",
+        ),
+        setting.Setting(
+            CONF_DB_CHUNK_ROWS,
+            default=0,
+            label="Database Chunk Rows",
+            description=(
+                "Number of objects per HDF5 chunk along the object axis of each parameter dataset. Zero lets "
+                "h5py pick the chunk shape."
+            ),
+            schema=vol.All(vol.Coerce(int), vol.Range(min=0)),
+        ),
+        setting.Setting(
+            CONF_DB_AUTO_COMPRESS_MIN_BYTES,
+            default=16384,
+            label="Database Auto-Compression Threshold",
+            description="Size in bytes below which datasets are not compressed when the database compression is "
+            "`auto`.",
+            schema=vol.All(vol.Coerce(int), vol.Range(min=0)),
+        ),
+        setting.Setting(
+            CONF_DB_STORAGE_OVERRIDES,
+            default={},
+            label="Database Storage Overrides",
+            description=(
+                "Per-parameter or per-category changes to the database storage settings, keyed on parameter name "
+                "or category, e.g. {pinQuantities: {compression: lzf, shuffle: true}}. Allowed keys are "
+                "compression, level, shuffle, chunkRows and autoMinBytes."
+            ),
+        ),
+        setting.Setting(
+            CONF_DB_BACKGROUND_WRITE,
+            default=False,
+            label="Background Database Writes",
+            description=(
+                "Copy the reactor state at each time node and write it to the database on a background thread, so "
+                "the run can continue while the database is written."
+            ),
+        ),
+        setting.Setting(
+            CONF_DB_WRITE_QUEUE_SIZE,
+            default=1,
+            label="Background Database Write Queue Size",
+            description=(
+                "Maximum number of time nodes waiting to be written by the background database writer. The run "
+                "waits when the queue is full."
+            ),
+            schema=vol.All(vol.Coerce(int), vol.Range(min=1)),
+        ),
+        setting.Setting(
+            CONF_DB_HISTORY_INDEX,
+            default=False,
+            label="Write Database History Index",
+            description=(
+                "At the end of the run, write an index of the parameter history of every object into the database, "
+                "which makes later history queries on the database much faster."
+            ),
+        ),
     ]
     return settings
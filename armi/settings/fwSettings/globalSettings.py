@@ -66,6 +66,7 @@ CONF_EXPLICIT_REPEAT_SHUFFLES = "explicitRepeatShuffles"
 CONF_FLUX_RECON = "fluxRecon"  # strange coupling in fuel handlers
 CONF_FRESH_FEED_TYPE = "freshFeedType"
 CONF_GROW_TO_FULL_CORE_AFTER_LOAD = "growToFullCoreAfterLoad"
+CONF_INCREMENTAL_DISTRIBUTE = "incrementalDistributeState"
 CONF_INDEPENDENT_VARIABLES = "independentVariables"
 CONF_INITIALIZE_BURN_CHAIN = "initializeBurnChain"
 CONF_INPUT_HEIGHTS_HOT = "inputHeightsConsideredHot"
@@ -107,6 +108,8 @@ CONF_UNIFORM_MESH_MINIMUM_SIZE = "uniformMeshMinimumSize"
 CONF_USER_PLUGINS = "userPlugins"
 CONF_VERBOSITY = "verbosity"
 CONF_VERSIONS = "versions"
+CONF_XS_LIBRARY_CACHE_LOCATION = "xsLibraryCacheLocation"
+CONF_XS_LIBRARY_CACHE_MAX_SIZE = "xsLibraryCacheMaxSize"
 CONF_ZONE_DEFINITIONS = "zoneDefinitions"
 CONF_ZONES_FILE = "zonesFile"
 
@@ -155,6 +158,14 @@ def defineSettings() -> List[setting.Setting]:
             schema=vol.All(vol.Coerce(int), vol.Range(min=1)),
             oldNames=[("numProcessors", None)],
         ),
+        setting.Setting(
+            CONF_INCREMENTAL_DISTRIBUTE,
+            default=False,
+            label="Incremental Distribute State",
+            description="When distributing state over MPI, only send the reactor changes made since the last "
+            "distribute (moved or new assemblies, and changed parameters) instead of the whole reactor. Falls back "
+            "to sending the whole reactor if the workers' reactors cannot be reconciled with the primary.",
+        ),
         setting.Setting(
             CONF_INITIALIZE_BURN_CHAIN,
             default=True,
@@ -788,6 +799,22 @@ def defineSettings() -> List[setting.Setting]:
             "string will not cache.",
             isEnvironment=True,
         ),
+        setting.Setting(
+            CONF_XS_LIBRARY_CACHE_LOCATION,
+            default="",
+            label="Location of Cross Section Library Cache",
+            description="Location where parsed cross section libraries are stored and loaded from when a library "
+            "file with exactly the same contents is read again. Empty string will not cache.",
+            isEnvironment=True,
+        ),
+        setting.Setting(
+            CONF_XS_LIBRARY_CACHE_MAX_SIZE,
+            default=1024.0,
+            label="Maximum Size of Cross Section Library Cache",
+            description=f"The maximum total size in MB of the libraries stored in {CONF_XS_LIBRARY_CACHE_LOCATION}. "
+            "The least recently used libraries are deleted first.",
+            schema=vol.All(vol.Coerce(float), vol.Range(min=0, min_included=False)),
+        ),
         setting.Setting(
             CONF_MATERIAL_NAMESPACE_ORDER,
             default=[],
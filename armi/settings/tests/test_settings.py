@@ -94,6 +94,7 @@ class TestSettings(unittest.TestCase):
             "moduleVerbosity",
             "verbosity",
             "outputCacheLocation",
+            "xsLibraryCacheLocation",
         ]
         self.assertEqual(self.cs.environmentSettings, envSettings)
 
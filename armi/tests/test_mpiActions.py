@@ -13,6 +13,7 @@
 # limitations under the License.
 """Tests for MPI actions."""
 
+import pickle
 import unittest
 from collections import defaultdict
 from unittest.mock import patch
@@ -23,11 +24,17 @@ from armi.mpiActions import (
     DistributionAction,
     MpiAction,
     _disableForExclusiveTasks,
+    _getReactorLayout,
+    _getReplaceableState,
+    _layoutDigest,
     _makeQueue,
+    _ReactorDelta,
     runActions,
     runBatchedActions,
 )
-from armi.testing import TESTING_ROOT, loadTestReactor, mockRunLogs
+from armi.nuclearDataIO import xsLibraries
+from armi.reactor.flags import Flags
+from armi.testing import TESTING_ROOT, loadTestReactor, mockRunLogs, reduceTestReactorRings
 from armi.utils import iterables
 
 
@@ -303,3 +310,106 @@ class TestQueueActions(unittest.TestCase):
                 self.assertFalse(action.runActionExclusive)
             self.assertGreaterEqual(action.priority, lastPriority)
             lastPriority = action.priority
+
+
+class TestReactorDelta(unittest.TestCase):
+    """Tests for the changes sent by an incremental DistributeStateAction."""
+
+    def setUp(self):
+        self.o, self.r = loadTestReactor()
+        reduceTestReactorRings(self.r, self.o.cs, 3)
+        self.r._markSynchronized()
+        self.layout = _getReactorLayout(self.r)
+        self.state = _getReplaceableState(self.r)
+        # stand-in for the copy of the reactor a worker receives from a full distribute
+        self.workerR = pickle.loads(pickle.dumps(self.r))
+
+    def test_noChanges(self):
+        delta = _ReactorDelta.fromReactor(self.r, self.layout, self.state)
+        self.assertEqual(delta.baseDigest, delta.newDigest)
+        self.assertFalse(delta.removed or delta.moved or delta.added)
+        self.assertTrue(delta.canApplyTo(self.workerR))
+
+    def test_shuffleAndParams(self):
+        core = self.r.core
+        fuel = core.getAssemblies(Flags.FUEL)
+        a1, a2, a3 = fuel[0], fuel[1], fuel[-1]
+        loc1, loc2 = a1.spatialLocator, a2.spatialLocator
+        core.removeAssembly(a3, discharge=True, addToSFP=True)
+        a1.moveTo(loc2)
+        a2.moveTo(loc1)
+        b = a1.getFirstBlock(Flags.FUEL)
+        b.p.power = 123.0
+        self.r.p.cycle = 2
+
+        delta = _ReactorDelta.fromReactor(self.r, self.layout, self.state)
+        self.assertEqual({a1.name, a2.name, a3.name}, {name for name, _, _ in delta.moved})
+        self.assertFalse(delta.removed or delta.added)
+        self.assertTrue(delta.canApplyTo(self.workerR))
+
+        delta.applyTo(self.workerR)
+        self.assertEqual(delta.newDigest, _layoutDigest(_getReactorLayout(self.workerR)))
+        workerA1 = self.workerR.core.getAssemblyByName(a1.name)
+        self.assertEqual(tuple(loc2.indices), tuple(workerA1.spatialLocator.indices))
+        self.assertEqual(123.0, workerA1.getFirstBlock(Flags.FUEL).p.power)
+        self.assertEqual(2, self.workerR.p.cycle)
+        self.assertIsNotNone(self.workerR.excore.sfp.getAssembly(a3.name))
+
+    def test_newAndRemovedAssemblies(self):
+        core = self.r.core
+        old = core.getAssemblies(Flags.FUEL)[-1]
+        loc = old.spatialLocator
+        core.removeAssembly(old, discharge=False)
+        new = self.r.blueprints.constructAssem(self.o.cs, name=old.getType())
+        core.add(new, loc)
+
+        delta = _ReactorDelta.fromReactor(self.r, self.layout, self.state)
+        self.assertEqual([old.name], delta.removed)
+        self.assertEqual([new.name], [obj.name for _, _, obj in delta.added])
+
+        delta = pickle.loads(pickle.dumps(delta))
+        delta.applyTo(self.workerR)
+        self.assertEqual(delta.newDigest, _layoutDigest(_getReactorLayout(self.workerR)))
+        workerNames = {a.name for a in self.workerR.core}
+        self.assertNotIn(old.name, workerNames)
+        self.assertIn(new.name, workerNames)
+
+    def test_libraryChanges(self):
+        """A library set on the primary between incremental distributes replaces the one on the worker."""
+        workerLibs = []
+        for _ in range(2):
+            self.r.core.lib = xsLibraries.IsotxsLibrary()
+            delta = _ReactorDelta.fromReactor(self.r, self.layout, self.state)
+            self.assertTrue(delta.libChanged)
+
+            delta = pickle.loads(pickle.dumps(delta))
+            delta.applyTo(self.workerR)
+            self.assertIsInstance(self.workerR.core._lib, xsLibraries.IsotxsLibrary)
+            workerLibs.append(self.workerR.core._lib)
+
+            # the next distribute starts from this one
+            self.layout = _getReactorLayout(self.r)
+            self.state = _getReplaceableState(self.r)
+            self.assertFalse(_ReactorDelta.fromReactor(self.r, self.layout, self.state).libChanged)
+
+        self.assertIsNot(workerLibs[0], workerLibs[1])
+
+    def test_replacedBlockState(self):
+        """An assembly whose blocks have new macroscopic cross sections is sent again."""
+        a = self.r.core.getAssemblies()[0]
+        a[0].macros = {"fission": 1.0}
+        delta = _ReactorDelta.fromReactor(self.r, self.layout, self.state)
+        self.assertFalse(delta.libChanged)
+        self.assertEqual([a.name], delta.removed)
+        self.assertEqual([a.name], [obj.name for _, _, obj in delta.added])
+
+        delta = pickle.loads(pickle.dumps(delta))
+        delta.applyTo(self.workerR)
+        self.assertEqual(delta.newDigest, _layoutDigest(_getReactorLayout(self.workerR)))
+        self.assertEqual(self.workerR.core.getAssemblyByName(a.name)[0].macros, {"fission": 1.0})
+
+    def test_workerWithLocalChanges(self):
+        delta = _ReactorDelta.fromReactor(self.r, self.layout, self.state)
+        self.workerR.core.getFirstBlock().p.power = 1.0
+        self.assertFalse(delta.canApplyTo(self.workerR))
+        self.assertFalse(delta.canApplyTo(None))
@@ -121,12 +121,10 @@ def plotBlockDepthMap(
 
     # block mid point elevation
     elevations = [elev for _b, elev in fuelAssem.getBlocksAndZ()]
+    blocksByAssem = [a.getBlocksAtElevations(elevations) for a in core]
     data = []
-    for elevation in elevations:
-        paramValsAtElevation = []
-        for a in core:
-            paramValsAtElevation.append(a.getBlockAtElevation(elevation).p[param])
-        data.append(paramValsAtElevation)
+    for i in range(len(elevations)):
+        data.append([assemBlocks[i].p[param] for assemBlocks in blocksByAssem])
 
     data = np.array(data)
 